@@ -0,0 +1,328 @@
+"""Autopilot tiger: search anytime di atas aturan GameEngine.
+
+Autopilot.choose(engine) memilih arah tiger setiap kali tiger siap
+bergerak. Search memakai iterative deepening: satu langkah search adalah
+satu segmen jalan (tiger memilih arah lalu mengikuti koridor sampai
+persimpangan berikutnya, paling jauh SEGMENT_CELLS sel) yang disimulasikan
+dengan GameEngine.simulate() dan dikembalikan dengan snapshot()/restore().
+Segmen juga berhenti di tengah koridor jika ada musuh dekat, agar search
+bisa memilih balik arah tepat saat dibutuhkan.
+Search berhenti saat budget waktu (detik) atau max_nodes habis, dan
+memakai hasil kedalaman terakhir yang selesai.
+
+Budget waktu membuat hasil bergantung kecepatan CPU; max_nodes tanpa
+budget memberi hasil deterministik (dipakai turnamen headless).
+
+Field jarak ke makanan terdekat juga dihitung di dalam budget: saat
+pellet dimakan hanya sel di sekitar pellet itu yang dihitung ulang, dan
+pekerjaan field (termasuk BFS penuh di maze baru) dicicil per potongan
+FIELD_SLICE sel lintas keputusan.
+"""
+from heapq import heapify, heappop, heappush
+from time import perf_counter
+
+AUTOPILOT_BUDGET = 0.004 # Detik per keputusan di GameWidget (tick 50 ms)
+MAX_DEPTH = 16
+SEGMENT_CELLS = 6 # Panjang maksimum satu segmen search (sel)
+THREAT_DISTANCE = 3 # Segmen juga berhenti jika musuh berbahaya sedekat ini (Manhattan)
+DEATH_PENALTY = 10000
+CLEAR_BONUS = 5000
+FOOD_WEIGHT = 2 # Penalti per langkah dari ujung cabang ke makanan terdekat
+FIELD_SLICE = 256 # Sel field makanan per potongan sebelum cek deadline
+FIELD_SHARE = 0.5 # Bagian budget keputusan yang boleh dipakai field makanan
+TICK_COST_DECAY = 0.1 # Bobot sampel baru di rata-rata biaya satu simulate()
+
+# Hasil segmen
+SEG_OPEN = 0
+SEG_DIED = 1
+SEG_CLEARED = 2
+
+
+class SearchTimeout(Exception):
+    """Budget search habis di tengah iterasi."""
+
+
+def bit_cells(mask):
+    """Index bit yang menyala di mask (untuk mask dengan sedikit bit)."""
+    cells = []
+    while mask:
+        low = mask & -mask
+        cells.append(low.bit_length() - 1)
+        mask ^= low
+    return cells
+
+
+def fill_food_distances(nav, pellets, dist):
+    """Isi dist dengan jarak BFS ke makanan/power terdekat (-1 = tak terjangkau).
+
+    Generator: yield setiap FIELD_SLICE sel agar pemanggil bisa berhenti
+    di deadline dan melanjutkan di keputusan berikutnya.
+    """
+    dist[:] = [-1] * len(nav.neighbors)
+    frontier = []
+    bits = format(pellets, 'b')[::-1]
+    is_open = nav.is_open
+    cell = bits.find('1')
+    while cell >= 0:
+        if is_open[cell]:
+            dist[cell] = 0
+            frontier.append(cell)
+            if len(frontier) % FIELD_SLICE == 0:
+                yield
+        cell = bits.find('1', cell + 1)
+    for n, cell in enumerate(frontier):
+        if n % FIELD_SLICE == 0:
+            yield
+        d = dist[cell] + 1
+        for _, j in nav.neighbors[cell]:
+            if dist[j] < 0:
+                dist[j] = d
+                frontier.append(j)
+
+
+def drop_food_distances(nav, dist, eaten):
+    """Perbarui dist setelah pellet di sel eaten dimakan, hanya di sekitarnya.
+
+    Sel yang semua jalur terpendeknya berasal dari pellet yang dimakan
+    dicari dengan BFS naik satu jarak per langkah, lalu jaraknya dihitung
+    ulang dari tepi area itu (Dijkstra kecil). Biayanya sebanding dengan
+    area milik pellet tersebut, bukan luas maze. Generator seperti
+    fill_food_distances().
+    """
+    neighbors = nav.neighbors
+    affected = set(eaten)
+    order = list(eaten)
+    for n, cell in enumerate(order):
+        if n % FIELD_SLICE == 0:
+            yield
+        d = dist[cell] + 1
+        for _, j in neighbors[cell]:
+            if dist[j] == d and j not in affected and all(
+                    dist[k] != d - 1 or k in affected for _, k in neighbors[j]):
+                affected.add(j)
+                order.append(j)
+    for cell in order:
+        dist[cell] = -1
+    heap = []
+    for n, cell in enumerate(order):
+        if n % FIELD_SLICE == 0:
+            yield
+        best = min((dist[k] for _, k in neighbors[cell] if dist[k] >= 0 and k not in affected),
+                   default=-1)
+        if best >= 0:
+            heap.append((best + 1, cell))
+    heapify(heap)
+    n = 0
+    while heap:
+        d, cell = heappop(heap)
+        if dist[cell] >= 0:
+            continue
+        dist[cell] = d
+        n += 1
+        if n % FIELD_SLICE == 0:
+            yield
+        for _, j in neighbors[cell]:
+            if dist[j] < 0 and j in affected:
+                heappush(heap, (d + 1, j))
+
+
+class Autopilot:
+    """Pemilih arah tiger dengan iterative deepening dan budget keras."""
+
+    def __init__(self, budget=AUTOPILOT_BUDGET, max_nodes=None, max_depth=MAX_DEPTH):
+        self.budget = budget # Detik per keputusan, None = tanpa batas waktu
+        self.max_nodes = max_nodes # Segmen per keputusan, None = tanpa batas
+        self.max_depth = max_depth
+        self.food_maze = None
+        self.food_mask = 0 # Pellet yang sudah tercermin di food_dist (atau sedang diproses)
+        self.food_dist = []
+        self.food_job = None # Generator field yang belum selesai
+        self.food_pending = 0 # Pellet dimakan selama food_job berjalan
+        self.tick_cost = 0.0 # Rata-rata detik per simulate(), untuk batas deadline
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.searches = 0
+        self.total_nodes = 0
+        self.total_ticks = 0
+        self.total_time = 0.0
+        self.depth_sum = 0
+        self.deepest = 0
+        self.timeouts = 0
+        self.last = {"nodes": 0, "depth": 0, "elapsed_ms": 0.0}
+
+    def stats(self):
+        """Statistik search: node/detik, kedalaman rata-rata dan maksimum."""
+        searches = max(1, self.searches)
+        return {
+            "searches": self.searches,
+            "nodes": self.total_nodes,
+            "ticks_simulated": self.total_ticks,
+            "nodes_per_sec": self.total_nodes / self.total_time if self.total_time > 0 else 0.0,
+            "mean_depth": self.depth_sum / searches,
+            "max_depth": self.deepest,
+            "mean_ms": self.total_time * 1000 / searches,
+            "timeouts": self.timeouts,
+            "last": dict(self.last),
+        }
+
+    def choose(self, engine):
+        """Arah (0-3) untuk tick berikutnya, atau None jika tidak perlu diganti.
+
+        Search hanya berjalan saat tiger akan bergerak di tick berikutnya;
+        state engine dikembalikan persis seperti semula.
+        """
+        if engine.game_over or engine.move_cooldown > 0:
+            return None
+        nav = engine.nav
+        here = nav.index(engine.tiger.x, engine.tiger.y)
+        moves = [d for d, _ in nav.neighbors[here]]
+        if not moves:
+            return None
+        current = engine.next_move
+        if current in moves:
+            # Arah sekarang dicoba pertama; dipakai juga jika search tidak selesai
+            moves.remove(current)
+            moves.insert(0, current)
+        if len(moves) == 1:
+            return moves[0]
+
+        start = perf_counter()
+        self.deadline = None if self.budget is None else start + self.budget
+        self.nodes = 0
+        self.ticks = 0
+        self.food_ready = self.refresh_food(engine.maze, nav, start)
+
+        root = engine.snapshot()
+        self.base_score = engine.score
+        best = moves[0]
+        depth = 0
+        try:
+            for limit in range(1, self.max_depth + 1):
+                value, move = self.search_root(engine, moves, limit)
+                best = move
+                depth = limit
+                # Urutan iterasi berikutnya: langkah terbaik dulu
+                moves.remove(move)
+                moves.insert(0, move)
+                if value <= -DEATH_PENALTY + self.max_depth or value >= CLEAR_BONUS:
+                    break # Semua cabang mati, atau level pasti selesai
+        except SearchTimeout:
+            self.timeouts += 1
+        finally:
+            engine.restore(root)
+
+        elapsed = perf_counter() - start
+        self.searches += 1
+        self.total_nodes += self.nodes
+        self.total_ticks += self.ticks
+        self.total_time += elapsed
+        self.depth_sum += depth
+        self.deepest = max(self.deepest, depth)
+        self.last = {"nodes": self.nodes, "depth": depth, "elapsed_ms": elapsed * 1000}
+        return best
+
+    def refresh_food(self, maze, nav, start):
+        """Majukan field jarak makanan; True jika food_dist sesuai maze sekarang.
+
+        Pekerjaan field berhenti setelah FIELD_SHARE budget, sisanya untuk
+        search, dan dilanjutkan di keputusan berikutnya.
+        """
+        pellets = maze.food | maze.power
+        if maze is not self.food_maze or pellets & ~self.food_mask:
+            # Maze baru (level baru atau game baru): bangun ulang seluruh field
+            self.food_maze = maze
+            self.food_mask = pellets
+            self.food_pending = 0
+            self.food_job = fill_food_distances(nav, pellets, self.food_dist)
+        elif pellets != self.food_mask:
+            self.food_pending |= self.food_mask & ~pellets
+            self.food_mask = pellets
+        limit = None if self.budget is None else start + self.budget * FIELD_SHARE
+        while True:
+            if self.food_job is None:
+                if not self.food_pending:
+                    return True
+                self.food_job = drop_food_distances(nav, self.food_dist, bit_cells(self.food_pending))
+                self.food_pending = 0
+            for _ in self.food_job:
+                if limit is not None and perf_counter() > limit:
+                    return False
+            self.food_job = None
+
+    def search_root(self, engine, moves, limit):
+        best_value = None
+        best_move = moves[0]
+        for d in moves:
+            value = self.expand(engine, d, limit, 0)
+            if best_value is None or value > best_value:
+                best_value = value
+                best_move = d
+        return best_value, best_move
+
+    def expand(self, engine, direction, depth, ply):
+        """Nilai terbaik setelah segmen ke arah direction dan depth-1 segmen berikutnya."""
+        snap = engine.snapshot()
+        result, cell = self.advance(engine, direction)
+        if result == SEG_DIED:
+            value = ply - DEATH_PENALTY # Mati lebih lambat sedikit lebih baik
+        elif result == SEG_CLEARED:
+            value = CLEAR_BONUS + engine.score - self.base_score - ply
+        elif depth <= 1:
+            # Field makanan belum selesai: nilai daun hanya dari skor
+            d = self.food_dist[cell] if self.food_ready else 0
+            value = engine.score - self.base_score - FOOD_WEIGHT * max(0, d)
+        else:
+            value = None
+            for d, _ in engine.nav.neighbors[cell]:
+                child = self.expand(engine, d, depth - 1, ply + 1)
+                if value is None or child > value:
+                    value = child
+        engine.restore(snap)
+        return value
+
+    def threatened(self, engine):
+        tx = engine.tiger.x
+        ty = engine.tiger.y
+        for e in engine.enemies:
+            if (not e.scared and not e.returning
+                    and abs(e.x - tx) + abs(e.y - ty) <= THREAT_DISTANCE):
+                return True
+        return False
+
+    def advance(self, engine, direction):
+        """Jalankan satu segmen; kembalikan (hasil SEG_*, sel akhir tiger)."""
+        self.nodes += 1
+        if self.max_nodes is not None and self.nodes > self.max_nodes:
+            raise SearchTimeout()
+        nav = engine.nav
+        tiger = engine.tiger
+        lives = engine.lives
+        deadline = self.deadline
+        cell = nav.index(tiger.x, tiger.y)
+        steps = 0
+        while True:
+            # Berhenti jika satu simulate() lagi diperkirakan melewati deadline
+            now = perf_counter()
+            if deadline is not None and now + self.tick_cost > deadline:
+                raise SearchTimeout()
+            engine.simulate(direction)
+            self.tick_cost += (perf_counter() - now - self.tick_cost) * TICK_COST_DECAY
+            self.ticks += 1
+            if engine.lives < lives or engine.game_over:
+                return SEG_DIED, cell
+            if engine.maze.food_left == 0:
+                return SEG_CLEARED, cell
+            moved = nav.index(tiger.x, tiger.y)
+            if moved == cell:
+                continue
+            cell = moved
+            steps += 1
+            if steps >= SEGMENT_CELLS or self.threatened(engine):
+                return SEG_OPEN, cell
+            # Lanjut hanya di koridor (satu jalan selain balik arah)
+            back = (direction + 2) % 4
+            exits = [d for d, _ in nav.neighbors[cell] if d != back]
+            if len(exits) != 1:
+                return SEG_OPEN, cell
+            direction = exits[0]
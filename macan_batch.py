@@ -0,0 +1,444 @@
+"""Simulasi banyak game Macan Hungry sekaligus dengan NumPy.
+
+BatchEngine menyimpan N game sebagai array dan memajukan semuanya dalam
+satu panggilan step(), dengan aturan yang sama seperti GameEngine.step()
+dan Enemy.choose_direction().
+"""
+import random
+
+import numpy as np
+
+from macan_maze import (MAZE_WIDTH, MAZE_HEIGHT, MAZE_LAYOUT,
+                        WALL, FOOD, EMPTY, POWER, generate_random_maze, nav_table)
+from macan_engine import (DIR_DX, DIR_DY, DIRECTION_PRIORITY, TIGER_SPAWN,
+                          ENEMY_HOME, ENEMY_SPECS)
+
+PERSONALITY_CODES = {'chase': 0, 'ambush': 1, 'random': 2, 'patrol': 3}
+
+# Rentang noise randint(-k, k) per personality (hanya random yang memakai noise)
+PERSONALITY_NOISE = {'chase': 0, 'ambush': 0, 'random': 1, 'patrol': 0}
+
+PRIORITY = np.array(DIRECTION_PRIORITY, dtype=np.int32)
+DX = np.array(DIR_DX, dtype=np.int32)
+DY = np.array(DIR_DY, dtype=np.int32)
+
+CELLS = MAZE_WIDTH * MAZE_HEIGHT
+HOME_CELL = ENEMY_HOME[1] * MAZE_WIDTH + ENEMY_HOME[0]
+
+SLOT_CAPACITY = 32 # Slot matriks jarak yang disiapkan sejak awal (maze unik aktif)
+
+
+def nav_distance_matrix(nav):
+    """Jarak BFS semua pasangan sel dari NavTable (int16, -1 = tak terjangkau)."""
+    size = nav.width * nav.height
+    matrix = np.empty((size, size), dtype=np.int16)
+    for cell in range(size):
+        matrix[:, cell] = nav.distances(cell)
+    return matrix
+
+
+def junction_tables(nav):
+    """Prediksi JunctionGraph per (sel tiger, arah tiger).
+
+    Mengembalikan (junction, guards): junction berikutnya tiger dengan
+    shape (sel, 4), dan jalan keluar junction itu dengan shape (sel, 4, 4)
+    (-1 = kosong), sama seperti yang dipakai ambush dan patrol di
+    Enemy.choose_direction().
+    """
+    size = nav.width * nav.height
+    graph = nav.junctions()
+    junction = np.repeat(np.arange(size, dtype=np.int32)[:, None], 4, axis=1)
+    guards = np.full((size, 4, 4), -1, dtype=np.int32)
+    for cell in range(size):
+        if not nav.is_open[cell]:
+            continue
+        for d in range(4):
+            node, arrive = graph.predict(cell, d)
+            junction[cell, d] = node
+            exits = graph.exits(node, arrive)
+            guards[cell, d, :len(exits)] = exits
+    return junction, guards
+
+
+class BatchEngine:
+    """N game yang berjalan lockstep, disimpan sebagai array NumPy.
+
+    Maze level > 1 diambil dari satu urutan seed per level yang dipakai
+    bersama semua game di batch (seperti stream 'maze' GameEngine untuk
+    satu game), jadi game di level yang sama berbagi maze dan slot jarak.
+    """
+
+    def __init__(self, num_games, seed=None):
+        n = num_games
+        e = len(ENEMY_SPECS)
+        self.num_games = n
+        self.rng = np.random.default_rng(seed)
+        # generate_random_maze butuh API modul random (choice/randint)
+        self.maze_rng = random.Random(seed)
+        self.level_seeds = [] # level_seeds[i] = seed maze level i + 2
+        self.level_mazes = {} # level -> (maze int8, key), dibuat sekali per batch
+
+        self.maze = np.empty((n, MAZE_HEIGHT, MAZE_WIDTH), dtype=np.int8)
+        self.food_left = np.zeros(n, dtype=np.int32)
+
+        self.score = np.zeros(n, dtype=np.int64)
+        self.lives = np.zeros(n, dtype=np.int32)
+        self.level = np.ones(n, dtype=np.int32)
+        self.power_mode = np.zeros(n, dtype=bool)
+        self.power_timer = np.zeros(n, dtype=np.int32)
+        self.game_over = np.zeros(n, dtype=bool)
+
+        self.tiger_x = np.zeros(n, dtype=np.int32)
+        self.tiger_y = np.zeros(n, dtype=np.int32)
+        self.tiger_dir = np.zeros(n, dtype=np.int32)
+        self.next_move = np.full(n, -1, dtype=np.int32) # -1 = None
+        self.move_cooldown = np.zeros(n, dtype=np.int32)
+        self.enemy_move_cooldown = np.zeros(n, dtype=np.int32)
+        self.scatter_timer = np.zeros(n, dtype=np.int32)
+
+        self.enemy_x = np.zeros((n, e), dtype=np.int32)
+        self.enemy_y = np.zeros((n, e), dtype=np.int32)
+        self.enemy_dir = np.zeros((n, e), dtype=np.int32)
+        self.scared = np.zeros((n, e), dtype=bool)
+        self.scatter_mode = np.zeros((n, e), dtype=bool)
+        self.returning = np.zeros((n, e), dtype=bool)
+
+        # Matriks jarak NavTable per maze unik; game dengan tembok yang
+        # sama berbagi satu slot (semua game level 1 memakai slot layout,
+        # game di level lain memakai maze level itu). Kapasitas disiapkan
+        # sekali; np.empty baru memakan memori saat slot benar-benar diisi.
+        slots = min(n + 1, SLOT_CAPACITY)
+        self.maze_slot = np.full(n, -1, dtype=np.int32)
+        self.nav_dist = np.empty((slots, CELLS, CELLS), dtype=np.int16)
+        self.junction = np.empty((slots, CELLS, 4), dtype=np.int32)
+        self.guards = np.empty((slots, CELLS, 4, 4), dtype=np.int32)
+        self.slot_refs = np.zeros(slots, dtype=np.int64)
+        self.slot_keys = [None] * slots
+        self.slot_of_key = {}
+
+        # Data statis per musuh (sama untuk semua game)
+        self.personality = np.array(
+            [PERSONALITY_CODES[p] for _, _, _, p in ENEMY_SPECS], dtype=np.int32)
+        self.noise = np.array(
+            [PERSONALITY_NOISE[p] for _, _, _, p in ENEMY_SPECS], dtype=np.int32)
+        corners = [(1, 1), (MAZE_WIDTH-2, 1), (1, MAZE_HEIGHT-2), (MAZE_WIDTH-2, MAZE_HEIGHT-2)]
+        # Sama dengan Enemy.corner di GameEngine: index ENEMY_SPECS % 4
+        corner_index = [i % 4 for i in range(e)]
+        self.corner_cell = np.array(
+            [corners[i][1] * MAZE_WIDTH + corners[i][0] for i in corner_index], dtype=np.int32)
+        self.spawn_x = np.array([x for x, _, _, _ in ENEMY_SPECS], dtype=np.int32)
+        self.spawn_y = np.array([y for _, y, _, _ in ENEMY_SPECS], dtype=np.int32)
+        self.reset_x = np.array([8 + (i % 3) for i in range(e)], dtype=np.int32)
+
+        self.layout = np.array(MAZE_LAYOUT, dtype=np.int8)
+        self.layout_key = self._maze_key(MAZE_LAYOUT)
+        self.reset()
+
+    def reset(self, mask=None):
+        """Mulai game baru untuk semua game, atau hanya yang ada di mask."""
+        idx = self._indices(mask)
+        self.score[idx] = 0
+        self.lives[idx] = 3
+        self.level[idx] = 1
+        self.power_mode[idx] = False
+        self.power_timer[idx] = 0
+        self.game_over[idx] = False
+        self.init_level(idx)
+
+    def init_level(self, idx):
+        """Sama seperti GameEngine.init_level untuk game di idx."""
+        self._install_levels(idx)
+        self._count_food(idx)
+
+        self.tiger_x[idx], self.tiger_y[idx] = TIGER_SPAWN
+        self.tiger_dir[idx] = 0
+        self.next_move[idx] = -1
+        self.move_cooldown[idx] = 0
+        self.enemy_move_cooldown[idx] = 0
+        self.scatter_timer[idx] = 0
+        self.enemy_x[idx] = self.spawn_x
+        self.enemy_y[idx] = self.spawn_y
+        self.enemy_dir[idx] = 0
+        self.scared[idx] = False
+        self.scatter_mode[idx] = False
+        self.returning[idx] = False
+
+    def reset_level(self, idx):
+        """Sama seperti GameEngine.reset_level untuk game di idx."""
+        self.tiger_x[idx], self.tiger_y[idx] = TIGER_SPAWN
+        self.next_move[idx] = -1
+        self.enemy_x[idx] = self.reset_x
+        self.enemy_y[idx] = 9
+        self.returning[idx] = False
+
+    def _indices(self, mask):
+        if mask is None:
+            return np.arange(self.num_games)
+        mask = np.asarray(mask)
+        if mask.dtype == bool:
+            return np.nonzero(mask)[0]
+        return mask
+
+    def _maze_key(self, maze):
+        return bytes(cell != WALL for row in maze for cell in row)
+
+    def level_maze(self, level):
+        """(maze, key) level ini, sama untuk semua game di batch."""
+        if level == 1:
+            return self.layout, self.layout_key
+        cached = self.level_mazes.get(level)
+        if cached is None:
+            while len(self.level_seeds) < level - 1:
+                self.level_seeds.append(self.maze_rng.getrandbits(64))
+            rows = generate_random_maze(random.Random(self.level_seeds[level - 2]))
+            cached = self.level_mazes[level] = (np.array(rows, dtype=np.int8), self._maze_key(rows))
+        return cached
+
+    def _install_levels(self, idx):
+        """Pasang maze level masing-masing game di idx, satu kali per level."""
+        levels = self.level[idx]
+        for level in np.unique(levels):
+            games = idx[levels == level]
+            maze, key = self.level_maze(int(level))
+            self.maze[games] = maze
+            self._assign_slot(games, maze.tolist(), key)
+
+    def _assign_slot(self, games, maze, key):
+        """Hubungkan games ke slot matriks jarak untuk maze dengan key ini."""
+        if len(games) == 0:
+            return
+        slot = self.slot_of_key.get(key)
+        if slot is None:
+            free = np.nonzero(self.slot_refs == 0)[0]
+            if len(free):
+                slot = int(free[0])
+                old_key = self.slot_keys[slot]
+                if old_key is not None:
+                    del self.slot_of_key[old_key]
+            else:
+                # Lebih dari SLOT_CAPACITY level aktif sekaligus (jarang):
+                # tambah kapasitas dua kali lipat
+                slot = len(self.slot_refs)
+                grow = max(1, slot)
+                self.nav_dist = np.concatenate(
+                    [self.nav_dist, np.empty((grow, CELLS, CELLS), dtype=np.int16)])
+                self.junction = np.concatenate(
+                    [self.junction, np.empty((grow, CELLS, 4), dtype=np.int32)])
+                self.guards = np.concatenate(
+                    [self.guards, np.empty((grow, CELLS, 4, 4), dtype=np.int32)])
+                self.slot_refs = np.concatenate(
+                    [self.slot_refs, np.zeros(grow, dtype=np.int64)])
+                self.slot_keys.extend([None] * grow)
+            nav = nav_table(maze)
+            self.nav_dist[slot] = nav_distance_matrix(nav)
+            self.junction[slot], self.guards[slot] = junction_tables(nav)
+            self.slot_keys[slot] = key
+            self.slot_of_key[key] = slot
+
+        old = self.maze_slot[games]
+        self.slot_refs[slot] += len(games)
+        np.subtract.at(self.slot_refs, old[old >= 0], 1)
+        self.maze_slot[games] = slot
+
+    def _count_food(self, idx):
+        mazes = self.maze[idx]
+        self.food_left[idx] = np.count_nonzero(
+            (mazes == FOOD) | (mazes == POWER), axis=(1, 2))
+
+    def _cells(self, games, x, y):
+        """Nilai maze di (x, y); sel di luar grid dianggap tembok."""
+        inside = (x >= 0) & (x < MAZE_WIDTH) & (y >= 0) & (y < MAZE_HEIGHT)
+        cx = np.clip(x, 0, MAZE_WIDTH - 1)
+        cy = np.clip(y, 0, MAZE_HEIGHT - 1)
+        return np.where(inside, self.maze[games, cy, cx], WALL)
+
+    def step(self, actions=None):
+        """Majukan semua game satu tick.
+
+        actions berisi arah (0-3) per game, atau -1 untuk tetap memakai
+        arah terakhir. Mengembalikan (reward, game_over): selisih skor
+        tick ini dan mask game yang sudah selesai.
+        """
+        alive = ~self.game_over
+        start_score = self.score.copy()
+        if actions is not None:
+            actions = np.asarray(actions)
+            new_move = alive & (actions >= 0)
+            self.next_move[new_move] = actions[new_move]
+
+        # 1. Tiger Movement
+        ready = alive & (self.move_cooldown <= 0)
+        self.move_cooldown[alive & ~ready] -= 1
+        games = np.nonzero(ready & (self.next_move >= 0))[0]
+        if len(games):
+            move = self.next_move[games]
+            nx = self.tiger_x[games] + DX[move]
+            ny = self.tiger_y[games] + DY[move]
+            cell = self._cells(games, nx, ny)
+            moved = cell != WALL
+            games, nx, ny, cell = games[moved], nx[moved], ny[moved], cell[moved]
+            self.tiger_x[games] = nx
+            self.tiger_y[games] = ny
+            self.tiger_dir[games] = move[moved]
+            self.move_cooldown[games] = 2
+
+            # Eat Logic
+            food = cell == FOOD
+            power = cell == POWER
+            eaten = food | power
+            self.maze[games[eaten], ny[eaten], nx[eaten]] = EMPTY
+            self.food_left[games[eaten]] -= 1
+            self.score[games[food]] += 10
+            powered = games[power]
+            if len(powered):
+                self.score[powered] += 50
+                self.power_mode[powered] = True
+                # Leveling: Power bertahan lebih sebentar di level tinggi
+                level_penalty = np.minimum(100, (self.level[powered] - 1) * 10)
+                self.power_timer[powered] = 150 - level_penalty
+                self.scared[powered] = ~self.returning[powered]
+
+        # 2. Power Mode Logic
+        powered = alive & self.power_mode
+        self.power_timer[powered] -= 1
+        expired = powered & (self.power_timer <= 0)
+        self.power_mode[expired] = False
+        self.scared[expired] = False
+
+        # 3. Enemy Movement & Leveling Difficulty
+        base_speed = np.where(self.power_mode, 6, 4)
+        speed_modifier = np.where(self.power_mode, 0,
+                                  np.minimum(2, (self.level - 1) // 3))
+        threshold = np.maximum(2, base_speed - speed_modifier)
+
+        enemy_ready = alive & (self.enemy_move_cooldown <= 0)
+        self.enemy_move_cooldown[alive & ~enemy_ready] -= 1
+        games = np.nonzero(enemy_ready)[0]
+        if len(games):
+            self._move_enemies(games)
+            self.enemy_move_cooldown[games] = threshold[games]
+
+        # 4. Scatter Logic
+        self.scatter_timer[alive] += 1
+        flip = alive & (self.scatter_timer % 200 == 0)
+        self.scatter_mode[flip] = ~self.scatter_mode[flip]
+
+        # 5. Collisions
+        checking = alive.copy()
+        for i in range(self.enemy_x.shape[1]):
+            hit = (checking & ~self.returning[:, i]
+                   & (self.tiger_x == self.enemy_x[:, i])
+                   & (self.tiger_y == self.enemy_y[:, i]))
+            if not hit.any():
+                continue
+            eat = np.nonzero(hit & self.power_mode)[0]
+            self.score[eat] += 200 * self.level[eat]
+            # Send enemy home, teleport jika rumah tidak terjangkau
+            here = self.enemy_y[eat, i] * MAZE_WIDTH + self.enemy_x[eat, i]
+            walk = self.nav_dist[self.maze_slot[eat], here, HOME_CELL] > 0
+            self.returning[eat[walk], i] = True
+            teleport = eat[~walk]
+            self.enemy_x[teleport, i], self.enemy_y[teleport, i] = ENEMY_HOME
+            self.scared[eat, i] = False
+
+            die = hit & ~self.power_mode
+            self.lives[die] -= 1
+            over = die & (self.lives <= 0)
+            self.game_over[over] = True
+            checking &= ~over
+            self.reset_level(np.nonzero(die & ~over)[0])
+
+        # 6. Level Complete
+        cleared = np.nonzero(checking & (self.food_left == 0))[0]
+        if len(cleared):
+            self.level[cleared] += 1
+            self._install_levels(cleared)
+            self._count_food(cleared)
+            self.reset_level(cleared)
+
+        return self.score - start_score, self.game_over.copy()
+
+    def _move_enemies(self, games):
+        """choose_direction untuk semua musuh di game terpilih."""
+        m = len(games)
+        e = self.enemy_x.shape[1]
+        ex = self.enemy_x[games]
+        ey = self.enemy_y[games]
+        tx = self.tiger_x[games][:, None]
+        ty = self.tiger_y[games][:, None]
+        scared = self.scared[games]
+        scatter = self.scatter_mode[games]
+        returning = self.returning[games]
+        slot = self.maze_slot[games][:, None]
+        rows = games[:, None]
+        here = ey * MAZE_WIDTH + ex
+        tiger = ty * MAZE_WIDTH + tx
+
+        noise_x = self.rng.integers(-self.noise, self.noise + 1, size=(m, e))
+        noise_y = self.rng.integers(-self.noise, self.noise + 1, size=(m, e))
+
+        # Ambush: junction berikutnya tiger. Patrol: jalan keluar junction
+        # itu yang terdekat. Setelah sampai, keduanya mengejar tiger.
+        tdir = self.tiger_dir[games][:, None]
+        junction = self.junction[slot, tiger, tdir]
+        guards = self.guards[slot, tiger, tdir]
+        guard_dist = self.nav_dist[slot[..., None], here[..., None], np.maximum(guards, 0)]
+        guard_dist = np.where((guards >= 0) & (guard_dist >= 0), guard_dist, CELLS + 1)
+        nearest = guard_dist.argmin(axis=2)
+        guard = np.take_along_axis(np.broadcast_to(guards, (m, e, 4)), nearest[..., None], axis=2)[..., 0]
+        guard = np.where(guard_dist.min(axis=2) <= CELLS, guard, junction)
+
+        # Target jalur terpendek: rumah, sudut scatter, junction atau tiger
+        target = np.where(self.personality == PERSONALITY_CODES['ambush'], junction, tiger)
+        target = np.where(self.personality == PERSONALITY_CODES['patrol'], guard, target)
+        target = np.where(target == here, tiger, target)
+        target = np.where(scatter, self.corner_cell, target)
+        target = np.where(returning, HOME_CELL, target)
+
+        wander = ~returning & ~scared & ~scatter & (
+            self.personality == PERSONALITY_CODES['random'])
+        flee = ~returning & scared
+
+        # Nilai tiap arah: jarak tetangga ke target (atau dari tiger saat kabur)
+        big = CELLS + 2
+        toward = np.empty((m, e, 4), dtype=np.int32)
+        away = np.empty((m, e, 4), dtype=np.int32)
+        is_open = np.empty((m, e, 4), dtype=bool)
+        for d in range(4):
+            nx = ex + DX[d]
+            ny = ey + DY[d]
+            is_open[..., d] = self._cells(rows, nx, ny) != WALL
+            nbr = np.clip(ny, 0, MAZE_HEIGHT - 1) * MAZE_WIDTH + np.clip(nx, 0, MAZE_WIDTH - 1)
+            d_target = self.nav_dist[slot, nbr, target]
+            d_tiger = self.nav_dist[slot, nbr, tiger]
+            toward[..., d] = np.where(is_open[..., d] & (d_target >= 0), d_target,
+                                      np.where(is_open[..., d], big - 1, big))
+            away[..., d] = np.where(is_open[..., d] & (d_tiger >= 0), d_tiger,
+                                    np.where(is_open[..., d], -2, -3))
+        chosen = np.where(flee, away.argmax(axis=2), toward.argmin(axis=2))
+
+        # random: arah dominan acak, pilih arah terbuka pertama
+        case = np.where(np.abs(noise_x) > np.abs(noise_y),
+                        np.where(noise_x > 0, 0, 1),
+                        np.where(noise_y > 0, 2, 3))
+        priority = PRIORITY[case]
+        greedy = np.full((m, e), -1, dtype=np.int32)
+        for k in range(4):
+            d = priority[..., k]
+            d_open = np.take_along_axis(is_open, d[..., None], axis=2)[..., 0]
+            greedy = np.where((greedy < 0) & d_open, d, greedy)
+        first_open = np.where(is_open.any(axis=2), is_open.argmax(axis=2), -1)
+        greedy = np.where(greedy < 0, first_open, greedy)
+        chosen = np.where(wander, greedy, chosen)
+        chosen = np.where(is_open.any(axis=2), chosen, -1)
+
+        # Slow down scared enemies
+        skip = scared & (self.enemy_move_cooldown[games] % 2 != 0)[:, None]
+        move = (chosen >= 0) & ~skip
+        d = np.where(move, chosen, 0)
+        ex = np.where(move, ex + DX[d], ex)
+        ey = np.where(move, ey + DY[d], ey)
+        self.enemy_x[games] = ex
+        self.enemy_y[games] = ey
+        self.enemy_dir[games] = np.where(move, chosen, self.enemy_dir[games])
+        self.returning[games] = returning & (ey * MAZE_WIDTH + ex != HOME_CELL)
@@ -0,0 +1,246 @@
+"""Benchmark Macan Hungry dengan seed tetap.
+
+Contoh:
+    python macan_bench.py                          # jalankan semua, cetak JSON
+    python macan_bench.py --output bench.json      # simpan hasil
+    python macan_bench.py --baseline bench.json    # bandingkan dengan hasil lama
+
+Setiap benchmark mengukur operasi per detik (ambil yang terbaik dari
+beberapa repeat). Rendering memakai platform Qt 'offscreen' dan
+menggambar ke QImage, sehingga tidak butuh display.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+from macan_maze import generate_random_maze
+from macan_engine import GameEngine
+from macan_autopilot import Autopilot
+
+SEED = 12345
+SWARM = 200 # Jumlah musuh benchmark swarm_step
+AUTOPILOT_NODES = 50 # Segmen search per keputusan benchmark autopilot_nodes
+
+
+def measure(func, number, repeat):
+    """Jalankan func(number) sebanyak repeat kali, kembalikan ops/detik terbaik."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(number)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return number / best if best > 0 else float('inf')
+
+
+def qt_widget(width=800, height=900):
+    """GameWidget offscreen yang sudah dalam keadaan bermain.
+
+    Widget tidak dipasang di MainWindow, jadi msg_signal tidak membuka
+    dialog modal.
+    """
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PySide6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication([])
+    random.seed(SEED)
+    import macan_hungry
+    widget = macan_hungry.GameWidget(persist=False) # Jangan sentuh save pemain
+    widget.engine.new_game(SEED)
+    widget.install_prefetcher() # Biasanya dipasang setelah paint pertama
+    widget.resize(width, height)
+    widget.start_game()
+    return app, widget
+
+
+def bench_maze_generation(number, repeat):
+    rng = random.Random(SEED)
+
+    def run(n):
+        for _ in range(n):
+            generate_random_maze(rng)
+    return measure(run, number, repeat)
+
+
+def bench_choose_direction(number, repeat):
+    engine = GameEngine(seed=SEED)
+    engine.level = 2
+    engine.init_level()
+    nav = engine.nav
+    enemies = engine.enemies
+    open_cells = [nav.position(i) for i, free in enumerate(nav.is_open) if free]
+    rng = random.Random(SEED)
+    targets = [rng.choice(open_cells) for _ in range(256)]
+
+    def run(n):
+        calls = 0
+        while calls < n:
+            for tx, ty in targets:
+                for enemy in enemies:
+                    enemy.choose_direction(tx, ty, nav, rng=engine.rng)
+                    enemy.x, enemy.y = enemy.target_x, enemy.target_y
+                calls += len(enemies)
+                if calls >= n:
+                    break
+    return measure(run, number, repeat)
+
+
+def bench_engine_step(number, repeat):
+    """Tick headless GameEngine dengan input acak ber-seed."""
+    def run(n):
+        rng = random.Random(SEED)
+        engine = GameEngine(seed=SEED)
+        for _ in range(n):
+            if engine.game_over:
+                engine.new_game(SEED)
+            engine.step(rng.randrange(4))
+    return measure(run, number, repeat)
+
+
+def bench_swarm_step(number, repeat):
+    """Tick headless mode swarm (SWARM musuh, flow field bersama)."""
+    def run(n):
+        rng = random.Random(SEED)
+        engine = GameEngine(seed=SEED, swarm=SWARM)
+        for _ in range(n):
+            if engine.game_over:
+                engine.new_game(SEED)
+            engine.step(rng.randrange(4))
+    return measure(run, number, repeat)
+
+
+def bench_autopilot(number, repeat):
+    """Segmen search autopilot per detik, memainkan game ber-seed."""
+    def run(n):
+        engine = GameEngine(seed=SEED)
+        pilot = Autopilot(budget=None, max_nodes=AUTOPILOT_NODES)
+        while pilot.total_nodes < n:
+            if engine.game_over:
+                engine.new_game(SEED)
+            engine.step(pilot.choose(engine))
+    return measure(run, number, repeat)
+
+
+def bench_update_game(number, repeat):
+    """Tick GameWidget.update_game lengkap (engine + event + partikel)."""
+    app, widget = qt_widget()
+
+    def run(n):
+        rng = random.Random(SEED)
+        for _ in range(n):
+            if not widget.game_active:
+                widget.engine.new_game(SEED)
+                widget.init_game()
+                widget.start_game()
+            widget.game_paused = False
+            widget.engine.next_move = rng.randrange(4)
+            widget.update_game()
+            widget.update_animation()
+    return measure(run, number, repeat)
+
+
+def bench_paint(number, repeat):
+    """paintEvent penuh ke QImage offscreen (frame per detik)."""
+    app, widget = qt_widget()
+    from PySide6.QtGui import QImage
+    image = QImage(widget.size(), QImage.Format_ARGB32_Premultiplied)
+
+    def run(n):
+        for _ in range(n):
+            widget.update_animation()
+            widget.render(image)
+    return measure(run, number, repeat)
+
+
+# (nama, fungsi, jumlah operasi default, butuh Qt)
+BENCHMARKS = [
+    ('maze_generation', bench_maze_generation, 200, False),
+    ('choose_direction', bench_choose_direction, 20000, False),
+    ('engine_step', bench_engine_step, 20000, False),
+    ('swarm_step', bench_swarm_step, 5000, False),
+    ('autopilot_nodes', bench_autopilot, 3000, False),
+    ('update_game', bench_update_game, 5000, True),
+    ('paint_fps', bench_paint, 60, True),
+]
+
+
+def run_benchmarks(names=None, scale=1.0, repeat=3, log=None, qt=True):
+    results = {}
+    for name, func, number, needs_qt in BENCHMARKS:
+        if names and name not in names:
+            continue
+        if needs_qt and not qt:
+            continue
+        number = max(1, int(number * scale))
+        ops = func(number, repeat)
+        results[name] = {"ops_per_sec": ops, "number": number, "repeat": repeat}
+        if log:
+            log(f"{name:<18}{ops:14.1f} ops/s")
+    return {
+        "seed": SEED,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare(current, baseline, tolerance):
+    """Rasio hasil sekarang / baseline; regresi jika lebih lambat dari tolerance."""
+    report = {}
+    for name, result in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if not base:
+            continue
+        ratio = result["ops_per_sec"] / base["ops_per_sec"]
+        report[name] = {"ratio": ratio, "regression": ratio < 1.0 - tolerance}
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Macan Hungry")
+    parser.add_argument('names', nargs='*', help="benchmark yang dijalankan (default semua)")
+    parser.add_argument('--output', help="tulis hasil JSON ke file ini")
+    parser.add_argument('--baseline', help="file JSON hasil lama untuk dibandingkan")
+    parser.add_argument('--tolerance', type=float, default=0.10,
+                        help="penurunan relatif yang dianggap regresi (default 0.10)")
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help="pengali jumlah operasi tiap benchmark")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--no-qt', action='store_true',
+                        help="lewati benchmark yang butuh PySide6")
+    args = parser.parse_args(argv)
+
+    known = [name for name, _, _, _ in BENCHMARKS]
+    unknown = [name for name in args.names if name not in known]
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(unknown)} (choose from {', '.join(known)})")
+
+    log = lambda line: print(line, file=sys.stderr)
+    data = run_benchmarks(args.names, args.scale, args.repeat, log, qt=not args.no_qt)
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        data["comparison"] = compare(data, baseline, args.tolerance)
+        for name, row in data["comparison"].items():
+            flag = "REGRESSION" if row["regression"] else "ok"
+            log(f"{name:<18}{row['ratio']:8.2f}x  {flag}")
+            if row["regression"]:
+                status = 1
+
+    text = json.dumps(data, indent=1)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text)
+    else:
+        print(text)
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
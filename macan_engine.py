@@ -0,0 +1,640 @@
+"""Aturan game Macan Hungry tanpa Qt.
+
+GameEngine memegang maze, Tiger dan Enemy. Satu panggilan step() sama
+dengan satu tick 50 ms di GameWidget, sehingga game bisa disimulasikan
+secepat CPU tanpa QApplication.
+"""
+import random
+from time import perf_counter
+
+from macan_maze import (MAZE_WIDTH, MAZE_HEIGHT, LAYOUT_MAZE, FOOD, POWER, Maze,
+                        check_maze_size, generate_random_maze, nav_table)
+
+# Arah: 0 kanan, 1 bawah, 2 kiri, 3 atas
+DIR_DX = [1, 0, -1, 0]
+DIR_DY = [0, 1, 0, -1]
+
+# Urutan arah yang dicoba musuh berdasarkan arah dominan:
+# 0 = dominan +x, 1 = dominan -x, 2 = dominan +y, 3 = dominan -y
+DIRECTION_PRIORITY = [
+    (0, 1, 3, 2),
+    (2, 1, 3, 0),
+    (1, 0, 2, 3),
+    (3, 0, 2, 1),
+]
+
+# Posisi untuk maze standar 19x21; maze lain memakai nav.spawn dan nav.home
+TIGER_SPAWN = (9, 15)
+ENEMY_HOME = (9, 9)
+
+# Di maze besar, musuh yang lebih jauh dari ini (sel, Chebyshev) dari tiger
+# bergerak greedy tanpa BFS, dan BFS musuh dekat dibatasi di sekitar tiger
+ACTIVE_RADIUS = 16
+
+# Mode swarm: batas musuh per sel, dan jarak BFS minimum musuh dari spawn
+# tiger saat disebar di awal level / setelah kehilangan nyawa
+SWARM_CELL_LIMIT = 2
+SWARM_SAFE_DISTANCE = 8
+
+# (x, y, warna RGB, personality); posisi relatif terhadap ENEMY_HOME
+ENEMY_SPECS = [
+    (8, 9, (255, 50, 50), 'chase'),
+    (9, 9, (255, 105, 180), 'ambush'),
+    (10, 9, (0, 255, 255), 'patrol'),
+    (9, 10, (255, 165, 0), 'random'),
+]
+
+# --- Events ---
+# step() mengembalikan list tuple (jenis, ...) sebagai pengganti Qt signal.
+EVT_FOOD = 'food'                # (EVT_FOOD, x, y)
+EVT_POWER = 'power'              # (EVT_POWER, x, y)
+EVT_ENEMY_EATEN = 'enemy_eaten'  # (EVT_ENEMY_EATEN, x, y, index musuh)
+EVT_LIFE_LOST = 'life_lost'      # (EVT_LIFE_LOST, x, y, index musuh)
+EVT_GAME_OVER = 'game_over'      # (EVT_GAME_OVER, score)
+EVT_LEVEL_UP = 'level_up'        # (EVT_LEVEL_UP, level)
+
+
+def power_duration(level):
+    """Lama power mode (tick): lebih sebentar di level tinggi."""
+    return 150 - min(100, (level - 1) * 10)
+
+
+def enemy_cooldown(level, power_mode):
+    """Jeda tick antar langkah musuh: makin kecil (cepat) tiap 3 level."""
+    base_speed = 6 if power_mode else 4
+    speed_modifier = 0 if power_mode else min(2, (level - 1) // 3)
+    return max(2, base_speed - speed_modifier)
+
+
+class Entity:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self.target_x = x
+        self.target_y = y
+        self.direction = 0
+
+
+class Tiger(Entity):
+    def __init__(self, x, y):
+        super().__init__(x, y)
+        self.animation_frame = 0
+        self.mouth_open = False
+
+    def update_animation(self):
+        self.animation_frame = (self.animation_frame + 1) % 20
+        if self.animation_frame % 5 == 0:
+            self.mouth_open = not self.mouth_open
+
+
+class Enemy(Entity):
+    def __init__(self, x, y, color, personality, corner=0):
+        super().__init__(x, y)
+        self.color = color # Tuple RGB, dikonversi ke QColor oleh view
+        self.personality = personality
+        self.corner = corner # Index nav.corners untuk scatter mode
+        self.scared = False
+        self.scatter_mode = False
+        self.returning = False # Sudah dimakan, sedang pulang ke ghost house
+
+    def color_name(self):
+        """Nama warna format '#rrggbb', sama seperti QColor.name()."""
+        return '#%02x%02x%02x' % self.color
+
+    def choose_direction(self, tiger_x, tiger_y, nav, radius=None, rng=random, tiger_dir=0):
+        """Pilih langkah berikutnya memakai NavTable maze saat ini.
+
+        Jika radius diberikan, BFS yang mengikuti tiger hanya menjelajah
+        sekitar tiger, dan musuh di luar radius bergerak greedy. rng
+        adalah stream random logika game (GameEngine.rng). tiger_dir
+        (arah gerak terakhir tiger) dipakai ambush dan patrol untuk
+        memprediksi junction berikutnya tiger lewat JunctionGraph.
+        """
+        here = nav.index(self.x, self.y)
+        tiger = nav.index(tiger_x, tiger_y)
+        window = None if radius is None else radius * 2
+        step = None
+
+        if self.returning:
+            # Musuh yang dimakan berjalan pulang ke ghost house
+            step = nav.step_toward(here, nav.index(*nav.home))
+        elif (radius is not None and not self.scatter_mode and
+              max(abs(tiger_x - self.x), abs(tiger_y - self.y)) > radius):
+            # Jauh dari tiger: dekati (atau jauhi) menurut arah dominan
+            dx = tiger_x - self.x
+            dy = tiger_y - self.y
+            if self.scared:
+                dx, dy = -dx, -dy
+            if abs(dx) > abs(dy):
+                directions = DIRECTION_PRIORITY[0 if dx > 0 else 1]
+            else:
+                directions = DIRECTION_PRIORITY[2 if dy > 0 else 3]
+            step = nav.first_open(here, directions)
+        elif self.scared:
+            step = nav.step_away(here, tiger, window)
+        elif self.scatter_mode:
+            step = nav.step_toward(here, nav.index(*nav.corners[self.corner]))
+        elif self.personality == 'chase':
+            step = nav.step_toward(here, tiger, window)
+        elif self.personality == 'ambush':
+            # Cegat di junction yang akan dicapai tiger berikutnya
+            graph = nav.junctions()
+            junction, _ = graph.predict(tiger, tiger_dir)
+            step = self.intercept(here, junction, tiger, nav, graph, window)
+        elif self.personality == 'patrol':
+            # Jaga jalan keluar junction berikutnya tiger yang paling dekat
+            graph = nav.junctions()
+            junction, arrive = graph.predict(tiger, tiger_dir)
+            target = junction
+            best = -1
+            for exit_cell in graph.exits(junction, arrive):
+                dist = graph.distance(here, exit_cell)
+                if dist >= 0 and (best < 0 or dist < best):
+                    target, best = exit_cell, dist
+            step = self.intercept(here, target, tiger, nav, graph, window)
+        else:
+            step = self.wander(here, nav, rng)
+
+        # Fallback movement if stuck
+        if step is None:
+            step = nav.first_open(here, range(4))
+        if step is not None:
+            d, cell = step
+            self.target_x, self.target_y = nav.position(cell)
+            self.direction = d
+
+    def intercept(self, here, junction, tiger, nav, graph, window=None):
+        """Rute graph ke junction; setelah sampai, kejar tiger langsung."""
+        if here == junction or graph.node_id[junction] < 0:
+            return nav.step_toward(here, tiger, window)
+        return graph.step_toward(here, junction)
+
+    def wander(self, here, nav, rng):
+        """Langkah acak personality 'random' (dan 'patrol' tanpa junction di mode swarm)."""
+        if self.personality == 'random':
+            dx = rng.randint(-1, 1)
+            dy = rng.randint(-1, 1)
+        else:  # patrol
+            dx = rng.randint(-2, 2)
+            dy = rng.randint(-2, 2)
+        if abs(dx) > abs(dy):
+            directions = DIRECTION_PRIORITY[0 if dx > 0 else 1]
+        else:
+            directions = DIRECTION_PRIORITY[2 if dy > 0 else 3]
+        return nav.first_open(here, directions)
+
+    def follow_fields(self, here, fields, nav, rng):
+        """Langkah (arah, sel) mode swarm dari flow field bersama.
+
+        fields = ((toward, away) ke tiger, field ke home, field tiap pojok,
+        (junction, field) prediksi tiger, [(sel, jarak BFS) tiap jalan keluar]),
+        lihat GameEngine.move_swarm(). Ambush dan patrol memakai field ke
+        junction yang sama untuk semua musuh, bukan rute graph sendiri.
+        """
+        (toward, away), home, corners, (junction, ambush), guards = fields
+        if self.returning:
+            step = home[here]
+        elif self.scared:
+            step = away[here]
+        elif self.scatter_mode:
+            step = corners[self.corner][here]
+        elif self.personality == 'chase':
+            step = toward[here]
+        elif self.personality == 'ambush':
+            step = toward[here] if here == junction else ambush[here]
+        elif self.personality == 'patrol':
+            # Jalan keluar terdekat; wander jika tidak ada yang terjangkau
+            step = None
+            best = -1
+            for guard, dist in guards:
+                d = dist[here]
+                if d >= 0 and (best < 0 or d < best):
+                    best = d
+                    target = guard
+            if best < 0:
+                step = self.wander(here, nav, rng)
+            else:
+                step = toward[here] if best == 0 else nav.step_toward(here, target)
+        else:
+            step = self.wander(here, nav, rng)
+        if step is None:
+            step = nav.first_open(here, range(4))
+        return step
+
+
+class GameEngine:
+    """State dan aturan satu game, dimajukan per tick lewat step().
+
+    width dan height (ganjil) memilih ukuran maze; selain 19x21, level 1
+    juga memakai maze acak. Semua keacakan berasal dari seed game:
+    stream 'logic' untuk AI musuh, 'maze' untuk maze tiap level, dan
+    'fx' untuk efek visual view, sehingga seed + input per tick cukup
+    untuk memutar ulang game.
+
+    swarm > 0 menyalakan mode swarm dengan sejumlah itu musuh yang disebar
+    di maze; semua musuh berbagi flow field dari sel tiger dan tabrakan
+    dicek lewat index musuh per sel.
+    """
+
+    def __init__(self, width=MAZE_WIDTH, height=MAZE_HEIGHT, seed=None, swarm=0):
+        check_maze_size(width, height)
+        self.width = width
+        self.height = height
+        self.swarm = swarm
+        self.buckets = None # Sel -> list index musuh (mode swarm), None = perlu dibangun
+        self.active_radius = None
+        self.score = 0
+        self.lives = 3
+        self.level = 1
+        self.power_mode = False
+        self.power_timer = 0
+        self.game_over = False
+        self.profiler = None # PerfRecorder opsional untuk timing per fase
+        self.prefetcher = None # MazePrefetcher opsional untuk maze level berikutnya
+        self.tick = 0
+        self.reseed(seed)
+        # Fase update_game lama, berurutan; nama dipakai oleh profiler
+        self.phases = [
+            ('tick.tiger', self.move_tiger),
+            ('tick.power', self.update_power),
+            ('tick.enemies', self.move_enemies),
+            ('tick.scatter', self.update_scatter),
+            ('tick.collisions', self.check_collisions),
+            ('tick.level', self.check_level_complete),
+        ]
+        self.sim_phases = [p for p in self.phases if p[0] != 'tick.level']
+        self.init_level()
+
+    def reseed(self, seed=None):
+        """Pasang seed game baru (acak jika None) dan buat ulang stream RNG."""
+        if seed is None:
+            seed = random.getrandbits(64)
+        self.seed = seed
+        self.rng = random.Random(f"macan:{seed}:logic")
+        self.maze_rng = random.Random(f"macan:{seed}:maze")
+        self.fx_rng = random.Random(f"macan:{seed}:fx")
+        self.next_maze_seed = self.maze_rng.getrandbits(64)
+
+    def new_game(self, seed=None):
+        """Mulai ulang dari level 1 dengan skor dan nyawa awal.
+
+        Setiap game baru mendapat seed baru kecuali seed diberikan.
+        """
+        self.reseed(seed)
+        self.tick = 0
+        self.score = 0
+        self.lives = 3
+        self.level = 1
+        self.power_mode = False
+        self.power_timer = 0
+        self.game_over = False
+        self.init_level()
+
+    def init_level(self):
+        # Gunakan layout default untuk level 1, generate acak untuk level > 1
+        if self.level == 1 and (self.width, self.height) == (MAZE_WIDTH, MAZE_HEIGHT):
+            self.set_maze(LAYOUT_MAZE.clone())
+            self.maze_seed = None # Layout bawaan, bukan dari generator
+            self.request_prefetch()
+        else:
+            self.set_maze(self.next_level_maze())
+
+        self.tiger = Tiger(*self.nav.spawn)
+        self.enemies = self.make_enemies()
+        if self.swarm:
+            self.place_swarm()
+        self.next_move = None
+        self.move_cooldown = 0
+        self.enemy_move_cooldown = 0
+        self.scatter_timer = 0
+
+    def make_enemies(self):
+        """Musuh baru di ghost house; mode swarm mengulang ENEMY_SPECS."""
+        home_x, home_y = self.nav.home
+        enemies = []
+        for i in range(self.swarm or len(ENEMY_SPECS)):
+            x, y, color, personality = ENEMY_SPECS[i % len(ENEMY_SPECS)]
+            enemies.append(Enemy(home_x + x - ENEMY_HOME[0], home_y + y - ENEMY_HOME[1],
+                                 color, personality, corner=i % 4))
+        return enemies
+
+    def place_swarm(self):
+        """Sebar musuh swarm secara acak (stream logika) jauh dari spawn tiger."""
+        nav = self.nav
+        dist = nav.distances(nav.index(*nav.spawn))
+        cells = ([c for c, d in enumerate(dist) if d >= SWARM_SAFE_DISTANCE] or
+                 [c for c, d in enumerate(dist) if d > 0] or [nav.index(*nav.home)])
+        slots = cells * SWARM_CELL_LIMIT
+        count = len(self.enemies)
+        picks = self.rng.sample(slots, min(count, len(slots)))
+        picks += [self.rng.choice(cells) for _ in range(count - len(picks))]
+        for enemy, cell in zip(self.enemies, picks):
+            enemy.x, enemy.y = nav.position(cell)
+            enemy.target_x = enemy.x
+            enemy.target_y = enemy.y
+            enemy.returning = False
+        self.buckets = None
+
+    def enemy_buckets(self):
+        """Index sel -> list index musuh, dibangun ulang jika belum ada."""
+        if self.buckets is None:
+            buckets = {}
+            index = self.nav.index
+            for i, e in enumerate(self.enemies):
+                buckets.setdefault(index(e.x, e.y), []).append(i)
+            self.buckets = buckets
+        return self.buckets
+
+    def set_maze(self, maze, nav=None):
+        """Pasang Maze baru beserta NavTable-nya.
+
+        Ukuran engine mengikuti maze, sehingga save dari mode maze besar
+        tetap berlanjut di ukuran yang sama. nav boleh diberikan jika
+        NavTable sudah dibangun di thread lain (load dari file).
+        """
+        self.maze = maze
+        self.nav = nav if nav is not None else nav_table(maze)
+        self.width = maze.width
+        self.height = maze.height
+        self.buckets = None
+        big = maze.width * maze.height > MAZE_WIDTH * MAZE_HEIGHT
+        self.active_radius = ACTIVE_RADIUS if big else None
+
+    def prefetcher_ready(self):
+        prefetcher = self.prefetcher
+        return prefetcher is not None and (prefetcher.width, prefetcher.height) == (self.width, self.height)
+
+    def request_prefetch(self):
+        """Minta prefetcher menyiapkan maze untuk next_maze_seed."""
+        if self.prefetcher_ready():
+            self.prefetcher.request(self.next_maze_seed)
+
+    def next_level_maze(self):
+        """Maze level berikutnya dari stream 'maze', lewat prefetcher jika ada."""
+        seed = self.next_maze_seed
+        self.maze_seed = seed
+        self.next_maze_seed = self.maze_rng.getrandbits(64)
+        if self.prefetcher_ready():
+            maze = self.prefetcher.take(seed)
+        else:
+            maze = Maze.from_rows(generate_random_maze(random.Random(seed), self.width, self.height))
+        self.request_prefetch()
+        return maze
+
+    def reset_level(self):
+        """Kembalikan tiger dan musuh ke posisi awal setelah kehilangan nyawa."""
+        self.tiger.x, self.tiger.y = self.nav.spawn
+        self.next_move = None
+        if self.swarm:
+            self.place_swarm()
+            return
+        home_x, home_y = self.nav.home
+        for i, e in enumerate(self.enemies):
+            e.x = home_x - 1 + (i % 3)
+            e.y = home_y
+            e.target_x = e.x
+            e.target_y = e.y
+            e.returning = False
+
+    def step(self, action=None):
+        """Majukan game satu tick dan kembalikan list event.
+
+        action adalah arah baru (0-3) atau None untuk tetap memakai
+        arah terakhir, sama seperti tombol yang ditahan di GameWidget.
+        Jika profiler (PerfRecorder) dipasang, waktu tiap fase dicatat
+        sebagai 'tick.<fase>'.
+        """
+        events = []
+        if self.game_over:
+            return events
+        self.tick += 1
+        if action is not None:
+            self.next_move = action
+
+        if self.profiler is None:
+            for _, phase in self.phases:
+                if phase(events) is False:
+                    break
+            return events
+
+        profiler = self.profiler
+        start = last = perf_counter()
+        for name, phase in self.phases:
+            stop = phase(events) is False
+            now = perf_counter()
+            profiler.record(name, now - last)
+            last = now
+            if stop:
+                break
+        profiler.record('tick.total', last - start)
+        return events
+
+    def simulate(self, action=None):
+        """step() untuk search: tanpa profiler dan tanpa pindah level.
+
+        Level yang selesai (maze.food_left == 0) tidak diganti maze baru,
+        sehingga restore() cukup untuk kembali; pemanggil menganggapnya
+        akhir cabang search.
+        """
+        events = []
+        if self.game_over:
+            return events
+        self.tick += 1
+        if action is not None:
+            self.next_move = action
+        for _, phase in self.sim_phases:
+            if phase(events) is False:
+                break
+        return events
+
+    def snapshot(self):
+        """State yang berubah per tick sebagai tuple, untuk restore().
+
+        Maze, nav dan level tidak ikut (hanya bitboard makanan), jadi
+        snapshot murah tetapi hanya berlaku di level yang sama; dipakai
+        bersama simulate() oleh search autopilot.
+        """
+        maze = self.maze
+        tiger = self.tiger
+        return (self.tick, self.score, self.lives, self.power_mode, self.power_timer,
+                self.game_over, self.next_move, self.move_cooldown,
+                self.enemy_move_cooldown, self.scatter_timer,
+                maze.food, maze.power, maze.food_left, self.rng.getstate(),
+                (tiger.x, tiger.y, tiger.target_x, tiger.target_y, tiger.direction),
+                [(e.x, e.y, e.target_x, e.target_y, e.direction, e.scared, e.scatter_mode, e.returning)
+                 for e in self.enemies])
+
+    def restore(self, snap):
+        """Kembalikan state dari snapshot() di level yang sama."""
+        (self.tick, self.score, self.lives, self.power_mode, self.power_timer,
+         self.game_over, self.next_move, self.move_cooldown,
+         self.enemy_move_cooldown, self.scatter_timer,
+         maze_food, maze_power, food_left, rng_state, tiger, enemies) = snap
+        maze = self.maze
+        maze.food = maze_food
+        maze.power = maze_power
+        maze.food_left = food_left
+        self.rng.setstate(rng_state)
+        t = self.tiger
+        t.x, t.y, t.target_x, t.target_y, t.direction = tiger
+        for e, state in zip(self.enemies, enemies):
+            e.x, e.y, e.target_x, e.target_y, e.direction, e.scared, e.scatter_mode, e.returning = state
+        if self.swarm:
+            self.buckets = None
+
+    def move_tiger(self, events):
+        # 1. Tiger Movement
+        if self.move_cooldown > 0:
+            self.move_cooldown -= 1
+            return
+        if self.next_move is None:
+            return
+        nav = self.nav
+        tiger = self.tiger
+        target = nav.moves[nav.index(tiger.x, tiger.y)][self.next_move]
+        if target < 0:
+            return
+        new_x, new_y = nav.position(target)
+        tiger.x = new_x
+        tiger.y = new_y
+        tiger.direction = self.next_move
+
+        # Eat Logic
+        cell = self.maze.eat(new_x, new_y)
+        if cell == FOOD:
+            self.score += 10
+            events.append((EVT_FOOD, new_x, new_y))
+        elif cell == POWER:
+            self.score += 50
+            self.power_mode = True
+            # Leveling: Power bertahan lebih sebentar di level tinggi
+            self.power_timer = power_duration(self.level)
+            for enemy in self.enemies:
+                if not enemy.returning:
+                    enemy.scared = True
+            events.append((EVT_POWER, new_x, new_y))
+
+        self.move_cooldown = 2
+
+    def update_power(self, events):
+        # 2. Power Mode Logic
+        if self.power_mode:
+            self.power_timer -= 1
+            if self.power_timer <= 0:
+                self.power_mode = False
+                for enemy in self.enemies:
+                    enemy.scared = False
+
+    def move_enemies(self, events):
+        # 3. Enemy Movement & Leveling Difficulty
+        # Leveling: Musuh makin cepat (cooldown makin kecil)
+        current_speed_threshold = enemy_cooldown(self.level, self.power_mode)
+
+        if self.enemy_move_cooldown > 0:
+            self.enemy_move_cooldown -= 1
+            return
+        if self.swarm:
+            self.move_swarm()
+            self.enemy_move_cooldown = current_speed_threshold
+            return
+        nav = self.nav
+        tiger = self.tiger
+        for enemy in self.enemies:
+            # Slow down scared enemies
+            if enemy.scared and self.enemy_move_cooldown % 2 != 0:
+                continue
+            enemy.choose_direction(tiger.x, tiger.y, nav, self.active_radius, self.rng, tiger.direction)
+            enemy.x = enemy.target_x
+            enemy.y = enemy.target_y
+            if enemy.returning and (enemy.x, enemy.y) == nav.home:
+                enemy.returning = False
+        self.enemy_move_cooldown = current_speed_threshold
+
+    def move_swarm(self):
+        """Langkah semua musuh mode swarm.
+
+        Flow field ke/menjauhi tiger dihitung sekali per sel tiger (satu BFS)
+        dan dipakai bersama, begitu juga field ke home, ke tiap pojok dan ke
+        junction berikutnya tiger (jarak BFS untuk jalan keluarnya),
+        sehingga tiap musuh cukup satu lookup list. Musuh tidak masuk ke sel
+        yang sudah berisi SWARM_CELL_LIMIT musuh (kecuali sel tiger), dan
+        menunggu giliran berikutnya.
+        """
+        nav = self.nav
+        tiger = nav.index(self.tiger.x, self.tiger.y)
+        junction, arrive = nav.junctions().predict(tiger, self.tiger.direction)
+        guards = [(c, nav.distances(c)) for c in nav.junctions().exits(junction, arrive)]
+        fields = (nav.flow_fields(tiger), nav.flow_fields(nav.index(*nav.home))[0],
+                  [nav.flow_fields(nav.index(*c))[0] for c in nav.corners],
+                  (junction, nav.flow_fields(junction)[0]), guards)
+        buckets = self.enemy_buckets()
+        rng = self.rng
+        for i, enemy in enumerate(self.enemies):
+            # Slow down scared enemies
+            if enemy.scared and self.enemy_move_cooldown % 2 != 0:
+                continue
+            here = nav.index(enemy.x, enemy.y)
+            step = enemy.follow_fields(here, fields, nav, rng)
+            if step is None:
+                continue
+            d, cell = step
+            enemy.direction = d
+            if cell != tiger and not enemy.returning and len(buckets.get(cell, ())) >= SWARM_CELL_LIMIT:
+                continue
+            bucket = buckets[here]
+            bucket.remove(i)
+            if not bucket:
+                del buckets[here]
+            buckets.setdefault(cell, []).append(i)
+            enemy.x, enemy.y = enemy.target_x, enemy.target_y = nav.position(cell)
+            if enemy.returning and (enemy.x, enemy.y) == nav.home:
+                enemy.returning = False
+
+    def update_scatter(self, events):
+        # 4. Scatter Logic
+        self.scatter_timer += 1
+        if self.scatter_timer % 200 == 0:
+            for enemy in self.enemies:
+                enemy.scatter_mode = not enemy.scatter_mode
+
+    def check_collisions(self, events):
+        """5. Collisions. Mengembalikan False jika game berakhir."""
+        nav = self.nav
+        tiger = self.tiger
+        if self.swarm:
+            # Hanya musuh di sel tiger yang perlu dicek
+            candidates = list(self.enemy_buckets().get(nav.index(tiger.x, tiger.y), ()))
+        else:
+            candidates = range(len(self.enemies))
+        for i in candidates:
+            enemy = self.enemies[i]
+            if enemy.returning:
+                continue
+            if tiger.x == enemy.x and tiger.y == enemy.y:
+                if self.power_mode:
+                    self.score += 200 * self.level # Skor lebih besar di level tinggi
+                    events.append((EVT_ENEMY_EATEN, enemy.x, enemy.y, i))
+                    # Send enemy home, teleport jika rumah tidak terjangkau
+                    if nav.distances(nav.index(*nav.home))[nav.index(enemy.x, enemy.y)] > 0:
+                        enemy.returning = True
+                    else:
+                        enemy.x, enemy.y = nav.home
+                        self.buckets = None
+                    enemy.scared = False
+                else:
+                    self.lives -= 1
+                    events.append((EVT_LIFE_LOST, tiger.x, tiger.y, i))
+
+                    if self.lives <= 0:
+                        self.game_over = True
+                        events.append((EVT_GAME_OVER, self.score))
+                        return False
+                    self.reset_level()
+
+    def check_level_complete(self, events):
+        # 6. Level Complete
+        if self.maze.food_left == 0:
+            self.level += 1
+            self.set_maze(self.next_level_maze())
+            self.reset_level()
+            events.append((EVT_LEVEL_UP, self.level))
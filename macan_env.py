@@ -0,0 +1,146 @@
+"""Environment gaya Gym untuk melatih agent di Macan Hungry.
+
+    env = MacanEnv()
+    obs, info = env.reset(seed=1)
+    obs, reward, terminated, truncated, info = env.step(action)
+
+Observasi adalah array uint8 (channel, height, width): walls, food, power,
+tiger, satu channel per musuh, lalu scared (sel musuh yang sedang takut).
+Buffer observasi dibuat sekali per reset/level dan diperbarui di tempat
+dari event engine dan perubahan posisi, sehingga step() tidak membangun
+ulang array; yang dikembalikan selalu view read-only dari buffer yang sama
+(salin dengan obs.copy() jika butuh riwayat).
+
+Action 0-3 adalah arah (kanan, bawah, kiri, atas), KEEP (4) atau None
+mempertahankan arah terakhir. Reward adalah tambahan skor engine
+(makanan 10, power 50, musuh 200 x level).
+"""
+import numpy as np
+
+from macan_maze import MAZE_WIDTH, MAZE_HEIGHT
+from macan_engine import GameEngine, EVT_FOOD, EVT_POWER, EVT_LEVEL_UP
+
+KEEP = 4
+NUM_ACTIONS = 5
+
+CH_WALLS = 0
+CH_FOOD = 1
+CH_POWER = 2
+CH_TIGER = 3
+CH_ENEMY = 4 # Musuh i di channel CH_ENEMY + i; scared di channel terakhir
+
+
+def mask_to_array(mask, cells):
+    """Bitboard int (bit i = sel i) menjadi array uint8 0/1 sepanjang cells."""
+    data = np.frombuffer(mask.to_bytes((cells + 7) // 8, 'little'), dtype=np.uint8)
+    return np.unpackbits(data, bitorder='little')[:cells]
+
+
+class MacanEnv:
+    """Satu GameEngine dengan API reset()/step() dan observasi NumPy."""
+
+    def __init__(self, width=MAZE_WIDTH, height=MAZE_HEIGHT, swarm=0,
+                 ticks_per_step=1, max_ticks=None):
+        self.engine = GameEngine(width, height, swarm=swarm)
+        self.ticks_per_step = ticks_per_step # Tick engine per step() (frame skip)
+        self.max_ticks = max_ticks # Batas episode (truncated), None = tanpa batas
+        self.obs = None
+        self.obs_view = None
+        self.flat = None
+        self.positions = [] # Sel terakhir tiger dan tiap musuh di buffer
+        self.scared_cells = []
+
+    @property
+    def num_channels(self):
+        return CH_ENEMY + len(self.engine.enemies) + 1
+
+    @property
+    def observation_shape(self):
+        return (self.num_channels, self.engine.height, self.engine.width)
+
+    def reset(self, seed=None):
+        """Mulai episode (game) baru; kembalikan (obs, info)."""
+        self.engine.new_game(seed)
+        self.rebuild()
+        return self.obs_view, self.info()
+
+    def step(self, action=None):
+        """Majukan ticks_per_step tick; kembalikan (obs, reward, terminated, truncated, info)."""
+        engine = self.engine
+        if action == KEEP:
+            action = None
+        start_score = engine.score
+        rebuild = False
+        flat = self.flat
+        for _ in range(self.ticks_per_step):
+            for event in engine.step(action):
+                kind = event[0]
+                if kind == EVT_FOOD:
+                    flat[CH_FOOD, event[2] * engine.width + event[1]] = 0
+                elif kind == EVT_POWER:
+                    flat[CH_POWER, event[2] * engine.width + event[1]] = 0
+                elif kind == EVT_LEVEL_UP:
+                    rebuild = True
+            action = None
+            if engine.game_over:
+                break
+        if rebuild:
+            self.rebuild()
+        else:
+            self.update_entities()
+        truncated = (self.max_ticks is not None and engine.tick >= self.max_ticks
+                     and not engine.game_over)
+        return self.obs_view, engine.score - start_score, engine.game_over, truncated, self.info()
+
+    def info(self):
+        engine = self.engine
+        return {"score": engine.score, "lives": engine.lives, "level": engine.level,
+                "tick": engine.tick, "power_timer": engine.power_timer if engine.power_mode else 0}
+
+    def entity_cells(self):
+        engine = self.engine
+        width = engine.width
+        return [e.y * width + e.x for e in [engine.tiger] + engine.enemies]
+
+    def rebuild(self):
+        """Bangun ulang seluruh buffer (reset dan level baru)."""
+        engine = self.engine
+        maze = engine.maze
+        cells = maze.width * maze.height
+        shape = self.observation_shape
+        if self.obs is None or self.obs.shape != shape:
+            self.obs = np.zeros(shape, dtype=np.uint8)
+            self.flat = self.obs.reshape(shape[0], -1)
+            self.obs_view = self.obs.view()
+            self.obs_view.flags.writeable = False
+        else:
+            self.obs.fill(0)
+        flat = self.flat
+        flat[CH_WALLS] = mask_to_array(maze.walls, cells)
+        flat[CH_FOOD] = mask_to_array(maze.food, cells)
+        flat[CH_POWER] = mask_to_array(maze.power, cells)
+        self.positions = self.entity_cells()
+        for ch, cell in enumerate(self.positions, CH_TIGER):
+            flat[ch, cell] = 1
+        self.scared_cells = []
+        self.update_scared()
+
+    def update_entities(self):
+        """Pindahkan titik tiger dan musuh yang berubah sel, lalu mask scared."""
+        flat = self.flat
+        cells = self.entity_cells()
+        for ch, (old, new) in enumerate(zip(self.positions, cells), CH_TIGER):
+            if old != new:
+                flat[ch, old] = 0
+                flat[ch, new] = 1
+        self.positions = cells
+        self.update_scared()
+
+    def update_scared(self):
+        flat = self.flat
+        scared_ch = self.num_channels - 1
+        for cell in self.scared_cells:
+            flat[scared_ch, cell] = 0
+        self.scared_cells = [cell for e, cell in zip(self.engine.enemies, self.positions[1:]) if e.scared]
+        for cell in self.scared_cells:
+            flat[scared_ch, cell] = 1
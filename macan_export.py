@@ -0,0 +1,162 @@
+"""Export replay Macan Hungry ke urutan gambar PNG tanpa window.
+
+Setiap frame digambar oleh GameWidget.paintEvent() yang sama dengan game
+(platform Qt 'offscreen') ke QImage beresolusi pilihan, lalu disimpan
+sebagai frame_000000.png, frame_000001.png, ... Nomor frame dihitung dari
+tick 1 replay, jadi rentang --start/--end yang sama selalu menghasilkan
+nama file dan gambar yang sama (cocok untuk snapshot regresi visual).
+
+Rentang tick dibagi ke beberapa proses. Setiap worker memutar replay dari
+awal tanpa menggambar (tick game dan animasi, termasuk stream RNG
+kosmetik) sampai tick awal bagiannya, sehingga hasilnya identik dengan
+render satu proses.
+
+Contoh:
+    python macan_export.py macan_last_replay.mhr --output frames
+    python macan_export.py game.mhr --start 400 --end 600 --resolution 1920x1080 --frames-per-tick 3
+    ffmpeg -framerate 20 -start_number 399 -i frames/frame_%06d.png clip.mp4
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+os.environ["QT_QPA_PLATFORM"] = "offscreen" # Sebelum PySide6 diimport (di worker)
+
+from macan_replay import Replay, play_headless
+
+FRAME_NAME = "frame_{:06d}.png"
+PNG_QUALITY = 80 # Kompresi zlib ringan: encode ~2x lebih cepat dari default Qt, file ~15% lebih besar
+
+_app = None
+
+
+def qt_app():
+    """QApplication satu per proses, dibuat saat pertama dibutuhkan."""
+    global _app
+    from PySide6.QtWidgets import QApplication
+    if _app is None:
+        _app = QApplication.instance() or QApplication([])
+    return _app
+
+
+def render_range(spec):
+    """Render tick [start, end) dari replay; kembalikan ringkasan (tuple).
+
+    spec: (data replay, start, end, output, width, height, frames_per_tick, png_quality)
+    """
+    data, start, end, output, width, height, per_tick, quality = spec
+    qt_app()
+    from PySide6.QtGui import QImage, QColor
+    from macan_hungry import GameWidget
+
+    replay = Replay.from_dict(data)
+    widget = GameWidget(maze_size=(replay.width, replay.height), swarm=replay.swarm, persist=False)
+    widget.resize(width, height)
+    widget.play_replay(replay)
+    image = QImage(width, height, QImage.Format_RGB32)
+
+    begin = time.perf_counter()
+    # Fast-forward: tick game dan animasi tanpa paint, sama seperti on_frame
+    while widget.engine.tick < start - 1:
+        widget.update_game()
+        widget.update_animation()
+    forwarded = time.perf_counter()
+
+    render_time = save_time = 0.0
+    frames = 0
+    for tick in range(start, end):
+        widget.update_game()
+        widget.update_animation()
+        for sub in range(per_tick):
+            t0 = time.perf_counter()
+            widget.render_alpha = (sub + 1) / per_tick
+            widget.update_camera() # Maze besar: kamera ikut tiger, sama seperti on_frame
+            image.fill(QColor(0, 0, 0))
+            widget.render(image)
+            t1 = time.perf_counter()
+            image.save(os.path.join(output, FRAME_NAME.format((tick - 1) * per_tick + sub)),
+                       'PNG', quality)
+            render_time += t1 - t0
+            save_time += time.perf_counter() - t1
+            frames += 1
+
+    if widget.engine.prefetcher is not None:
+        widget.engine.prefetcher.shutdown()
+    return start, end, frames, forwarded - begin, render_time, save_time
+
+
+def split_ticks(start, end, chunks):
+    """Bagi [start, end) menjadi paling banyak chunks rentang berurutan."""
+    chunks = max(1, min(chunks, end - start))
+    bounds = [start + (end - start) * i // chunks for i in range(chunks + 1)]
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if a < b]
+
+
+def run_export(specs, jobs):
+    if jobs <= 1:
+        return [render_range(spec) for spec in specs]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(render_range, specs))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export replay Macan Hungry ke urutan PNG")
+    parser.add_argument('replay', help="file replay (.mhr)")
+    parser.add_argument('--output', default='frames', help="folder PNG (default ./frames)")
+    parser.add_argument('--resolution', default='1280x720', help="ukuran gambar WxH")
+    parser.add_argument('--start', type=int, default=1, help="tick pertama (default 1)")
+    parser.add_argument('--end', type=int, help="tick terakhir (default akhir replay)")
+    parser.add_argument('--frames-per-tick', type=int, default=1,
+                        help="frame per tick dengan interpolasi posisi (default 1 = 20 FPS)")
+    parser.add_argument('--png-quality', type=int, default=PNG_QUALITY,
+                        help="kualitas PNG Qt 0-100, makin tinggi makin cepat tapi file makin besar")
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help="jumlah proses (default semua core)")
+    parser.add_argument('--chunks', type=int, help="jumlah rentang tick (default = jobs)")
+    args = parser.parse_args(argv)
+    width, height = (int(v) for v in args.resolution.lower().split('x'))
+
+    with open(args.replay, 'rb') as f:
+        data = json.loads(f.read())
+    replay = Replay.from_dict(data)
+    # Tick terakhir yang benar-benar dimainkan (game over bisa lebih awal)
+    last = play_headless(replay).tick
+    end = min(last, args.end if args.end is not None else last)
+    start = max(1, args.start)
+    if start > end:
+        parser.error(f"empty tick range {start}..{end} (replay has {last} ticks)")
+
+    os.makedirs(args.output, exist_ok=True)
+    ranges = split_ticks(start, end + 1, args.chunks or args.jobs)
+    specs = [(data, a, b, args.output, width, height, args.frames_per_tick,
+              args.png_quality) for a, b in ranges]
+    began = time.perf_counter()
+    results = run_export(specs, args.jobs)
+    elapsed = time.perf_counter() - began
+
+    frames = sum(r[2] for r in results)
+    summary = {
+        "replay": args.replay,
+        "output": args.output,
+        "resolution": f"{width}x{height}",
+        "ticks": [start, end],
+        "frames": frames,
+        "first_frame": (start - 1) * args.frames_per_tick,
+        "elapsed_sec": elapsed,
+        "frames_per_sec": frames / elapsed if elapsed > 0 else 0.0,
+        "jobs": args.jobs,
+        "chunks": [{"ticks": [r[0], r[1] - 1], "frames": r[2], "fast_forward_sec": r[3],
+                    "render_sec": r[4], "save_sec": r[5]} for r in results],
+    }
+    print(f"{frames} frames {width}x{height} in {elapsed:.1f}s "
+          f"({summary['frames_per_sec']:.1f} frames/s, {args.jobs} jobs) -> {args.output}",
+          file=sys.stderr)
+    print(json.dumps(summary, indent=1))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
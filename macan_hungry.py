@@ -1,888 +1,1701 @@
-import sys
-import random
-import math
-import json
-import os
-from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                               QLabel, QPushButton, QFrame, QGraphicsDropShadowEffect, QHBoxLayout, QMessageBox)
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF, Signal, QSize
-from PySide6.QtGui import (QPainter, QColor, QPen, QBrush, QFont, 
-                           QPainterPath, QRadialGradient, QLinearGradient)
-
-# --- Constants ---
-CELL_SIZE = 40
-MAZE_WIDTH = 19
-MAZE_HEIGHT = 21
-base_width = MAZE_WIDTH * CELL_SIZE
-base_height = MAZE_HEIGHT * CELL_SIZE
-
-app_data_path = os.getenv('LOCALAPPDATA')
-if not app_data_path:
-    # Fallback jika bukan Windows atau variabel env tidak ada
-    app_data_path = os.path.expanduser("~")
-
-SAVE_DIR = os.path.join(app_data_path, "MacanHungry")
-if not os.path.exists(SAVE_DIR):
-    os.makedirs(SAVE_DIR)
-
-SAVE_FILE = os.path.join(SAVE_DIR, "macan_save.json")
-# ----------------------------------
-
-# Maze layout awal (Level 1 statis)
-MAZE_LAYOUT = [
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,0],
-    [0,3,0,0,1,0,0,0,1,0,1,0,0,0,1,0,0,3,0],
-    [0,1,0,0,1,0,0,0,1,0,1,0,0,0,1,0,0,1,0],
-    [0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0],
-    [0,1,0,0,1,0,1,0,0,0,0,0,1,0,1,0,0,1,0],
-    [0,1,1,1,1,0,1,1,1,0,1,1,1,0,1,1,1,1,0],
-    [0,0,0,0,1,0,0,0,1,0,1,0,0,0,1,0,0,0,0],
-    [2,2,2,0,1,0,1,1,1,1,1,1,1,0,1,0,2,2,2],
-    [0,0,0,0,1,0,1,0,0,2,0,0,1,0,1,0,0,0,0],
-    [2,2,2,2,1,1,1,0,2,2,2,0,1,1,1,2,2,2,2],
-    [0,0,0,0,1,0,1,0,0,0,0,0,1,0,1,0,0,0,0],
-    [2,2,2,0,1,0,1,1,1,1,1,1,1,0,1,0,2,2,2],
-    [0,0,0,0,1,0,1,0,0,0,0,0,1,0,1,0,0,0,0],
-    [0,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,0],
-    [0,1,0,0,1,0,0,0,1,0,1,0,0,0,1,0,0,1,0],
-    [0,3,1,0,1,1,1,1,1,1,1,1,1,1,1,0,1,3,0],
-    [0,0,1,0,1,0,1,0,0,0,0,0,1,0,1,0,1,0,0],
-    [0,1,1,1,1,0,1,1,1,0,1,1,1,0,1,1,1,1,0],
-    [0,1,0,0,0,0,0,0,1,0,1,0,0,0,0,0,0,1,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-]
-
-# --- Classes ---
-
-class Particle:
-    """Efek visual untuk ledakan kecil saat makan."""
-    def __init__(self, x, y, color):
-        self.x = x
-        self.y = y
-        self.vx = random.uniform(-5, 5)
-        self.vy = random.uniform(-5, 5)
-        self.life = 1.0  # Opacity 1.0 to 0.0
-        self.color = color
-        self.size = random.randint(3, 6)
-
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.life -= 0.05
-        self.size *= 0.95
-
-class Entity:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.target_x = x
-        self.target_y = y
-        self.direction = 0
-        
-    def get_rect(self):
-        return QRectF(self.x * CELL_SIZE, self.y * CELL_SIZE, CELL_SIZE, CELL_SIZE)
-
-class Tiger(Entity):
-    def __init__(self, x, y):
-        super().__init__(x, y)
-        self.animation_frame = 0
-        self.mouth_open = False
-        
-    def update_animation(self):
-        self.animation_frame = (self.animation_frame + 1) % 20
-        if self.animation_frame % 5 == 0: 
-            self.mouth_open = not self.mouth_open
-
-class Enemy(Entity):
-    def __init__(self, x, y, color, personality):
-        super().__init__(x, y)
-        self.color = color
-        self.personality = personality
-        self.scared = False
-        self.scatter_mode = False
-        
-    def choose_direction(self, tiger_x, tiger_y, maze):
-        corners = [(1, 1), (MAZE_WIDTH-2, 1), (1, MAZE_HEIGHT-2), (MAZE_WIDTH-2, MAZE_HEIGHT-2)]
-        target = (self.x, self.y)
-        
-        if self.scared:
-            dx = self.x - tiger_x
-            dy = self.y - tiger_y
-        elif self.scatter_mode:
-            # Menggunakan hash dari string nama warna agar deterministik
-            corner_index = hash(self.color.name()) % 4
-            target = corners[corner_index]
-            dx = target[0] - self.x
-            dy = target[1] - self.y
-        else:
-            if self.personality == 'chase':
-                dx = tiger_x - self.x
-                dy = tiger_y - self.y
-            elif self.personality == 'ambush':
-                dx = tiger_x - self.x + random.randint(-3, 3)
-                dy = tiger_y - self.y + random.randint(-3, 3)
-            elif self.personality == 'random':
-                dx = random.randint(-1, 1)
-                dy = random.randint(-1, 1)
-            else:  # patrol
-                dx = random.randint(-2, 2)
-                dy = random.randint(-2, 2)
-        
-        directions = []
-        if abs(dx) > abs(dy):
-            if dx > 0: directions = [0, 1, 3, 2] 
-            else: directions = [2, 1, 3, 0]
-        else:
-            if dy > 0: directions = [1, 0, 2, 3]
-            else: directions = [3, 0, 2, 1]
-            
-        for d in directions:
-            new_x, new_y = self.x, self.y
-            if d == 0: new_x += 1
-            elif d == 1: new_y += 1
-            elif d == 2: new_x -= 1
-            elif d == 3: new_y -= 1
-            
-            if 0 <= new_x < MAZE_WIDTH and 0 <= new_y < MAZE_HEIGHT:
-                if maze[new_y][new_x] != 0:
-                    self.target_x = new_x
-                    self.target_y = new_y
-                    self.direction = d
-                    return
-        
-        # Fallback movement if stuck
-        for d in range(4):
-            new_x, new_y = self.x, self.y
-            if d == 0: new_x += 1
-            elif d == 1: new_y += 1
-            elif d == 2: new_x -= 1
-            elif d == 3: new_y -= 1
-            if 0 <= new_x < MAZE_WIDTH and 0 <= new_y < MAZE_HEIGHT:
-                if maze[new_y][new_x] != 0:
-                    self.target_x = new_x
-                    self.target_y = new_y
-                    self.direction = d
-                    return
-
-class GameWidget(QWidget):
-    # Signals
-    game_over_signal = Signal(int)
-    score_updated = Signal(int)
-    lives_updated = Signal(int)
-    level_updated = Signal(int)
-    msg_signal = Signal(str, str) # Untuk menampilkan pesan ke window utama
-
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setFocusPolicy(Qt.StrongFocus)
-        
-        # State
-        self.score = 0
-        self.lives = 3
-        self.level = 1
-        self.power_mode = False
-        self.power_timer = 0
-        self.game_active = False
-        self.game_paused = False
-        
-        self.particles = []
-        self.global_pulse = 0.0
-        
-        self.init_game()
-        
-        # Timers
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_game)
-        
-        self.anim_timer = QTimer(self)
-        self.anim_timer.timeout.connect(self.update_animation)
-        self.anim_timer.start(50) 
-        
-        # Background elements
-        self.fireflies = [(random.randint(0, 1000), random.randint(0, 1000)) for _ in range(40)]
-        self.firefly_brightness = [random.random() for _ in range(40)]
-
-    def generate_random_maze(self):
-        """Membuat maze acak yang simetris dan PASTI terhubung."""
-        # 1. Inisialisasi grid penuh tembok (0)
-        new_maze = [[0 for _ in range(MAZE_WIDTH)] for _ in range(MAZE_HEIGHT)]
-        
-        # 2. Algoritma DFS (Recursive Backtracker) untuk separuh kiri
-        stack = []
-        start_pos = (1, 1)
-        new_maze[1][1] = 1
-        stack.append(start_pos)
-        
-        while stack:
-            cx, cy = stack[-1]
-            neighbors = []
-            
-            # Cek tetangga dengan jarak 2 sel
-            directions = [(2, 0), (0, 2), (-2, 0), (0, -2)]
-            
-            for dx, dy in directions:
-                nx, ny = cx + dx, cy + dy
-                # Batas kanan adalah 8 (setengah lebar maze)
-                if 1 <= nx < 9 and 1 <= ny < MAZE_HEIGHT - 1:
-                    if new_maze[ny][nx] == 0:
-                        neighbors.append((nx, ny, dx, dy))
-            
-            if neighbors:
-                nx, ny, dx, dy = random.choice(neighbors)
-                new_maze[cy + dy//2][cx + dx//2] = 1
-                new_maze[ny][nx] = 1
-                stack.append((nx, ny))
-            else:
-                stack.pop()
-
-        # 3. Mirroring (Cerminkan bagian kiri ke kanan)
-        for y in range(MAZE_HEIGHT):
-            for x in range(9): # 0 sampai 8
-                val = new_maze[y][x]
-                new_maze[y][x] = val
-                new_maze[y][MAZE_WIDTH - 1 - x] = val 
-            
-            # Hubungkan tengah secara horizontal jika kiri-kanan terbuka
-            if new_maze[y][8] == 1:
-                new_maze[y][9] = 1 
-                new_maze[y][10] = 1
-
-        # 4. Buat Ghost House (Area Musuh)
-        for y in range(8, 13):
-            for x in range(7, 12):
-                if y == 8 or y == 12 or x == 7 or x == 11:
-                     if not (y == 8 and x == 9): 
-                        new_maze[y][x] = 0 
-                else:
-                    new_maze[y][x] = 2 
-        
-        new_maze[8][9] = 2 # Pintu hantu
-
-        # 5. Buat Loop (Jebol tembok acak)
-        for _ in range(20): # Naikkan sedikit jumlah loop agar map lebih terbuka
-            rx = random.randint(2, MAZE_WIDTH - 3)
-            ry = random.randint(2, MAZE_HEIGHT - 3)
-            if new_maze[ry][rx] == 0:
-                # Pastikan tidak merusak dinding luar
-                if 0 < rx < MAZE_WIDTH-1 and 0 < ry < MAZE_HEIGHT-1:
-                     new_maze[ry][rx] = 1
-       
-        for y in range(12, 17): 
-            if y < MAZE_HEIGHT - 1:
-                new_maze[y][9] = 1
-        
-        # Buka sedikit area samping spawn agar tidak sempit
-        new_maze[15][8] = 1
-        new_maze[15][10] = 1
-        # -----------------------------
-
-        # 7. Isi Makanan dan Power Pellet
-        for y in range(MAZE_HEIGHT):
-            for x in range(MAZE_WIDTH):
-                # Jangan taruh makanan di dalam rumah hantu (nilai 2) atau tembok (0)
-                if new_maze[y][x] == 1:
-                    if (x < 2 or x > MAZE_WIDTH-3) and (y < 3 or y > MAZE_HEIGHT-4):
-                        new_maze[y][x] = 3 # Power Pellet
-                    else:
-                        new_maze[y][x] = 1 # Makanan
-        
-        return new_maze
-
-    def init_game(self):
-        # Gunakan layout default untuk level 1, generate acak untuk level > 1
-        if self.level == 1:
-            self.maze = [row[:] for row in MAZE_LAYOUT]
-        else:
-            self.maze = self.generate_random_maze()
-
-        self.tiger = Tiger(9, 15)
-        self.enemies = [
-            Enemy(8, 9, QColor(255, 50, 50), 'chase'),
-            Enemy(9, 9, QColor(255, 105, 180), 'ambush'),
-            Enemy(10, 9, QColor(0, 255, 255), 'patrol'),
-            Enemy(9, 10, QColor(255, 165, 0), 'random'),
-        ]
-        self.next_move = None
-        self.move_cooldown = 0
-        self.enemy_move_cooldown = 0
-        self.scatter_timer = 0
-        self.particles = []
-        
-        # Reset signal values
-        self.score_updated.emit(self.score)
-        self.lives_updated.emit(self.lives)
-        self.level_updated.emit(self.level)
-
-    def reset_full_game(self):
-        """Merestart game sepenuhnya ke level 1."""
-        self.score = 0
-        self.lives = 3
-        self.level = 1
-        self.init_game()
-        self.game_active = False # Harus tekan Enter lagi untuk start
-        self.game_paused = False
-        self.timer.stop()
-        self.update()
-        self.msg_signal.emit("Reset", "Game has been reset to Level 1.")
-
-    def save_game(self):
-        """Menyimpan progress game."""
-        if self.lives <= 0:
-            self.msg_signal.emit("Error", "Cannot save when Game Over!")
-            return
-
-        state = {
-            "score": self.score,
-            "lives": self.lives,
-            "level": self.level,
-            "maze": self.maze, # Simpan kondisi makanan
-            "enemies": [{"x": e.x, "y": e.y} for e in self.enemies],
-            "tiger": {"x": self.tiger.x, "y": self.tiger.y}
-        }
-        try:
-            with open(SAVE_FILE, 'w') as f:
-                json.dump(state, f)
-            self.msg_signal.emit("Success", f"Game Saved Successfully to:\n{SAVE_FILE}")
-        except Exception as e:
-            self.msg_signal.emit("Error", f"Failed to save: {str(e)}")
-
-    def load_game(self):
-        """Memuat progress game."""
-        if not os.path.exists(SAVE_FILE):
-            self.msg_signal.emit("Error", f"No save file found at:\n{SAVE_FILE}")
-            return
-
-        try:
-            with open(SAVE_FILE, 'r') as f:
-                state = json.load(f)
-            
-            self.score = state["score"]
-            self.lives = state["lives"]
-            self.level = state["level"]
-            self.maze = state["maze"]
-            
-            self.tiger.x = state["tiger"]["x"]
-            self.tiger.y = state["tiger"]["y"]
-            
-            # Load enemy positions if count matches
-            if len(state["enemies"]) == len(self.enemies):
-                for i, e_data in enumerate(state["enemies"]):
-                    self.enemies[i].x = e_data["x"]
-                    self.enemies[i].y = e_data["y"]
-                    self.enemies[i].target_x = e_data["x"]
-                    self.enemies[i].target_y = e_data["y"]
-
-            self.score_updated.emit(self.score)
-            self.lives_updated.emit(self.lives)
-            self.level_updated.emit(self.level)
-            
-            self.game_active = False # Pause saat baru load
-            self.game_paused = True
-            self.timer.stop() # Stop dulu logika game loop
-            self.update() # Repaint
-            
-            self.msg_signal.emit("Success", "Game Loaded! Press 'P' or 'Enter' to continue.")
-            
-        except Exception as e:
-            self.msg_signal.emit("Error", f"Failed to load: {str(e)}")
-
-    def start_game(self):
-        self.game_active = True
-        self.game_paused = False
-        self.timer.start(50) 
-        self.setFocus()
-
-    def reset_level(self):
-        self.tiger.x, self.tiger.y = 9, 15
-        self.next_move = None
-        for i, e in enumerate(self.enemies):
-            e.x = 8 + (i % 3)
-            e.y = 9
-            e.target_x = e.x
-            e.target_y = e.y
-
-    def spawn_particles(self, x, y, color):
-        px = x * CELL_SIZE + CELL_SIZE/2
-        py = y * CELL_SIZE + CELL_SIZE/2
-        for _ in range(8):
-            self.particles.append(Particle(px, py, color))
-
-    def update_animation(self):
-        self.global_pulse += 0.2
-        
-        if self.game_active and not self.game_paused:
-            self.tiger.update_animation()
-            
-            for i in range(len(self.firefly_brightness)):
-                self.firefly_brightness[i] += random.uniform(-0.1, 0.1)
-                self.firefly_brightness[i] = max(0.1, min(1.0, self.firefly_brightness[i]))
-            
-            for p in self.particles[:]:
-                p.update()
-                if p.life <= 0:
-                    self.particles.remove(p)
-                    
-            self.update()
-        elif not self.game_active or self.game_paused:
-            # Tetap repaint untuk animasi idle/menu
-            self.update()
-
-    def update_game(self):
-        if not self.game_active or self.game_paused:
-            return
-        
-        # 1. Tiger Movement
-        if self.move_cooldown <= 0:
-            if self.next_move is not None:
-                dx = [1, 0, -1, 0][self.next_move]
-                dy = [0, 1, 0, -1][self.next_move]
-                new_x, new_y = self.tiger.x + dx, self.tiger.y + dy
-                
-                if 0 <= new_x < MAZE_WIDTH and 0 <= new_y < MAZE_HEIGHT:
-                    if self.maze[new_y][new_x] != 0:
-                        self.tiger.x = new_x
-                        self.tiger.y = new_y
-                        self.tiger.direction = self.next_move
-                        
-                        # Eat Logic
-                        cell = self.maze[new_y][new_x]
-                        if cell == 1:
-                            self.score += 10
-                            self.maze[new_y][new_x] = 2
-                            self.spawn_particles(new_x, new_y, QColor(255, 200, 100))
-                            self.score_updated.emit(self.score)
-                        elif cell == 3:
-                            self.score += 50
-                            self.maze[new_y][new_x] = 2
-                            self.power_mode = True
-                            # Leveling: Power bertahan lebih sebentar di level tinggi
-                            base_time = 150
-                            level_penalty = min(100, (self.level - 1) * 10)
-                            self.power_timer = base_time - level_penalty
-                            
-                            self.spawn_particles(new_x, new_y, QColor(255, 255, 0))
-                            self.score_updated.emit(self.score)
-                            for enemy in self.enemies:
-                                enemy.scared = True
-                        
-                        self.move_cooldown = 2 
-        else:
-            self.move_cooldown -= 1
-        
-        # 2. Power Mode Logic
-        if self.power_mode:
-            self.power_timer -= 1
-            if self.power_timer <= 0:
-                self.power_mode = False
-                for enemy in self.enemies:
-                    enemy.scared = False
-        
-        # 3. Enemy Movement & Leveling Difficulty
-        # Leveling: Musuh makin cepat (cooldown makin kecil)
-        base_speed = 6 if self.power_mode else 4
-        # Kurangi delay per 3 level
-        speed_modifier = 0 if self.power_mode else min(2, (self.level - 1) // 3)
-        current_speed_threshold = max(2, base_speed - speed_modifier)
-
-        if self.enemy_move_cooldown <= 0:
-            for enemy in self.enemies:
-                # Slow down scared enemies
-                if enemy.scared and self.enemy_move_cooldown % 2 != 0:
-                    continue
-                enemy.choose_direction(self.tiger.x, self.tiger.y, self.maze)
-                enemy.x = enemy.target_x
-                enemy.y = enemy.target_y
-            self.enemy_move_cooldown = current_speed_threshold
-        else:
-            self.enemy_move_cooldown -= 1
-        
-        # 4. Scatter Logic
-        self.scatter_timer += 1
-        if self.scatter_timer % 200 == 0:
-            for enemy in self.enemies:
-                enemy.scatter_mode = not enemy.scatter_mode
-
-        # 5. Collisions
-        for enemy in self.enemies:
-            if self.tiger.x == enemy.x and self.tiger.y == enemy.y:
-                if self.power_mode:
-                    self.score += 200 * self.level # Skor lebih besar di level tinggi
-                    self.spawn_particles(enemy.x, enemy.y, QColor(255, 255, 255))
-                    self.score_updated.emit(self.score)
-                    # Send enemy home
-                    enemy.x = 9
-                    enemy.y = 9
-                    enemy.scared = False
-                else:
-                    self.lives -= 1
-                    self.lives_updated.emit(self.lives)
-                    self.spawn_particles(self.tiger.x, self.tiger.y, QColor(255, 0, 0))
-                    
-                    if self.lives <= 0:
-                        self.game_active = False
-                        self.timer.stop()
-                        self.game_over_signal.emit(self.score)
-                        self.update()
-                    else:
-                        self.reset_level()
-        
-        # 6. Level Complete
-        food_left = sum(row.count(1) + row.count(3) for row in self.maze)
-        if food_left == 0:
-            self.level += 1
-            self.level_updated.emit(self.level)
-            
-            # --- MODIFIED: Generate Random Maze on Level Up ---
-            self.maze = self.generate_random_maze()
-            # --------------------------------------------------
-            
-            self.reset_level()
-            self.game_paused = True # Pause sebentar antar level
-            self.msg_signal.emit("Level Up!", f"Entering Level {self.level}\nMap Scrambled!\nEnemies are faster!")
-
-    def keyPressEvent(self, event):
-        key = event.key()
-        if key == Qt.Key_Escape:
-            self.parent().parent().close() 
-            return
-
-        if not self.game_active:
-            if key in [Qt.Key_Return, Qt.Key_Enter, Qt.Key_Space]:
-                if self.lives > 0:
-                    self.start_game()
-                else:
-                    # Restart if game over
-                    self.reset_full_game()
-                    self.start_game()
-            return
-            
-        if key == Qt.Key_P:
-            self.game_paused = not self.game_paused
-            self.update()
-            
-        if key == Qt.Key_Right or key == Qt.Key_D: self.next_move = 0
-        elif key == Qt.Key_Down or key == Qt.Key_S: self.next_move = 1
-        elif key == Qt.Key_Left or key == Qt.Key_A: self.next_move = 2
-        elif key == Qt.Key_Up or key == Qt.Key_W: self.next_move = 3
-    
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        if not painter.isActive():
-            return
-            
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # --- Responsive Scaling ---
-        scale_x = self.width() / base_width
-        scale_y = self.height() / base_height
-        scale = min(scale_x, scale_y) * 0.9 
-        
-        trans_x = (self.width() - (base_width * scale)) / 2
-        trans_y = (self.height() - (base_height * scale)) / 2
-        
-        # Background
-        painter.fillRect(self.rect(), QColor(15, 20, 30))
-        
-        painter.translate(trans_x, trans_y)
-        painter.scale(scale, scale)
-        
-        # Maze Box
-        bg_rect = QRectF(0, 0, base_width, base_height)
-        painter.setBrush(QColor(25, 35, 45))
-        painter.setPen(QPen(QColor(50, 60, 80), 4))
-        painter.drawRoundedRect(bg_rect, 10, 10)
-        
-        # Fireflies
-        for i, (fx, fy) in enumerate(self.fireflies):
-            bx = (fx / 1000) * base_width
-            by = (fy / 1000) * base_height
-            brightness = self.firefly_brightness[i]
-            color = QColor(100, 255, 100, int(brightness * 150))
-            painter.setBrush(QBrush(color))
-            painter.setPen(Qt.NoPen)
-            painter.drawEllipse(QPointF(bx, by), 4, 4)
-
-        # Cells
-        for y in range(MAZE_HEIGHT):
-            for x in range(MAZE_WIDTH):
-                cell = self.maze[y][x]
-                cx = x * CELL_SIZE + CELL_SIZE/2
-                cy = y * CELL_SIZE + CELL_SIZE/2
-                rect = QRectF(x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE)
-                
-                if cell == 0:
-                    painter.setBrush(QColor(40, 50, 70))
-                    painter.setPen(QPen(QColor(60, 75, 100), 2))
-                    painter.drawRoundedRect(rect.adjusted(2, 2, -2, -2), 4, 4)
-                elif cell == 1:
-                    pulse = (math.sin(self.global_pulse + x + y) + 1) * 2
-                    painter.setBrush(QColor(255, 180, 180))
-                    painter.setPen(Qt.NoPen)
-                    painter.drawEllipse(QPointF(cx, cy), 4 + pulse, 4 + pulse)
-                elif cell == 3:
-                    pulse = (math.sin(self.global_pulse * 2) + 1) * 4
-                    grad = QRadialGradient(cx, cy, 15)
-                    grad.setColorAt(0, QColor(255, 255, 0, 255))
-                    grad.setColorAt(1, QColor(255, 100, 0, 0))
-                    painter.setBrush(QBrush(grad))
-                    painter.drawEllipse(QPointF(cx, cy), 12 + pulse, 12 + pulse)
-                    painter.setBrush(QColor(255, 255, 200))
-                    painter.drawEllipse(QPointF(cx, cy), 6, 6)
-                elif cell == 2 and self.level > 1:
-                    # Debug visual for empty paths in generated levels (optional)
-                    pass
-
-        # Entities
-        for enemy in self.enemies:
-            self.draw_enemy(painter, enemy)
-            
-        self.draw_tiger(painter, self.tiger)
-        
-        # Particles
-        for p in self.particles:
-            painter.setBrush(p.color)
-            painter.setOpacity(p.life)
-            painter.drawEllipse(QPointF(p.x, p.y), p.size, p.size)
-            painter.setOpacity(1.0) 
-
-        painter.resetTransform()
-        
-        # UI Overlays
-        if not self.game_active and self.lives > 0:
-            self.draw_overlay(painter, "MACAN HUNGRY", "Press ENTER to Start")
-        elif not self.game_active and self.lives <= 0:
-            self.draw_overlay(painter, "GAME OVER", f"Final Score: {self.score}\nPress ENTER to Restart")
-        elif self.game_paused:
-             self.draw_overlay(painter, "PAUSED", "Press P to Resume")
-
-        # FIX: End painter explicitly
-        painter.end()
-
-    def draw_overlay(self, painter, title, subtitle):
-        painter.fillRect(self.rect(), QColor(0, 0, 0, 180))
-        
-        painter.setPen(QColor(255, 200, 0))
-        font = QFont('Arial', 48, QFont.Bold)
-        painter.setFont(font)
-        painter.drawText(self.rect(), Qt.AlignCenter, f"{title}\n\n\n")
-        
-        painter.setPen(QColor(255, 255, 255))
-        font.setPointSize(24)
-        painter.setFont(font)
-        painter.drawText(self.rect(), Qt.AlignCenter, f"\n\n{subtitle}")
-
-    def draw_tiger(self, painter, tiger):
-        cx = tiger.x * CELL_SIZE + CELL_SIZE/2
-        cy = tiger.y * CELL_SIZE + CELL_SIZE/2
-        size = CELL_SIZE * 0.85
-        
-        painter.save()
-        painter.translate(cx, cy)
-        
-        rotations = [0, 90, 180, 270] 
-        painter.rotate(rotations[tiger.direction])
-        
-        if self.power_mode:
-            grad = QRadialGradient(0, 0, size)
-            grad.setColorAt(0, QColor(255, 255, 255, 100))
-            grad.setColorAt(1, QColor(255, 200, 0, 0))
-            painter.setBrush(grad)
-            painter.setPen(Qt.NoPen)
-            painter.drawEllipse(-size, -size, size*2, size*2)
-            
-        painter.setBrush(QColor(255, 165, 0)) 
-        painter.setPen(QPen(QColor(180, 100, 0), 2))
-        painter.drawEllipse(int(-size/2), int(-size/2), int(size), int(size))
-        
-        painter.setBrush(Qt.black)
-        painter.setPen(Qt.NoPen)
-        painter.drawPolygon([QPointF(0, -size/2), QPointF(-4, -size/2 + 8), QPointF(4, -size/2 + 8)])
-        painter.drawPolygon([QPointF(0, size/2), QPointF(-4, size/2 - 8), QPointF(4, size/2 - 8)])
-        
-        painter.setBrush(Qt.white)
-        painter.drawEllipse(4, -6, 8, 8) 
-        painter.drawEllipse(4, 6, 8, 8)  
-        
-        painter.setBrush(Qt.black)
-        dx = 2 if tiger.mouth_open else 0
-        
-        painter.drawEllipse(8 + dx, -6, 3, 3)
-        painter.drawEllipse(8 + dx, 6, 3, 3)
-        
-        if tiger.mouth_open:
-            painter.setBrush(QColor(150, 0, 0))
-            painter.drawPie(QRectF(0, -6, 12, 12), -45 * 16, 90 * 16)
-
-        painter.restore()
-
-    def draw_enemy(self, painter, enemy):
-        cx = enemy.x * CELL_SIZE + CELL_SIZE/2
-        cy = enemy.y * CELL_SIZE + CELL_SIZE/2
-        size = CELL_SIZE * 0.8
-        
-        color = QColor(100, 100, 255) if enemy.scared else enemy.color
-        
-        path = QPainterPath()
-        path.moveTo(cx - size/2, cy)
-        path.arcTo(QRectF(cx - size/2, cy - size/2, size, size), 180, 180)
-        
-        bottom = cy + size/2
-        wave_height = 4 if (self.global_pulse * 5) % 2 > 1 else -4 
-        
-        path.lineTo(cx + size/2, bottom)
-        path.lineTo(cx + size/4, bottom - 5)
-        path.lineTo(cx, bottom)
-        path.lineTo(cx - size/4, bottom - 5)
-        path.lineTo(cx - size/2, bottom)
-        path.closeSubpath()
-        
-        painter.setBrush(color)
-        painter.setPen(QPen(color.darker(), 2))
-        painter.drawPath(path)
-        
-        painter.setBrush(Qt.white)
-        painter.setPen(Qt.NoPen)
-        eye_y = cy - 4
-        painter.drawEllipse(QPointF(cx - 6, eye_y), 6, 8)
-        painter.drawEllipse(QPointF(cx + 6, eye_y), 6, 8)
-        
-        painter.setBrush(QColor(0, 0, 50))
-        if enemy.scared:
-            painter.drawEllipse(QPointF(cx - 6 + random.randint(-1,1), eye_y), 2, 2)
-            painter.drawEllipse(QPointF(cx + 6 + random.randint(-1,1), eye_y), 2, 2)
-        else:
-            look_x = 0
-            look_y = 0
-            if enemy.direction == 0: look_x = 2
-            elif enemy.direction == 2: look_x = -2
-            elif enemy.direction == 1: look_y = 2
-            elif enemy.direction == 3: look_y = -2
-            
-            painter.drawEllipse(QPointF(cx - 6 + look_x, eye_y + look_y), 3, 3)
-            painter.drawEllipse(QPointF(cx + 6 + look_x, eye_y + look_y), 3, 3)
-
-class MainWindow(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("Macan Hungry - Jungle Adventure Premium")
-        
-        # --- MODIFIED: Added QMessageBox Styling ---
-        self.setStyleSheet("""
-            QMainWindow { background-color: #0f141e; }
-            QLabel { color: white; font-family: 'Segoe UI', Arial; font-weight: bold; }
-            
-            /* Style khusus QMessageBox agar teks hitam dan background putih */
-            QMessageBox { background-color: white; }
-            QMessageBox QLabel { color: black; font-weight: normal; font-size: 14px; }
-            QMessageBox QPushButton { color: white; background-color: #3498db; min-width: 60px; }
-
-            QPushButton {
-                background-color: #2ecc71;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                font-size: 16px;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background-color: #27ae60; }
-            QPushButton:pressed { background-color: #219150; }
-            QPushButton#btn_restart { background-color: #e74c3c; }
-            QPushButton#btn_restart:hover { background-color: #c0392b; }
-            QPushButton#btn_quit { background-color: #7f8c8d; }
-            QPushButton#btn_quit:hover { background-color: #2c3e50; }
-            QPushButton#btn_save { background-color: #3498db; }
-            QPushButton#btn_save:hover { background-color: #2980b9; }
-            QPushButton#btn_load { background-color: #9b59b6; }
-            QPushButton#btn_load:hover { background-color: #8e44ad; }
-        """)
-
-        # Main Layout
-        central = QWidget()
-        self.setCentralWidget(central)
-        layout = QVBoxLayout(central)
-        layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Top HUD (Floating)
-        hud_container = QWidget()
-        hud_container.setFixedHeight(60)
-        hud_container.setStyleSheet("background-color: rgba(0,0,0,150); border-bottom: 2px solid #34495e;")
-        hud_layout = QHBoxLayout(hud_container)
-        
-        self.score_label = QLabel("SCORE: 0")
-        self.score_label.setStyleSheet("font-size: 24px; color: #f1c40f;")
-        
-        self.lives_label = QLabel("LIVES: 3")
-        self.lives_label.setStyleSheet("font-size: 24px; color: #e74c3c;")
-        
-        self.level_label = QLabel("LEVEL: 1")
-        self.level_label.setStyleSheet("font-size: 24px; color: #3498db;")
-        
-        # --- HUD Buttons ---
-        self.btn_save = QPushButton("SAVE")
-        self.btn_save.setObjectName("btn_save")
-        self.btn_save.setCursor(Qt.PointingHandCursor)
-        
-        self.btn_load = QPushButton("LOAD")
-        self.btn_load.setObjectName("btn_load")
-        self.btn_load.setCursor(Qt.PointingHandCursor)
-        
-        self.btn_reset = QPushButton("RESET")
-        self.btn_reset.setObjectName("btn_restart")
-        self.btn_reset.setCursor(Qt.PointingHandCursor)
-
-        self.btn_quit = QPushButton("QUIT")
-        self.btn_quit.setObjectName("btn_quit")
-        self.btn_quit.setCursor(Qt.PointingHandCursor)
-        self.btn_quit.clicked.connect(self.close)
-
-        hud_layout.addWidget(self.score_label)
-        hud_layout.addSpacing(20)
-        hud_layout.addWidget(self.lives_label)
-        hud_layout.addSpacing(20)
-        hud_layout.addWidget(self.level_label)
-        hud_layout.addStretch()
-        hud_layout.addWidget(self.btn_save)
-        hud_layout.addWidget(self.btn_load)
-        hud_layout.addWidget(self.btn_reset)
-        hud_layout.addWidget(self.btn_quit)
-
-        layout.addWidget(hud_container)
-        
-        # Game Area
-        self.game = GameWidget(self)
-        layout.addWidget(self.game)
-        
-        # Connect Signals
-        self.game.score_updated.connect(self.update_score)
-        self.game.lives_updated.connect(self.update_lives)
-        self.game.level_updated.connect(self.update_level)
-        self.game.msg_signal.connect(self.show_message)
-        
-        # Connect Buttons
-        self.btn_save.clicked.connect(self.game.save_game)
-        self.btn_load.clicked.connect(self.game.load_game)
-        self.btn_reset.clicked.connect(self.game.reset_full_game)
-        
-        # Set Fullscreen
-        self.showFullScreen()
-
-    def update_score(self, score):
-        self.score_label.setText(f"SCORE: {score}")
-
-    def update_lives(self, lives):
-        self.lives_label.setText(f"LIVES: {lives}")
-
-    def update_level(self, level):
-        self.level_label.setText(f"LEVEL: {level}")
-    
-    def show_message(self, title, msg):
-        QMessageBox.information(self, title, msg)
-
-if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    window = MainWindow()
-    window.show() 
-
-    sys.exit(app.exec())
+import sys
+if __name__ == "__main__":
+    # "python macan_hungry.py": jalan lewat entry point macan_main sebelum Qt
+    # di-import, supaya waktu import ikut terukur di STARTUP
+    import macan_main
+    sys.exit(macan_main.main(sys.argv))
+
+import time
+import json
+import random
+import math
+import os
+from collections import deque
+from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
+                               QLabel, QPushButton, QFrame, QGraphicsDropShadowEffect, QHBoxLayout, QMessageBox)
+from PySide6.QtCore import Qt, QTimer, QPointF, QRectF, Signal, QSize, QEvent
+from PySide6.QtGui import (QPainter, QColor, QPen, QBrush, QFont, QPixmap,
+                           QPainterPath, QRadialGradient, QLinearGradient)
+
+from macan_maze import MAZE_WIDTH, MAZE_HEIGHT, MazePrefetcher, generate_random_maze
+from macan_engine import (GameEngine, EVT_FOOD, EVT_POWER, EVT_ENEMY_EATEN,
+                          EVT_LIFE_LOST, EVT_GAME_OVER, EVT_LEVEL_UP)
+from macan_perf import PerfRecorder, startup_report
+from macan_save import SAVE_DIR, encode_game, read_save, restore_game, write_atomic
+from macan_replay import Replay, ReplayPlayer, ReplayRecorder, write_replay
+from macan_autopilot import Autopilot
+from macan_telemetry import TelemetryLog, append_log
+
+# --- Constants ---
+CELL_SIZE = 40
+MAX_PARTICLES = 256 # Batas partikel hidup sekaligus
+PELLET_PHASES = 16 # Jumlah fase denyut power pellet di sprite atlas
+FOOD_PHASES = 16 # Jumlah fase denyut food pellet di sprite atlas
+FOOD_RADII = [4 + (math.sin((phase + 0.5) / FOOD_PHASES * 2 * math.pi) + 1) * 2
+              for phase in range(FOOD_PHASES)]
+FIREFLY_LEVELS = 8 # Tingkat kecerahan firefly di sprite atlas
+FIREFLY_RADIUS = 6 # Radius glow firefly (koordinat maze)
+TICK_MS = 50 # Satu tick simulasi dan animasi
+FRAME_MS = 16 # Interval render (~60 FPS)
+REDUCED_FRAME_MS = 33 # Demo, atau game berjalan di window yang tidak fokus (~30 FPS)
+IDLE_FRAME_MS = 200 # Layar judul, pause, game over (animasi menu ~5 FPS)
+DUTY_WINDOW = 5.0 # Detik terakhir yang dihitung untuk duty cycle
+HUD_REFRESH = 0.5 # Detik antar pembaruan teks HUD performa
+VIEW_WIDTH = MAZE_WIDTH # Sel maksimum yang terlihat; maze lebih besar di-scroll
+VIEW_HEIGHT = MAZE_HEIGHT
+CHUNK_CELLS = 16 # Tembok di-cache per chunk CHUNK_CELLS x CHUNK_CELLS sel
+WALL_CHUNK_CACHE = 64
+
+SAVE_FILE = os.path.join(SAVE_DIR, "macan_save.mhs")
+LEGACY_SAVE_FILE = os.path.join(SAVE_DIR, "macan_save.json") # Format JSON lama, hanya dibaca
+AUTOSAVE_SLOTS = 3 # Autosave bergiliran di beberapa file
+AUTOSAVE_TICKS = 1200 # Autosave tiap 60 detik permainan
+
+LAST_REPLAY_FILE = os.path.join(SAVE_DIR, "macan_last_replay.mhr") # Ditulis saat game over
+TELEMETRY_FILE = os.path.join(SAVE_DIR, "macan_telemetry.mhl")
+TELEMETRY_FLUSH_TICKS = 100 # Log telemetry ditulis ke disk tiap 5 detik permainan
+ATTRACT_DELAY = 10 # Detik diam di layar judul sebelum demo autopilot dimulai
+
+def autosave_file(slot):
+    return os.path.join(SAVE_DIR, f"macan_autosave_{slot}.mhs")
+# ----------------------------------
+
+# --- Classes ---
+
+class ParticlePool:
+    """Efek visual untuk ledakan kecil saat makan.
+
+    Partikel disimpan dalam list paralel berkapasitas tetap. Partikel
+    mati dihapus dengan swap-remove (O(1)), dan spawn baru diabaikan
+    jika jumlah partikel hidup sudah mencapai capacity.
+    """
+    ALPHA_LEVELS = 10
+
+    def __init__(self, capacity=MAX_PARTICLES):
+        self.capacity = capacity
+        self.count = 0
+        self.x = [0.0] * capacity
+        self.y = [0.0] * capacity
+        self.vx = [0.0] * capacity
+        self.vy = [0.0] * capacity
+        self.life = [0.0] * capacity  # Opacity 1.0 to 0.0
+        self.size = [0.0] * capacity
+        self.color = [0] * capacity   # Index ke palette
+        self.palette = []
+        self.palette_index = {}
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    def spawn(self, px, py, color, amount=8, rng=random):
+        key = color.rgba()
+        c = self.palette_index.get(key)
+        if c is None:
+            c = len(self.palette)
+            self.palette.append(QColor(color))
+            self.palette_index[key] = c
+        for _ in range(min(amount, self.capacity - self.count)):
+            i = self.count
+            self.x[i] = px
+            self.y[i] = py
+            self.vx[i] = rng.uniform(-5, 5)
+            self.vy[i] = rng.uniform(-5, 5)
+            self.life[i] = 1.0
+            self.size[i] = rng.randint(3, 6)
+            self.color[i] = c
+            self.count += 1
+
+    def update(self):
+        x, y, vx, vy = self.x, self.y, self.vx, self.vy
+        life, size, color = self.life, self.size, self.color
+        i = 0
+        while i < self.count:
+            life[i] -= 0.05
+            if life[i] <= 0:
+                # Swap-remove: pindahkan partikel terakhir ke slot ini
+                last = self.count - 1
+                x[i], y[i], vx[i], vy[i] = x[last], y[last], vx[last], vy[last]
+                life[i], size[i], color[i] = life[last], size[last], color[last]
+                self.count = last
+                continue
+            x[i] += vx[i]
+            y[i] += vy[i]
+            size[i] *= 0.95
+            i += 1
+
+    def rects(self):
+        """Bounding rect setiap partikel hidup (koordinat maze)."""
+        x, y, size = self.x, self.y, self.size
+        return [QRectF(x[i] - size[i], y[i] - size[i], size[i] * 2, size[i] * 2)
+                for i in range(self.count)]
+
+    def draw(self, painter):
+        """Gambar partikel per kelompok warna dan tingkat opacity."""
+        if not self.count:
+            return
+        levels = self.ALPHA_LEVELS
+        buckets = {}
+        life = self.life
+        color = self.color
+        for i in range(self.count):
+            key = (color[i], min(levels, int(life[i] * levels) + 1))
+            bucket = buckets.get(key)
+            if bucket is None:
+                buckets[key] = [i]
+            else:
+                bucket.append(i)
+        
+        x, y, size = self.x, self.y, self.size
+        painter.setPen(Qt.NoPen)
+        for (c, alpha), items in buckets.items():
+            painter.setBrush(self.palette[c])
+            painter.setOpacity(alpha / levels)
+            for i in items:
+                painter.drawEllipse(QPointF(x[i], y[i]), size[i], size[i])
+        painter.setOpacity(1.0)
+
+class SpriteAtlas:
+    """Sprite entity yang dirender sekali ke satu QPixmap lalu di-blit.
+
+    Setiap sprite berukuran SPRITE x SPRITE (koordinat maze) berpusat
+    di tengah sel, cukup besar untuk glow tiger saat power mode.
+    """
+    SPRITE = CELL_SIZE * 2
+    COLUMNS = 8
+
+    def __init__(self, pixel_size, sprites):
+        """sprites berisi (key, fungsi render(painter)) yang menggambar di (0, 0)."""
+        self.pixel_size = pixel_size
+        self.sources = {}
+        rows = (len(sprites) + self.COLUMNS - 1) // self.COLUMNS
+        self.pixmap = QPixmap(self.COLUMNS * pixel_size, max(1, rows) * pixel_size)
+        self.pixmap.fill(Qt.transparent)
+        
+        painter = QPainter(self.pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        for n, (key, render) in enumerate(sprites):
+            left = (n % self.COLUMNS) * pixel_size
+            top = (n // self.COLUMNS) * pixel_size
+            painter.save()
+            painter.setClipRect(left, top, pixel_size, pixel_size)
+            painter.translate(left + pixel_size / 2, top + pixel_size / 2)
+            painter.scale(pixel_size / self.SPRITE, pixel_size / self.SPRITE)
+            render(painter)
+            painter.restore()
+            self.sources[key] = QRectF(left, top, pixel_size, pixel_size)
+        painter.end()
+
+    def source(self, key, size=SPRITE):
+        """Rect sumber sprite di pixmap; size < SPRITE hanya bagian tengahnya."""
+        source = self.sources[key]
+        if size == self.SPRITE:
+            return source
+        inset = (self.SPRITE - size) / 2 * self.pixel_size / self.SPRITE
+        return source.adjusted(inset, inset, -inset, -inset)
+
+    def draw(self, painter, key, cx, cy, size=SPRITE):
+        half = size / 2
+        painter.drawPixmap(QRectF(cx - half, cy - half, size, size),
+                           self.pixmap, self.source(key, size))
+
+class PelletBatch:
+    """Food pellet dikelompokkan per fase denyut lalu di-blit per kelompok.
+
+    Denyut pellet di (x, y) mengikuti global_pulse + x + y, jadi semua sel
+    dengan x + y di fase yang sama selalu berdenyut bersama. Kelompok dan
+    rect tujuan tiap pellet dihitung ulang hanya jika makanan atau area
+    terlihat berubah; per frame setiap kelompok cukup mengambil satu rect
+    sumber ('food', fase) dari atlas, tanpa sin() atau ganti brush per pellet.
+    """
+    SIZE = 20 # Sisi sprite food (koordinat maze), cukup untuk radius terbesar
+
+    def __init__(self):
+        self.key = None
+        self.groups = [] # (offset fase, tuple rect tujuan)
+
+    def update(self, cells, key):
+        """Kelompokkan ulang cells untuk key baru (food mask + area terlihat)."""
+        self.key = key
+        half = self.SIZE / 2
+        groups = {}
+        for x, y in cells:
+            offset = int((x + y) % (2 * math.pi) / (2 * math.pi) * FOOD_PHASES + 0.5) % FOOD_PHASES
+            groups.setdefault(offset, []).append(
+                QRectF(x * CELL_SIZE + CELL_SIZE/2 - half, y * CELL_SIZE + CELL_SIZE/2 - half,
+                       self.SIZE, self.SIZE))
+        self.groups = [(offset, tuple(rects)) for offset, rects in groups.items()]
+
+    def draw(self, painter, atlas, pulse, area=None):
+        """Blit semua pellet, atau hanya yang bersinggungan dengan area (koordinat maze)."""
+        base = int(pulse % (2 * math.pi) / (2 * math.pi) * FOOD_PHASES)
+        pixmap = atlas.pixmap
+        for offset, rects in self.groups:
+            source = atlas.source(('food', (base + offset) % FOOD_PHASES), self.SIZE)
+            if area is not None:
+                rects = [target for target in rects if area.intersects(target)]
+            for target in rects:
+                painter.drawPixmap(target, pixmap, source)
+
+class GameLoop:
+    """Satu clock untuk simulasi fixed-timestep dan render di display rate.
+
+    advance() menambahkan waktu nyata ke accumulator dan mengembalikan
+    jumlah tick simulasi yang harus dijalankan. Jika frame sangat
+    terlambat, tick di atas max_catchup dibuang (dihitung sebagai
+    dropped_ticks) agar game tidak berusaha mengejar tanpa akhir.
+    """
+
+    def __init__(self, tick, max_catchup=5, history=240):
+        self.tick = tick
+        self.max_catchup = max_catchup
+        self.accumulator = 0.0
+        self.last_time = None
+        self.frame_intervals = deque(maxlen=history)
+        self.frames = 0
+        self.ticks = 0
+        self.dropped_ticks = 0
+
+    def reset(self):
+        """Lupakan waktu yang sudah lewat (mis. setelah window tertahan)."""
+        self.accumulator = 0.0
+        self.last_time = None
+
+    def advance(self, now):
+        if self.last_time is None:
+            self.last_time = now
+            return 0
+        dt = now - self.last_time
+        self.last_time = now
+        self.frames += 1
+        self.frame_intervals.append(dt)
+        
+        self.accumulator += dt
+        steps = int(self.accumulator // self.tick)
+        self.accumulator -= steps * self.tick
+        if steps > self.max_catchup:
+            self.dropped_ticks += steps - self.max_catchup
+            steps = self.max_catchup
+        self.ticks += steps
+        return steps
+
+    @property
+    def alpha(self):
+        """Posisi render di antara tick sebelumnya (0.0) dan sekarang (1.0)."""
+        return min(1.0, self.accumulator / self.tick)
+
+    def stats(self):
+        """Statistik frame pacing dari frame terakhir (dalam milidetik)."""
+        intervals = self.frame_intervals
+        if not intervals:
+            return {"frames": self.frames, "ticks": self.ticks,
+                    "dropped_ticks": self.dropped_ticks}
+        mean = sum(intervals) / len(intervals)
+        jitter = math.sqrt(sum((dt - mean) ** 2 for dt in intervals) / len(intervals))
+        return {
+            "frames": self.frames,
+            "ticks": self.ticks,
+            "dropped_ticks": self.dropped_ticks,
+            "fps": 1.0 / mean if mean > 0 else 0.0,
+            "frame_ms": mean * 1000,
+            "jitter_ms": jitter * 1000,
+            "worst_frame_ms": max(intervals) * 1000,
+        }
+
+class FrameScheduler:
+    """Mengatur interval frame timer sesuai keadaan game dan window.
+
+    Mode 'active' memakai FRAME_MS, 'reduced' REDUCED_FRAME_MS, 'idle'
+    IDLE_FRAME_MS, dan 'stopped' menghentikan timer (window diminimize,
+    disembunyikan atau tertutup). Waktu kerja frame dan paint dicatat
+    lewat add_busy(); duty cycle adalah bagian waktu nyata yang dipakai
+    untuk kerja itu dalam DUTY_WINDOW detik terakhir.
+    """
+
+    INTERVALS = {'active': FRAME_MS, 'reduced': REDUCED_FRAME_MS,
+                 'idle': IDLE_FRAME_MS, 'stopped': None}
+
+    def __init__(self, timer, now):
+        self.timer = timer
+        self.mode = None
+        self.mode_since = now
+        self.started = now
+        self.mode_time = dict.fromkeys(self.INTERVALS, 0.0)
+        self.busy = deque() # (waktu selesai, detik kerja)
+        self.busy_window = 0.0
+        self.busy_total = 0.0
+        self.switches = 0
+
+    def set_mode(self, mode, now):
+        """Ganti mode; kembalikan mode sebelumnya (None jika tidak berubah)."""
+        if mode == self.mode:
+            return None
+        previous = self.mode
+        if previous is not None:
+            self.mode_time[previous] += now - self.mode_since
+            self.switches += 1
+        self.mode = mode
+        self.mode_since = now
+        interval = self.INTERVALS[mode]
+        if interval is None:
+            self.timer.stop()
+        else:
+            self.timer.start(interval)
+        return previous
+
+    def add_busy(self, now, seconds):
+        self.busy.append((now, seconds))
+        self.busy_window += seconds
+        self.busy_total += seconds
+        self.trim(now)
+
+    def trim(self, now):
+        busy = self.busy
+        while busy and now - busy[0][0] > DUTY_WINDOW:
+            self.busy_window -= busy.popleft()[1]
+
+    def duty_cycle(self, now):
+        self.trim(now)
+        span = min(DUTY_WINDOW, now - self.started)
+        return self.busy_window / span if span > 0 else 0.0
+
+    def stats(self, now):
+        """Mode sekarang, duty cycle dan total detik per mode."""
+        mode_time = dict(self.mode_time)
+        if self.mode is not None:
+            mode_time[self.mode] += now - self.mode_since
+        elapsed = now - self.started
+        return {
+            "mode": self.mode,
+            "interval_ms": self.INTERVALS.get(self.mode),
+            "duty_cycle": self.duty_cycle(now),
+            "duty_cycle_total": self.busy_total / elapsed if elapsed > 0 else 0.0,
+            "mode_sec": mode_time,
+            "switches": self.switches,
+        }
+
+class GameWidget(QWidget):
+    # Signals
+    game_over_signal = Signal(int)
+    score_updated = Signal(int)
+    lives_updated = Signal(int)
+    level_updated = Signal(int)
+    msg_signal = Signal(str, str) # Untuk menampilkan pesan ke window utama
+    first_painted = Signal()
+
+    def __init__(self, parent=None, maze_size=None, swarm=0, persist=True):
+        super().__init__(parent)
+        self.setFocusPolicy(Qt.StrongFocus)
+        # persist=False (benchmark, export, test): tidak ada autosave, telemetry
+        # dan file otomatis lain di SAVE_DIR; save/load manual tetap jalan
+        self.persist = persist
+        
+        # State (aturan game ada di GameEngine, widget ini hanya view)
+        width, height = maze_size or (MAZE_WIDTH, MAZE_HEIGHT)
+        self.engine = GameEngine(width, height, swarm=swarm)
+        self.perf = PerfRecorder()
+        self.engine.profiler = self.perf
+        # Thread prefetch maze dan thread IO baru dibuat setelah paint pertama
+        # (atau saat pertama dibutuhkan), agar tidak memperlambat startup
+        self.game_active = False
+        self.game_paused = False
+        
+        self.particles = ParticlePool()
+        self.global_pulse = 0.0
+        self.enemy_colors = {} # Cache QColor per warna RGB musuh
+        
+        # Render cache
+        self.background = None # QPixmap background + kotak maze
+        self.background_key = None
+        self.wall_chunks = {} # (cx, cy) -> (QPixmap, x, y) posisi pixel
+        self.wall_key = None
+        self.camera = (0.0, 0.0) # Pojok kiri atas viewport (koordinat maze)
+        
+        # Save/load berjalan di thread IO, hasilnya dicek tiap frame
+        self.io = None
+        self.pending_io = [] # (future, callback)
+        self.autosave_ticks = 0
+        self.autosave_slot = 0
+        
+        # Telemetry: event game pemain (bukan demo/replay), di-flush di thread IO
+        self.telemetry = TelemetryLog(TICK_MS)
+        self.telemetry_start = None # 'new' / 'loaded': record GAME belum ditulis
+        self.telemetry_ticks = 0
+        self.telemetry_failed = False
+        
+        # Replay: rekam input game ini, atau putar ulang input dari file
+        self.recorder = None
+        self.last_move = None
+        self.player = None
+        self.time_scale = 1.0
+        self.start_recording()
+        
+        # Autopilot: menggerakkan tiger (F6), atau demo di layar judul
+        self.autopilot = None
+        self.demo = False
+        self.title_since = time.perf_counter()
+        self.last_dynamic_rects = []
+        self.atlas = None
+        self.atlas_key = None
+        self.food_batch = PelletBatch()
+        
+        self.init_game()
+        
+        # Game loop: satu timer presisi, simulasi tetap per TICK_MS
+        self.loop = GameLoop(TICK_MS / 1000)
+        self.prev_positions = {} # Entity -> posisi di tick sebelumnya
+        self.render_alpha = 1.0
+        
+        # HUD performa (F3), teks di-cache agar tidak dihitung tiap frame
+        self.hud_visible = False
+        self.hud_lines = []
+        self.hud_updated = 0.0
+        self.first_paint_at = None
+        
+        self.frame_timer = QTimer(self)
+        self.frame_timer.setTimerType(Qt.PreciseTimer)
+        self.frame_timer.timeout.connect(self.on_frame)
+        self.frames = FrameScheduler(self.frame_timer, time.perf_counter())
+        self.frames.set_mode('active', time.perf_counter())
+        
+        self.init_fireflies()
+
+    def init_fireflies(self):
+        """Background elements (stream RNG kosmetik, terpisah dari logika game)."""
+        fx = self.engine.fx_rng
+        self.fireflies = [(fx.randint(0, 1000), fx.randint(0, 1000)) for _ in range(40)]
+        self.firefly_brightness = [fx.random() for _ in range(40)]
+
+    def generate_random_maze(self):
+        """Membuat maze acak yang simetris dan PASTI terhubung."""
+        return generate_random_maze(width=self.engine.width, height=self.engine.height)
+
+    def install_prefetcher(self):
+        """Pasang MazePrefetcher untuk ukuran maze engine saat ini."""
+        engine = self.engine
+        old = engine.prefetcher
+        if old is not None:
+            if (old.width, old.height) == (engine.width, engine.height):
+                return
+            old.shutdown()
+        # Maze level berikutnya digenerate di background selama level berjalan
+        engine.prefetcher = MazePrefetcher(width=engine.width, height=engine.height)
+        engine.request_prefetch()
+
+    def prefetch_stats(self):
+        prefetcher = self.engine.prefetcher
+        return prefetcher.stats() if prefetcher else {"hits": 0, "misses": 0}
+
+    def init_game(self):
+        """Sinkronkan tampilan dengan level yang sedang dimuat engine."""
+        self.particles.clear()
+        
+        # Reset signal values
+        self.score_updated.emit(self.engine.score)
+        self.lives_updated.emit(self.engine.lives)
+        self.level_updated.emit(self.engine.level)
+
+    def reset_full_game(self):
+        """Merestart game sepenuhnya ke level 1."""
+        self.stop_replay()
+        if self.demo:
+            self.demo = False
+            self.autopilot = None
+        self.engine.new_game()
+        self.start_recording()
+        self.init_game()
+        self.game_active = False # Harus tekan Enter lagi untuk start
+        self.game_paused = False
+        self.title_since = time.perf_counter()
+        self.update()
+        self.msg_signal.emit("Reset", "Game has been reset to Level 1.")
+
+    def run_io(self, func, args, callback):
+        """Jalankan func(*args) di thread IO; callback(future) dipanggil di GUI thread."""
+        if self.io is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self.io = ThreadPoolExecutor(max_workers=1, thread_name_prefix="save-io")
+        self.pending_io.append((self.io.submit(func, *args), callback))
+
+    def poll_io(self):
+        """Jalankan callback untuk pekerjaan save/load yang sudah selesai."""
+        if not self.pending_io:
+            return
+        done = [(f, cb) for f, cb in self.pending_io if f.done()]
+        if done:
+            self.pending_io = [(f, cb) for f, cb in self.pending_io if not f.done()]
+            for future, callback in done:
+                callback(future)
+
+    def save_game(self):
+        """Menyimpan progress game.
+
+        Snapshot diambil langsung (bytes kecil), penulisan file atomik
+        dilakukan di thread IO sehingga frame tidak tertahan.
+        """
+        engine = self.engine
+        if engine.lives <= 0:
+            self.msg_signal.emit("Error", "Cannot save when Game Over!")
+            return
+        self.run_io(write_atomic, (SAVE_FILE, encode_game(engine)), self.on_saved)
+
+    def on_saved(self, future):
+        try:
+            path = future.result()
+            self.msg_signal.emit("Success", f"Game Saved Successfully to:\n{path}")
+        except Exception as e:
+            self.msg_signal.emit("Error", f"Failed to save: {str(e)}")
+
+    def autosave(self):
+        """Tulis snapshot ke slot autosave berikutnya (bergiliran)."""
+        engine = self.engine
+        if engine.lives <= 0 or engine.game_over:
+            return
+        path = autosave_file(self.autosave_slot)
+        self.autosave_slot = (self.autosave_slot + 1) % AUTOSAVE_SLOTS
+        self.run_io(write_atomic, (path, encode_game(engine)), self.on_autosaved)
+
+    def log_telemetry(self, events):
+        """Catat event tick ini; buffer ditulis tiap TELEMETRY_FLUSH_TICKS dan saat game over."""
+        self.telemetry.log_events(self.engine, events)
+        self.telemetry_ticks += 1
+        if self.telemetry_ticks >= TELEMETRY_FLUSH_TICKS or self.engine.game_over:
+            self.flush_telemetry()
+
+    def flush_telemetry(self):
+        """Tambahkan record yang tertunda ke file log di thread IO."""
+        self.telemetry_ticks = 0
+        data = self.telemetry.take()
+        if data:
+            self.run_io(append_log, (TELEMETRY_FILE, data), self.on_telemetry_flushed)
+
+    def on_telemetry_flushed(self, future):
+        try:
+            future.result()
+        except Exception as e:
+            if not self.telemetry_failed:
+                # Cukup sekali; flush berikutnya tetap dicoba
+                self.telemetry_failed = True
+                self.msg_signal.emit("Error", f"Telemetry log write failed: {str(e)}")
+
+    def on_autosaved(self, future):
+        try:
+            future.result()
+        except Exception as e:
+            self.msg_signal.emit("Error", f"Autosave failed: {str(e)}")
+
+    def latest_save(self):
+        """File save terbaru di antara save manual, slot autosave dan JSON lama."""
+        paths = [SAVE_FILE] + [autosave_file(i) for i in range(AUTOSAVE_SLOTS)] + [LEGACY_SAVE_FILE]
+        existing = [p for p in paths if os.path.exists(p)]
+        if not existing:
+            return None
+        return max(existing, key=os.path.getmtime)
+
+    def load_game(self):
+        """Memuat progress game (file dibaca dan di-decode di thread IO)."""
+        path = self.latest_save()
+        if path is None:
+            self.msg_signal.emit("Error", f"No save file found at:\n{SAVE_FILE}")
+            return
+        self.run_io(read_save, (path,), lambda future: self.on_loaded(path, future))
+
+    def on_loaded(self, path, future):
+        try:
+            state = future.result()
+            engine = self.engine
+            restore_game(engine, state)
+            self.install_prefetcher()
+            self.prev_positions = {}
+            # Replay butuh game dari awal; game hasil load tidak direkam
+            self.stop_replay()
+            self.recorder = None
+            self.telemetry_start = 'loaded'
+
+            self.score_updated.emit(engine.score)
+            self.lives_updated.emit(engine.lives)
+            self.level_updated.emit(engine.level)
+            
+            self.game_active = False # Pause saat baru load
+            self.game_paused = True
+            self.update() # Repaint
+            
+            self.msg_signal.emit("Success", f"Game Loaded from {os.path.basename(path)}! "
+                                            "Press 'P' or 'Enter' to continue.")
+            
+        except Exception as e:
+            self.msg_signal.emit("Error", f"Failed to load: {str(e)}")
+
+    def start_game(self):
+        self.game_active = True
+        self.game_paused = False
+        self.loop.reset()
+        self.setFocus()
+        self.update() # Hapus overlay
+
+    def start_recording(self):
+        """Mulai rekaman replay baru; engine harus di awal game."""
+        self.recorder = ReplayRecorder(self.engine)
+        self.last_move = self.engine.next_move
+        self.telemetry_start = 'new'
+
+    def save_replay(self, path):
+        """Simpan rekaman game ini ke file replay (ditulis di thread IO)."""
+        if self.recorder is None:
+            self.msg_signal.emit("Error", "This game is not being recorded (loaded from a save or a replay).")
+            return
+        self.run_io(write_replay, (path, self.recorder.to_dict(self.engine)),
+                    lambda future: self.on_replay_saved(path, future))
+
+    def on_replay_saved(self, path, future):
+        try:
+            future.result()
+            self.msg_signal.emit("Success", f"Replay saved to:\n{path}")
+        except Exception as e:
+            self.msg_signal.emit("Error", f"Failed to save replay: {str(e)}")
+
+    def play_replay(self, replay, speed=1.0):
+        """Putar replay di window dengan time scale speed (2.0 = dua kali cepat)."""
+        self.demo = False
+        self.autopilot = None
+        self.player = ReplayPlayer(replay)
+        self.player.start(self.engine)
+        self.init_fireflies() # Replay yang sama selalu tampil sama persis
+        self.install_prefetcher()
+        self.recorder = None
+        self.set_time_scale(speed)
+        self.init_game()
+        self.start_game()
+
+    def stop_replay(self):
+        if self.player is not None:
+            self.player = None
+            self.set_time_scale(1.0)
+
+    def set_autopilot(self, enabled):
+        """Nyalakan/matikan autopilot untuk tiger pemain (F6).
+
+        Arah dari autopilot masuk ke next_move seperti input keyboard,
+        jadi tetap terekam di replay.
+        """
+        self.autopilot = Autopilot() if enabled else None
+        self.update()
+
+    def start_demo(self):
+        """Attract mode: game baru dimainkan autopilot di layar judul."""
+        self.engine.new_game()
+        self.recorder = None
+        self.autopilot = Autopilot()
+        self.demo = True
+        self.init_game()
+        self.start_game()
+
+    def stop_demo(self):
+        """Akhiri demo dan siapkan game baru untuk pemain."""
+        self.demo = False
+        self.autopilot = None
+        self.engine.new_game()
+        self.start_recording()
+        self.init_game()
+
+    def drive_autopilot(self):
+        """Search autopilot untuk tick ini (dibatasi Autopilot.budget)."""
+        start = time.perf_counter()
+        move = self.autopilot.choose(self.engine)
+        self.perf.record('tick.autopilot', time.perf_counter() - start)
+        if move is not None:
+            self.engine.next_move = move
+
+    def set_time_scale(self, scale):
+        """Percepat/perlambat simulasi dengan mengubah panjang tick GameLoop."""
+        self.time_scale = max(0.125, min(16.0, scale))
+        self.loop.tick = TICK_MS / 1000 / self.time_scale
+
+    def spawn_particles(self, x, y, color):
+        px = x * CELL_SIZE + CELL_SIZE/2
+        py = y * CELL_SIZE + CELL_SIZE/2
+        self.particles.spawn(px, py, color, rng=self.engine.fx_rng)
+
+    def update_animation(self):
+        self.global_pulse += 0.2
+        
+        if self.game_active and not self.game_paused:
+            self.engine.tiger.update_animation()
+            
+            for i in range(len(self.firefly_brightness)):
+                self.firefly_brightness[i] += self.engine.fx_rng.uniform(-0.1, 0.1)
+                self.firefly_brightness[i] = max(0.1, min(1.0, self.firefly_brightness[i]))
+            
+            self.particles.update()
+
+    def on_frame(self):
+        """Satu frame display: jalankan tick yang jatuh tempo lalu render."""
+        now = time.perf_counter()
+        frames = self.loop.frames
+        steps = self.loop.advance(now)
+        if self.loop.frames != frames:
+            self.perf.record('frame.interval', self.loop.frame_intervals[-1])
+        for _ in range(steps):
+            self.update_game()
+            self.update_animation()
+        self.poll_io()
+        
+        if (not self.game_active and not self.game_paused and self.engine.tick == 0
+                and self.player is None and now - self.title_since >= ATTRACT_DELAY):
+            self.start_demo()
+        
+        if self.hud_visible and now - self.hud_updated >= HUD_REFRESH:
+            self.refresh_hud(now)
+        
+        if self.game_active and not self.game_paused:
+            self.render_alpha = self.loop.alpha
+            if self.update_camera():
+                # Kamera bergeser: seluruh viewport berubah
+                self.update()
+                self.last_dynamic_rects = self.dynamic_rects()
+            elif steps or self.is_interpolating():
+                self.update_dirty()
+        else:
+            self.render_alpha = 1.0
+            if self.update_camera() or steps:
+                # Tetap repaint untuk animasi idle/menu
+                self.update()
+        
+        self.schedule_frames()
+        end = time.perf_counter()
+        self.frames.add_busy(end, end - now)
+
+    def frame_mode(self):
+        """Mode FrameScheduler untuk keadaan game dan window saat ini."""
+        window = self.window()
+        handle = window.windowHandle()
+        if (not self.isVisible() or window.isMinimized()
+                or (handle is not None and not handle.isExposed())):
+            return 'stopped'
+        if self.game_active and not self.game_paused:
+            if self.demo or not window.isActiveWindow():
+                return 'reduced'
+            return 'active'
+        return 'idle'
+
+    def schedule_frames(self):
+        """Sesuaikan frame timer; dipanggil tiap frame dan saat window/input berubah."""
+        now = time.perf_counter()
+        previous = self.frames.set_mode(self.frame_mode(), now)
+        if previous == 'stopped':
+            # Timer sempat berhenti: jangan kejar tick yang terlewat
+            self.loop.reset()
+            self.title_since = now
+            self.update()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.schedule_frames()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.schedule_frames()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.ActivationChange:
+            # Window tidak fokus: game tetap jalan, frame turun ke mode 'reduced'
+            self.schedule_frames()
+
+    def update_game(self):
+        if not self.game_active or self.game_paused:
+            return
+        
+        engine = self.engine
+        if self.player is not None:
+            if self.player.finished(engine):
+                self.stop_replay()
+                self.game_active = False
+                self.update()
+                self.msg_signal.emit("Replay", f"Replay finished at tick {engine.tick}, score {engine.score}.")
+                return
+            self.player.apply(engine)
+        else:
+            if self.autopilot is not None:
+                self.drive_autopilot()
+            if self.recorder is not None and engine.next_move != self.last_move:
+                # Input pemain (atau autopilot) sejak tick terakhir
+                self.recorder.record(engine.tick + 1, engine.next_move)
+        
+        self.prev_positions = {entity: (entity.x, entity.y)
+                               for entity in [engine.tiger] + engine.enemies}
+        # Hanya game pemain di widget persist yang dicatat dan di-autosave
+        logging = self.persist and not self.demo and self.player is None
+        if logging and self.telemetry_start is not None:
+            self.telemetry.start_game(engine, loaded=self.telemetry_start == 'loaded')
+            self.telemetry_start = None
+        events = engine.step()
+        if logging:
+            self.log_telemetry(events)
+        for event in events:
+            self.handle_event(event)
+        self.last_move = engine.next_move
+        
+        if not logging:
+            return # Demo, replay dan widget non-persist tidak menimpa autosave pemain
+        self.autosave_ticks += 1
+        if self.autosave_ticks >= AUTOSAVE_TICKS:
+            self.autosave_ticks = 0
+            self.autosave()
+
+    def is_interpolating(self):
+        return any((entity.x, entity.y) != pos for entity, pos in self.prev_positions.items())
+
+    def render_position(self, entity):
+        """Posisi gambar entity, diinterpolasi antara tick lama dan baru."""
+        prev = self.prev_positions.get(entity)
+        alpha = self.render_alpha
+        if prev is None or alpha >= 1.0:
+            return entity.x, entity.y
+        px, py = prev
+        # Teleport (reset, pulang paksa) tidak diinterpolasi
+        if abs(entity.x - px) + abs(entity.y - py) != 1:
+            return entity.x, entity.y
+        return px + (entity.x - px) * alpha, py + (entity.y - py) * alpha
+
+    def handle_event(self, event):
+        """Terjemahkan event dari GameEngine ke partikel dan Qt signal."""
+        kind = event[0]
+        engine = self.engine
+        if kind == EVT_FOOD:
+            self.spawn_particles(event[1], event[2], QColor(255, 200, 100))
+            self.score_updated.emit(engine.score)
+        elif kind == EVT_POWER:
+            self.spawn_particles(event[1], event[2], QColor(255, 255, 0))
+            self.score_updated.emit(engine.score)
+        elif kind == EVT_ENEMY_EATEN:
+            self.spawn_particles(event[1], event[2], QColor(255, 255, 255))
+            self.score_updated.emit(engine.score)
+        elif kind == EVT_LIFE_LOST:
+            self.lives_updated.emit(engine.lives)
+            self.spawn_particles(event[1], event[2], QColor(255, 0, 0))
+        elif kind == EVT_GAME_OVER:
+            if self.demo:
+                # Demo diulang dengan game baru
+                engine.new_game()
+                self.init_game()
+                self.update()
+                return
+            self.game_active = False
+            self.game_over_signal.emit(event[1])
+            self.update()
+            if self.player is not None:
+                self.stop_replay()
+            elif self.recorder is not None and self.persist and not self.demo:
+                # Simpan replay terakhir untuk laporan bug / regression check;
+                # game demo dan widget non-persist tidak menimpanya
+                self.run_io(write_replay, (LAST_REPLAY_FILE, self.recorder.to_dict(engine)),
+                            self.on_autosaved)
+        elif kind == EVT_LEVEL_UP:
+            self.level_updated.emit(event[1])
+            self.update() # Maze baru: gambar ulang seluruh layar
+            if self.player is not None or self.demo:
+                return # Replay dan demo jalan terus tanpa jeda antar level
+            self.game_paused = True # Pause sebentar antar level
+            self.msg_signal.emit("Level Up!", f"Entering Level {event[1]}\nMap Scrambled!\nEnemies are faster!")
+
+    def keyPressEvent(self, event):
+        self.handle_key(event.key())
+        # Input langsung membangunkan frame timer dari mode idle
+        self.schedule_frames()
+
+    def handle_key(self, key):
+        if key == Qt.Key_Escape:
+            self.parent().parent().close() 
+            return
+        if key == Qt.Key_F3:
+            self.set_perf_hud(not self.hud_visible)
+            return
+        if key == Qt.Key_F4:
+            self.export_perf(os.path.join(SAVE_DIR, "macan_perf.json"))
+            return
+        if key == Qt.Key_F5:
+            self.save_replay(os.path.join(SAVE_DIR, time.strftime("macan_replay_%Y%m%d_%H%M%S.mhr")))
+            return
+        if key == Qt.Key_F6:
+            if self.player is None and not self.demo:
+                self.set_autopilot(self.autopilot is None)
+            return
+
+        if self.demo:
+            # Demo: Enter mulai game pemain, tombol lain diabaikan
+            if key in [Qt.Key_Return, Qt.Key_Enter, Qt.Key_Space]:
+                self.stop_demo()
+                self.start_game()
+            return
+
+        if not self.game_active:
+            if key in [Qt.Key_Return, Qt.Key_Enter, Qt.Key_Space]:
+                if self.engine.lives > 0:
+                    self.start_game()
+                else:
+                    # Restart if game over
+                    self.reset_full_game()
+                    self.start_game()
+            return
+            
+        if key == Qt.Key_P:
+            self.game_paused = not self.game_paused
+            self.update()
+        
+        if self.player is not None:
+            # Saat replay: input arah diabaikan, +/- mengatur kecepatan
+            if key in (Qt.Key_Plus, Qt.Key_Equal):
+                self.set_time_scale(self.time_scale * 2)
+            elif key == Qt.Key_Minus:
+                self.set_time_scale(self.time_scale / 2)
+            return
+            
+        if key == Qt.Key_Right or key == Qt.Key_D: self.engine.next_move = 0
+        elif key == Qt.Key_Down or key == Qt.Key_S: self.engine.next_move = 1
+        elif key == Qt.Key_Left or key == Qt.Key_A: self.engine.next_move = 2
+        elif key == Qt.Key_Up or key == Qt.Key_W: self.engine.next_move = 3
+    
+    def viewport(self):
+        """(scale, left, top, view_w, view_h) area maze yang tampil di widget.
+
+        Maze standar tampil utuh. Maze yang lebih besar dari VIEW_WIDTH x
+        VIEW_HEIGHT sel hanya tampil sebagian dan di-scroll oleh kamera.
+        """
+        maze = self.engine.maze
+        view_w = min(maze.width, VIEW_WIDTH) * CELL_SIZE
+        view_h = min(maze.height, VIEW_HEIGHT) * CELL_SIZE
+        # --- Responsive Scaling ---
+        scale = min(self.width() / view_w, self.height() / view_h) * 0.9
+        left = (self.width() - (view_w * scale)) / 2
+        top = (self.height() - (view_h * scale)) / 2
+        return scale, left, top, view_w, view_h
+
+    def is_scrolling(self):
+        maze = self.engine.maze
+        return maze.width > VIEW_WIDTH or maze.height > VIEW_HEIGHT
+
+    def view_transform(self):
+        """(scale, trans_x, trans_y) dari koordinat maze ke koordinat widget."""
+        scale, left, top, _, _ = self.viewport()
+        cam_x, cam_y = self.camera
+        return scale, left - cam_x * scale, top - cam_y * scale
+
+    def update_camera(self):
+        """Ikuti tiger dengan kamera; True jika posisi kamera berubah."""
+        camera = (0.0, 0.0)
+        if self.is_scrolling():
+            maze = self.engine.maze
+            scale, _, _, view_w, view_h = self.viewport()
+            x, y = self.render_position(self.engine.tiger)
+            cam_x = (x + 0.5) * CELL_SIZE - view_w / 2
+            cam_y = (y + 0.5) * CELL_SIZE - view_h / 2
+            cam_x = min(max(0.0, cam_x), maze.width * CELL_SIZE - view_w)
+            cam_y = min(max(0.0, cam_y), maze.height * CELL_SIZE - view_h)
+            # Snap ke pixel layar agar chunk tembok tidak di-resample
+            camera = (round(cam_x * scale) / scale, round(cam_y * scale) / scale)
+        if camera == self.camera:
+            return False
+        self.camera = camera
+        return True
+
+    def visible_cells(self, margin=1):
+        """(x0, y0, x1, y1) sel maze yang terlihat di viewport."""
+        maze = self.engine.maze
+        _, _, _, view_w, view_h = self.viewport()
+        cam_x, cam_y = self.camera
+        x0 = max(0, int(cam_x // CELL_SIZE) - margin)
+        y0 = max(0, int(cam_y // CELL_SIZE) - margin)
+        x1 = min(maze.width, int((cam_x + view_w) // CELL_SIZE) + 1 + margin)
+        y1 = min(maze.height, int((cam_y + view_h) // CELL_SIZE) + 1 + margin)
+        return x0, y0, x1, y1
+
+    def paint_cells(self, rect, margin=1):
+        """(x0, y0, x1, y1) sel terlihat yang bersinggungan dengan rect (koordinat widget).
+
+        Dipakai paintEvent agar repaint sebagian (update_dirty, expose
+        sebagian) tidak memproses tembok, pellet dan sprite di luar rect.
+        """
+        scale, trans_x, trans_y = self.view_transform()
+        x0, y0, x1, y1 = self.visible_cells(margin)
+        cell = CELL_SIZE * scale
+        x0 = max(x0, int((rect.left() - trans_x) // cell) - margin)
+        y0 = max(y0, int((rect.top() - trans_y) // cell) - margin)
+        # Rect di luar maze (mis. hanya overlay): kotak kosong x1 == x0
+        x1 = max(x0, min(x1, int((rect.right() + 1 - trans_x) // cell) + 1 + margin))
+        y1 = max(y0, min(y1, int((rect.bottom() + 1 - trans_y) // cell) + 1 + margin))
+        return x0, y0, x1, y1
+
+    def resizeEvent(self, event):
+        # Layer statis dan sprite atlas dibangun ulang saat paint berikutnya
+        self.background = None
+        self.wall_chunks = {}
+        self.atlas = None
+        super().resizeEvent(event)
+
+    def ensure_background(self):
+        """Render background dan kotak viewport maze sekali ke QPixmap.
+
+        Dibangun ulang hanya jika ukuran widget, device pixel ratio atau
+        ukuran viewport berubah.
+        """
+        dpr = self.devicePixelRatioF()
+        scale, left, top, view_w, view_h = self.viewport()
+        key = (self.width(), self.height(), dpr, view_w, view_h)
+        if self.background is not None and self.background_key == key:
+            return self.background
+        
+        background = QPixmap(max(1, int(self.width() * dpr)), max(1, int(self.height() * dpr)))
+        background.setDevicePixelRatio(dpr)
+        background.fill(QColor(15, 20, 30))
+        painter = QPainter(background)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.translate(left, top)
+        painter.scale(scale, scale)
+        painter.setBrush(QColor(25, 35, 45))
+        painter.setPen(QPen(QColor(50, 60, 80), 4))
+        painter.drawRoundedRect(QRectF(0, 0, view_w, view_h), 10, 10)
+        painter.end()
+        
+        self.background = background
+        self.background_key = key
+        return background
+
+    def wall_chunk(self, cx, cy):
+        """(QPixmap, x, y) tembok chunk (cx, cy), transparan di luar tembok.
+
+        Chunk di-render sekali per skala dan letak tembok, lalu di-blit di
+        posisi pixel bulat (x, y) dengan sisa sub-pixel ikut di-render ke
+        dalam pixmap, sehingga hasilnya sama dengan menggambar langsung.
+        """
+        maze = self.engine.maze
+        dpr = self.devicePixelRatioF()
+        scale, trans_x, trans_y = self.view_transform()
+        cam_x, cam_y = self.camera
+        # Offset sub-pixel tetap selama kamera di-snap ke pixel
+        key = (self.width(), self.height(), dpr, maze.width, maze.walls)
+        if self.wall_key != key:
+            self.wall_chunks = {}
+            self.wall_key = key
+        chunk = self.wall_chunks.get((cx, cy))
+        if chunk is not None:
+            pixmap, x, y = chunk
+            return pixmap, round(x - cam_x * scale), round(y - cam_y * scale)
+        
+        size = CHUNK_CELLS * CELL_SIZE
+        px = trans_x + cx * size * scale
+        py = trans_y + cy * size * scale
+        x = math.floor(px + 1e-6)
+        y = math.floor(py + 1e-6)
+        pixels = math.ceil(size * scale * dpr) + 2
+        pixmap = QPixmap(pixels, pixels)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.translate(px - x, py - y)
+        painter.scale(scale, scale)
+        painter.translate(-cx * size, -cy * size)
+        painter.setBrush(QColor(40, 50, 70))
+        painter.setPen(QPen(QColor(60, 75, 100), 2))
+        x0, y0 = cx * CHUNK_CELLS, cy * CHUNK_CELLS
+        x1, y1 = min(maze.width, x0 + CHUNK_CELLS), min(maze.height, y0 + CHUNK_CELLS)
+        for wx, wy in maze.cells_in(maze.walls, x0, y0, x1, y1):
+            rect = QRectF(wx * CELL_SIZE, wy * CELL_SIZE, CELL_SIZE, CELL_SIZE)
+            painter.drawRoundedRect(rect.adjusted(2, 2, -2, -2), 4, 4)
+        painter.end()
+        
+        if len(self.wall_chunks) >= WALL_CHUNK_CACHE:
+            del self.wall_chunks[next(iter(self.wall_chunks))]
+        # Simpan posisi tanpa kamera agar tetap valid saat kamera bergeser
+        self.wall_chunks[(cx, cy)] = (pixmap, x + cam_x * scale, y + cam_y * scale)
+        return pixmap, x, y
+
+    def firefly_positions(self):
+        """Posisi fireflies (koordinat maze); menempel pada viewport, bukan maze."""
+        _, _, _, view_w, view_h = self.viewport()
+        cam_x, cam_y = self.camera
+        return [(cam_x + (fx / 1000) * view_w, cam_y + (fy / 1000) * view_h)
+                for fx, fy in self.fireflies]
+
+    def entity_rects(self):
+        """Rect (koordinat maze) tiger, termasuk glow power mode, dan musuh.
+
+        Mencakup sel tick sebelumnya dan sekarang karena posisi gambar
+        diinterpolasi di antara keduanya.
+        """
+        engine = self.engine
+        glow = CELL_SIZE * 0.85 - CELL_SIZE / 2
+        x0, y0, x1, y1 = self.visible_cells()
+        rects = []
+        for entity in [engine.tiger] + engine.enemies:
+            margin = glow if entity is engine.tiger else 2
+            px, py = self.prev_positions.get(entity, (entity.x, entity.y))
+            if not (x0 - 1 <= entity.x <= x1 and y0 - 1 <= entity.y <= y1 or
+                    x0 - 1 <= px <= x1 and y0 - 1 <= py <= y1):
+                continue # Di luar viewport (maze besar / swarm)
+            rect = QRectF(min(px, entity.x) * CELL_SIZE, min(py, entity.y) * CELL_SIZE,
+                          (abs(entity.x - px) + 1) * CELL_SIZE, (abs(entity.y - py) + 1) * CELL_SIZE)
+            rects.append(rect.adjusted(-margin, -margin, margin, margin))
+        return rects
+
+    def dynamic_rects(self):
+        """Rect (koordinat maze) semua elemen yang berubah tiap frame."""
+        maze = self.engine.maze
+        rects = self.entity_rects()
+        
+        # Pellets berdenyut setiap frame (hanya yang terlihat)
+        for x, y in maze.cells_in(maze.food | maze.power, *self.visible_cells()):
+            rects.append(QRectF(x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE))
+        
+        rects.extend(self.particles.rects())
+        
+        for bx, by in self.firefly_positions():
+            rects.append(QRectF(bx - FIREFLY_RADIUS, by - FIREFLY_RADIUS,
+                                FIREFLY_RADIUS * 2, FIREFLY_RADIUS * 2))
+        return rects
+
+    def update_rects(self, rects):
+        """Jadwalkan repaint untuk rect dalam koordinat maze."""
+        scale, trans_x, trans_y = self.view_transform()
+        for r in rects:
+            self.update(QRectF(trans_x + r.x() * scale, trans_y + r.y() * scale,
+                               r.width() * scale, r.height() * scale)
+                        .toAlignedRect().adjusted(-2, -2, 2, 2))
+
+    def update_dirty(self):
+        """Repaint hanya area elemen yang bergerak (posisi lama dan baru)."""
+        rects = self.dynamic_rects()
+        self.update_rects(self.last_dynamic_rects + rects)
+        self.last_dynamic_rects = rects
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        if not painter.isActive():
+            return
+            
+        perf = self.perf
+        start = last = time.perf_counter()
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        scale, trans_x, trans_y = self.view_transform()
+        background = self.ensure_background()
+        atlas = self.ensure_atlas(scale)
+        x0, y0, x1, y1 = self.visible_cells()
+        # Bagian maze yang perlu digambar ulang untuk event ini
+        px0, py0, px1, py1 = self.paint_cells(event.rect())
+        partial = (px0, py0, px1, py1) != (x0, y0, x1, y1)
+        area = QRectF(px0 * CELL_SIZE, py0 * CELL_SIZE,
+                      (px1 - px0) * CELL_SIZE, (py1 - py0) * CELL_SIZE)
+        
+        # Background + Maze Box (cache)
+        painter.drawPixmap(0, 0, background)
+        now = time.perf_counter()
+        perf.record('paint.background', now - last)
+        last = now
+        
+        if self.is_scrolling():
+            # Maze besar: jangan menggambar sel di luar kotak viewport
+            _, left, top, view_w, view_h = self.viewport()
+            painter.setClipRect(QRectF(left, top, view_w * scale, view_h * scale))
+        
+        painter.translate(trans_x, trans_y)
+        painter.scale(scale, scale)
+        
+        # Fireflies (sprite glow per tingkat kecerahan, tanpa ganti state painter)
+        painter.setPen(Qt.NoPen)
+        brightness = self.firefly_brightness
+        for i, (bx, by) in enumerate(self.firefly_positions()):
+            # Uji rect glow, bukan titik tengah: glow bisa masuk area walau pusatnya di luar
+            if partial and not area.intersects(QRectF(bx - FIREFLY_RADIUS, by - FIREFLY_RADIUS,
+                                                      FIREFLY_RADIUS * 2, FIREFLY_RADIUS * 2)):
+                continue
+            level = min(FIREFLY_LEVELS - 1, int(brightness[i] * FIREFLY_LEVELS))
+            atlas.draw(painter, ('firefly', level), bx, by, FIREFLY_RADIUS * 2)
+        now = time.perf_counter()
+        perf.record('paint.fireflies', now - last)
+        last = now
+
+        # Walls (cache per chunk, hanya chunk yang terlihat di rect event)
+        painter.resetTransform()
+        if px1 > px0 and py1 > py0:
+            for cy in range(py0 // CHUNK_CELLS, (py1 - 1) // CHUNK_CELLS + 1):
+                for cx in range(px0 // CHUNK_CELLS, (px1 - 1) // CHUNK_CELLS + 1):
+                    pixmap, px, py = self.wall_chunk(cx, cy)
+                    painter.drawPixmap(px, py, pixmap)
+        painter.translate(trans_x, trans_y)
+        painter.scale(scale, scale)
+
+        # Food dan Power Pellet (kelompok pellet tetap per area terlihat,
+        # agar rect event yang berubah tiap frame tidak memicu rebuild)
+        maze = self.engine.maze
+        key = (maze.food, x0, y0, x1, y1)
+        if key != self.food_batch.key:
+            self.food_batch.update(maze.cells_in(maze.food, x0, y0, x1, y1), key)
+        self.food_batch.draw(painter, atlas, self.global_pulse, area if partial else None)
+        
+        phase = int(self.global_pulse * 2 / (2 * math.pi) * PELLET_PHASES) % PELLET_PHASES
+        for x, y in maze.cells_in(maze.power, px0, py0, px1, py1):
+            atlas.draw(painter, ('pellet', phase), x * CELL_SIZE + CELL_SIZE/2, y * CELL_SIZE + CELL_SIZE/2)
+        now = time.perf_counter()
+        perf.record('paint.cells', now - last)
+        last = now
+
+        # Entities
+        for enemy in self.engine.enemies:
+            if px0 - 1 <= enemy.x <= px1 and py0 - 1 <= enemy.y <= py1:
+                self.draw_enemy(painter, enemy)
+            
+        tiger = self.engine.tiger
+        if px0 - 1 <= tiger.x <= px1 and py0 - 1 <= tiger.y <= py1:
+            self.draw_tiger(painter, tiger)
+        now = time.perf_counter()
+        perf.record('paint.entities', now - last)
+        last = now
+        
+        # Particles
+        self.particles.draw(painter)
+        now = time.perf_counter()
+        perf.record('paint.particles', now - last)
+
+        painter.resetTransform()
+        painter.setClipping(False)
+        
+        # UI Overlays
+        if self.demo:
+            self.draw_banner(painter, "DEMO - Press ENTER to Start")
+        elif not self.game_active and self.engine.lives > 0:
+            self.draw_overlay(painter, "MACAN HUNGRY", "Press ENTER to Start")
+        elif not self.game_active and self.engine.lives <= 0:
+            self.draw_overlay(painter, "GAME OVER", f"Final Score: {self.engine.score}\nPress ENTER to Restart")
+        elif self.game_paused:
+             self.draw_overlay(painter, "PAUSED", "Press P to Resume")
+        elif self.autopilot is not None:
+            self.draw_banner(painter, "AUTOPILOT - Press F6 to take control")
+
+        if self.hud_visible:
+            self.draw_hud(painter)
+
+        # FIX: End painter explicitly
+        painter.end()
+        end = time.perf_counter()
+        perf.record('paint.total', end - start)
+        self.frames.add_busy(end, end - start)
+        if self.frames.mode == 'stopped':
+            # Window terlihat lagi (expose tidak punya event sendiri di QWidget)
+            self.schedule_frames()
+        if self.first_paint_at is None:
+            self.first_paint_at = time.perf_counter()
+            self.install_prefetcher()
+            self.first_painted.emit()
+
+    def draw_overlay(self, painter, title, subtitle):
+        painter.fillRect(self.rect(), QColor(0, 0, 0, 180))
+        
+        painter.setPen(QColor(255, 200, 0))
+        font = QFont('Arial', 48, QFont.Bold)
+        painter.setFont(font)
+        painter.drawText(self.rect(), Qt.AlignCenter, f"{title}\n\n\n")
+        
+        painter.setPen(QColor(255, 255, 255))
+        font.setPointSize(24)
+        painter.setFont(font)
+        painter.drawText(self.rect(), Qt.AlignCenter, f"\n\n{subtitle}")
+
+    def draw_banner(self, painter, text):
+        """Pita teks di bawah layar; permainan di belakangnya tetap terlihat."""
+        rect = QRectF(0, self.height() - 80, self.width(), 60)
+        painter.fillRect(rect, QColor(0, 0, 0, 150))
+        painter.setPen(QColor(255, 200, 0))
+        painter.setFont(QFont('Arial', 24, QFont.Bold))
+        painter.drawText(rect, Qt.AlignCenter, text)
+
+    def set_perf_hud(self, visible):
+        """Tampilkan atau sembunyikan HUD performa (F3)."""
+        self.hud_visible = visible
+        if visible:
+            self.refresh_hud(time.perf_counter())
+        self.update()
+
+    def export_perf(self, path):
+        """Simpan sampel timing dan statistik frame pacing ke JSON (F4)."""
+        try:
+            extra = {"loop": self.loop.stats(), "maze_prefetch": self.prefetch_stats(),
+                     "frame_scheduler": self.frames.stats(time.perf_counter())}
+            if self.autopilot is not None:
+                extra["autopilot"] = self.autopilot.stats()
+            self.perf.export_json(path, extra=extra)
+            self.msg_signal.emit("Success", f"Performance data exported to:\n{path}")
+        except Exception as e:
+            self.msg_signal.emit("Error", f"Failed to export performance data: {str(e)}")
+
+    def refresh_hud(self, now):
+        """Hitung ulang teks HUD dari PerfRecorder dan GameLoop."""
+        self.hud_updated = now
+        stats = self.loop.stats()
+        prefetch = self.prefetch_stats()
+        lines = [f"FPS {stats.get('fps', 0.0):5.1f}  "
+                 f"jitter {stats.get('jitter_ms', 0.0):4.1f} ms  "
+                 f"dropped {stats['dropped_ticks']}",
+                 f"frames {self.frames.mode} ({self.frames.INTERVALS[self.frames.mode]} ms)  "
+                 f"duty {self.frames.duty_cycle(now):.1%}",
+                 f"particles {len(self.particles)}/{self.particles.capacity}  "
+                 f"maze prefetch {prefetch['hits']} hit / {prefetch['misses']} miss",
+                 "phase              mean    p95    max"]
+        if self.autopilot is not None:
+            search = self.autopilot.stats()
+            lines.insert(2, f"autopilot depth {search['last']['depth']} (max {search['max_depth']})  "
+                            f"{search['nodes_per_sec']:.0f} nodes/s")
+        for name, s in self.perf.summaries().items():
+            lines.append(f"{name:<17}{s['mean_ms']:6.2f} {s['p95_ms']:6.2f} {s['max_ms']:6.2f}")
+        self.hud_lines = lines
+        self.update(self.hud_rect())
+
+    def hud_rect(self):
+        return QRectF(8, 8, 360, 18 * len(self.hud_lines) + 8).toAlignedRect()
+
+    def draw_hud(self, painter):
+        """Panel timing (mean / p95 / max dalam ms) di pojok kiri atas."""
+        rect = self.hud_rect()
+        painter.fillRect(rect, QColor(0, 0, 0, 190))
+        painter.setPen(QColor(120, 255, 120))
+        font = QFont('Courier New', 9)
+        font.setStyleHint(QFont.TypeWriter)
+        painter.setFont(font)
+        y = rect.top() + 18
+        for line in self.hud_lines:
+            painter.drawText(rect.left() + 6, y, line)
+            y += 18
+
+    def ensure_atlas(self, scale):
+        """Pre-render semua state sprite untuk skala saat ini.
+
+        Atlas hanya dibangun ulang jika ukuran sprite di layar (scale x
+        device pixel ratio) berubah, yaitu saat widget di-resize.
+        """
+        pixel_size = max(1, round(SpriteAtlas.SPRITE * scale * self.devicePixelRatioF()))
+        colors = tuple(sorted({enemy.color for enemy in self.engine.enemies}))
+        key = (pixel_size, colors)
+        if self.atlas is not None and self.atlas_key == key:
+            return self.atlas
+        
+        sprites = []
+        for direction in range(4):
+            for mouth_open in (False, True):
+                for power in (False, True):
+                    sprites.append((('tiger', direction, mouth_open, power),
+                                    lambda p, d=direction, m=mouth_open, pw=power:
+                                        self.render_tiger(p, d, m, pw)))
+        for rgb in colors:
+            color = QColor(*rgb)
+            for direction in range(4):
+                sprites.append((('enemy', rgb, direction),
+                                lambda p, c=color, d=direction: self.render_enemy(p, c, d)))
+        for direction in range(4):
+            sprites.append((('eyes', direction),
+                            lambda p, d=direction: self.render_enemy(p, None, d, returning=True)))
+        scared_color = QColor(100, 100, 255)
+        for left in (-1, 0, 1):
+            for right in (-1, 0, 1):
+                sprites.append((('scared', left, right),
+                                lambda p, j=(left, right): self.render_enemy(p, scared_color, 0, jitter=j)))
+        for phase in range(PELLET_PHASES):
+            angle = (phase + 0.5) / PELLET_PHASES * 2 * math.pi
+            sprites.append((('pellet', phase),
+                            lambda p, pulse=(math.sin(angle) + 1) * 4: self.render_power_pellet(p, pulse)))
+        food_color = QColor(255, 180, 180)
+        for phase in range(FOOD_PHASES):
+            sprites.append((('food', phase),
+                            lambda p, r=FOOD_RADII[phase]: self.render_food(p, food_color, r)))
+        for level in range(FIREFLY_LEVELS):
+            alpha = int((level + 0.5) / FIREFLY_LEVELS * 150)
+            sprites.append((('firefly', level), lambda p, a=alpha: self.render_firefly(p, a)))
+        
+        self.atlas = SpriteAtlas(pixel_size, sprites)
+        self.atlas_key = key
+        return self.atlas
+
+    def draw_tiger(self, painter, tiger):
+        x, y = self.render_position(tiger)
+        cx = x * CELL_SIZE + CELL_SIZE/2
+        cy = y * CELL_SIZE + CELL_SIZE/2
+        self.atlas.draw(painter, ('tiger', tiger.direction, tiger.mouth_open, self.engine.power_mode), cx, cy)
+
+    def render_tiger(self, painter, direction, mouth_open, power):
+        """Gambar vektor tiger berpusat di (0, 0), dipakai untuk atlas."""
+        size = CELL_SIZE * 0.85
+        
+        rotations = [0, 90, 180, 270] 
+        painter.rotate(rotations[direction])
+        
+        if power:
+            grad = QRadialGradient(0, 0, size)
+            grad.setColorAt(0, QColor(255, 255, 255, 100))
+            grad.setColorAt(1, QColor(255, 200, 0, 0))
+            painter.setBrush(grad)
+            painter.setPen(Qt.NoPen)
+            painter.drawEllipse(-size, -size, size*2, size*2)
+            
+        painter.setBrush(QColor(255, 165, 0)) 
+        painter.setPen(QPen(QColor(180, 100, 0), 2))
+        painter.drawEllipse(int(-size/2), int(-size/2), int(size), int(size))
+        
+        painter.setBrush(Qt.black)
+        painter.setPen(Qt.NoPen)
+        painter.drawPolygon([QPointF(0, -size/2), QPointF(-4, -size/2 + 8), QPointF(4, -size/2 + 8)])
+        painter.drawPolygon([QPointF(0, size/2), QPointF(-4, size/2 - 8), QPointF(4, size/2 - 8)])
+        
+        painter.setBrush(Qt.white)
+        painter.drawEllipse(4, -6, 8, 8) 
+        painter.drawEllipse(4, 6, 8, 8)  
+        
+        painter.setBrush(Qt.black)
+        dx = 2 if mouth_open else 0
+        
+        painter.drawEllipse(8 + dx, -6, 3, 3)
+        painter.drawEllipse(8 + dx, 6, 3, 3)
+        
+        if mouth_open:
+            painter.setBrush(QColor(150, 0, 0))
+            painter.drawPie(QRectF(0, -6, 12, 12), -45 * 16, 90 * 16)
+
+    def draw_enemy(self, painter, enemy):
+        x, y = self.render_position(enemy)
+        cx = x * CELL_SIZE + CELL_SIZE/2
+        cy = y * CELL_SIZE + CELL_SIZE/2
+        
+        # Musuh yang sedang pulang hanya tampil sebagai mata
+        if enemy.returning:
+            key = ('eyes', enemy.direction)
+        elif enemy.scared:
+            # Getar dari tick dan sel, bukan fx_rng: jumlah paint per tick
+            # tidak boleh mengubah efek lain (replay dan export identik)
+            h = (self.engine.tick * 73856093) ^ (enemy.x * 19349663) ^ (enemy.y * 83492791)
+            key = ('scared', h % 3 - 1, (h >> 8) % 3 - 1)
+        else:
+            key = ('enemy', enemy.color, enemy.direction)
+        self.atlas.draw(painter, key, cx, cy)
+
+    def render_enemy(self, painter, color, direction, returning=False, jitter=None):
+        """Gambar vektor musuh berpusat di (0, 0), dipakai untuk atlas.
+
+        jitter berisi geseran pupil kiri/kanan untuk musuh yang ketakutan.
+        """
+        size = CELL_SIZE * 0.8
+        
+        if not returning:
+            path = QPainterPath()
+            path.moveTo(-size/2, 0)
+            path.arcTo(QRectF(-size/2, -size/2, size, size), 180, 180)
+            
+            bottom = size/2
+            path.lineTo(size/2, bottom)
+            path.lineTo(size/4, bottom - 5)
+            path.lineTo(0, bottom)
+            path.lineTo(-size/4, bottom - 5)
+            path.lineTo(-size/2, bottom)
+            path.closeSubpath()
+            
+            painter.setBrush(color)
+            painter.setPen(QPen(color.darker(), 2))
+            painter.drawPath(path)
+        
+        painter.setBrush(Qt.white)
+        painter.setPen(Qt.NoPen)
+        eye_y = -4
+        painter.drawEllipse(QPointF(-6, eye_y), 6, 8)
+        painter.drawEllipse(QPointF(6, eye_y), 6, 8)
+        
+        painter.setBrush(QColor(0, 0, 50))
+        if jitter is not None:
+            painter.drawEllipse(QPointF(-6 + jitter[0], eye_y), 2, 2)
+            painter.drawEllipse(QPointF(6 + jitter[1], eye_y), 2, 2)
+        else:
+            look_x = 0
+            look_y = 0
+            if direction == 0: look_x = 2
+            elif direction == 2: look_x = -2
+            elif direction == 1: look_y = 2
+            elif direction == 3: look_y = -2
+            
+            painter.drawEllipse(QPointF(-6 + look_x, eye_y + look_y), 3, 3)
+            painter.drawEllipse(QPointF(6 + look_x, eye_y + look_y), 3, 3)
+
+    def render_food(self, painter, color, radius):
+        """Food pellet berpusat di (0, 0), dipakai untuk atlas."""
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(color)
+        painter.drawEllipse(QPointF(0, 0), radius, radius)
+
+    def render_firefly(self, painter, alpha):
+        """Glow firefly berpusat di (0, 0): inti radius 4 yang memudar sampai FIREFLY_RADIUS."""
+        glow = QRadialGradient(QPointF(0, 0), FIREFLY_RADIUS)
+        glow.setColorAt(0.0, QColor(100, 255, 100, alpha))
+        glow.setColorAt(4 / FIREFLY_RADIUS, QColor(100, 255, 100, alpha))
+        glow.setColorAt(1.0, QColor(100, 255, 100, 0))
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QBrush(glow))
+        painter.drawEllipse(QPointF(0, 0), FIREFLY_RADIUS, FIREFLY_RADIUS)
+
+    def render_power_pellet(self, painter, pulse):
+        """Gambar vektor power pellet berpusat di (0, 0), dipakai untuk atlas."""
+        grad = QRadialGradient(0, 0, 15)
+        grad.setColorAt(0, QColor(255, 255, 0, 255))
+        grad.setColorAt(1, QColor(255, 100, 0, 0))
+        painter.setBrush(QBrush(grad))
+        painter.setPen(Qt.NoPen)
+        painter.drawEllipse(QPointF(0, 0), 12 + pulse, 12 + pulse)
+        painter.setBrush(QColor(255, 255, 200))
+        painter.drawEllipse(QPointF(0, 0), 6, 6)
+
+# Style yang terlihat di frame pertama (HUD); dipasang di MainWindow.__init__
+WINDOW_STYLE = """
+    QMainWindow { background-color: #0f141e; }
+    QLabel { color: white; font-family: 'Segoe UI', Arial; font-weight: bold; }
+    QPushButton {
+        background-color: #2ecc71;
+        color: white;
+        border: none;
+        padding: 10px 20px;
+        font-size: 16px;
+        border-radius: 5px;
+        font-weight: bold;
+    }
+    QPushButton#btn_restart { background-color: #e74c3c; }
+    QPushButton#btn_quit { background-color: #7f8c8d; }
+    QPushButton#btn_save { background-color: #3498db; }
+    QPushButton#btn_load { background-color: #9b59b6; }
+"""
+
+# Hover/pressed dan QMessageBox baru dibutuhkan setelah interaksi pertama,
+# jadi dipasang setelah frame pertama tergambar
+WINDOW_STYLE_DEFERRED = """
+    /* Style khusus QMessageBox agar teks hitam dan background putih */
+    QMessageBox { background-color: white; }
+    QMessageBox QLabel { color: black; font-weight: normal; font-size: 14px; }
+    QMessageBox QPushButton { color: white; background-color: #3498db; min-width: 60px; }
+
+    QPushButton:hover { background-color: #27ae60; }
+    QPushButton:pressed { background-color: #219150; }
+    QPushButton#btn_restart:hover { background-color: #c0392b; }
+    QPushButton#btn_quit:hover { background-color: #2c3e50; }
+    QPushButton#btn_save:hover { background-color: #2980b9; }
+    QPushButton#btn_load:hover { background-color: #8e44ad; }
+"""
+
+class MainWindow(QMainWindow):
+    def __init__(self, maze_size=None, swarm=0, startup=None, report_startup=False):
+        super().__init__()
+        self.startup = startup # Titik waktu startup dari macan_main, atau None
+        self.report_startup = report_startup
+        self.setWindowTitle("Macan Hungry - Jungle Adventure Premium")
+        self.setStyleSheet(WINDOW_STYLE)
+
+        # Main Layout
+        central = QWidget()
+        self.setCentralWidget(central)
+        layout = QVBoxLayout(central)
+        layout.setContentsMargins(0, 0, 0, 0)
+        
+        # Top HUD (Floating)
+        hud_container = QWidget()
+        hud_container.setFixedHeight(60)
+        hud_container.setStyleSheet("background-color: rgba(0,0,0,150); border-bottom: 2px solid #34495e;")
+        hud_layout = QHBoxLayout(hud_container)
+        
+        self.score_label = QLabel("SCORE: 0")
+        self.score_label.setStyleSheet("font-size: 24px; color: #f1c40f;")
+        
+        self.lives_label = QLabel("LIVES: 3")
+        self.lives_label.setStyleSheet("font-size: 24px; color: #e74c3c;")
+        
+        self.level_label = QLabel("LEVEL: 1")
+        self.level_label.setStyleSheet("font-size: 24px; color: #3498db;")
+        
+        # --- HUD Buttons ---
+        self.btn_save = QPushButton("SAVE")
+        self.btn_save.setObjectName("btn_save")
+        self.btn_save.setCursor(Qt.PointingHandCursor)
+        
+        self.btn_load = QPushButton("LOAD")
+        self.btn_load.setObjectName("btn_load")
+        self.btn_load.setCursor(Qt.PointingHandCursor)
+        
+        self.btn_reset = QPushButton("RESET")
+        self.btn_reset.setObjectName("btn_restart")
+        self.btn_reset.setCursor(Qt.PointingHandCursor)
+
+        self.btn_quit = QPushButton("QUIT")
+        self.btn_quit.setObjectName("btn_quit")
+        self.btn_quit.setCursor(Qt.PointingHandCursor)
+        self.btn_quit.clicked.connect(self.close)
+
+        hud_layout.addWidget(self.score_label)
+        hud_layout.addSpacing(20)
+        hud_layout.addWidget(self.lives_label)
+        hud_layout.addSpacing(20)
+        hud_layout.addWidget(self.level_label)
+        hud_layout.addStretch()
+        hud_layout.addWidget(self.btn_save)
+        hud_layout.addWidget(self.btn_load)
+        hud_layout.addWidget(self.btn_reset)
+        hud_layout.addWidget(self.btn_quit)
+
+        layout.addWidget(hud_container)
+        
+        # Game Area
+        self.game = GameWidget(self, maze_size, swarm)
+        layout.addWidget(self.game)
+        
+        # Connect Signals
+        self.game.score_updated.connect(self.update_score)
+        self.game.lives_updated.connect(self.update_lives)
+        self.game.level_updated.connect(self.update_level)
+        self.game.msg_signal.connect(self.show_message)
+        self.game.first_painted.connect(self.on_first_paint)
+        
+        # Connect Buttons
+        self.btn_save.clicked.connect(self.game.save_game)
+        self.btn_load.clicked.connect(self.game.load_game)
+        self.btn_reset.clicked.connect(self.game.reset_full_game)
+        
+        # Set Fullscreen
+        self.showFullScreen()
+
+    def update_score(self, score):
+        self.score_label.setText(f"SCORE: {score}")
+
+    def update_lives(self, lives):
+        self.lives_label.setText(f"LIVES: {lives}")
+
+    def update_level(self, level):
+        self.level_label.setText(f"LEVEL: {level}")
+    
+    def show_message(self, title, msg):
+        QMessageBox.information(self, title, msg)
+
+    def closeEvent(self, event):
+        # Record telemetry yang belum ditulis (thread IO selesai sebelum proses keluar)
+        self.game.flush_telemetry()
+        super().closeEvent(event)
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            # Minimize/restore: frame timer berhenti atau jalan lagi
+            self.game.schedule_frames()
+
+    def on_first_paint(self):
+        """Pasang sisa stylesheet dan catat durasi startup ke PerfRecorder (ikut export F4)."""
+        QTimer.singleShot(0, lambda: self.setStyleSheet(WINDOW_STYLE + WINDOW_STYLE_DEFERRED))
+        if self.startup is None:
+            return
+        self.startup["first_paint"] = self.game.first_paint_at
+        report = startup_report(self.startup)
+        for name, ms in report.items():
+            self.game.perf.record(f"startup.{name}", ms / 1000)
+        if self.report_startup:
+            print(json.dumps(report, indent=1))
+            QTimer.singleShot(0, QApplication.quit)
@@ -0,0 +1,59 @@
+"""Entry point Macan Hungry: argumen command line, QApplication dan MainWindow.
+
+Modul widget (macan_hungry) yang memuat Qt baru di-import di sini, jadi
+tool lain (bench, export, test) meng-import macan_hungry hanya jika
+memang butuh widget.
+
+Contoh:
+    python macan_main.py
+    python macan_main.py --size 101x101
+    python macan_main.py --swarm 300
+    python macan_main.py --replay macan_last_replay.mhr --speed 4
+    python macan_main.py --startup-report
+"""
+import time
+STARTUP = {"start": time.perf_counter()} # Titik waktu startup untuk --startup-report
+
+import sys
+
+
+def option_value(argv, name):
+    """Nilai argumen 'name VALUE' dari command line, atau None."""
+    if name not in argv:
+        return None
+    return argv[argv.index(name) + 1]
+
+
+def parse_maze_size(argv):
+    """Ukuran maze dari argumen '--size WxH' (mode endurance), atau None."""
+    size = option_value(argv, '--size')
+    if size is None:
+        return None
+    width, height = size.lower().split('x')
+    return int(width), int(height)
+
+
+def main(argv=None):
+    """Jalankan game (juga dipanggil dari "python macan_hungry.py")."""
+    argv = sys.argv if argv is None else argv
+    import macan_hungry as ui
+    from macan_replay import Replay
+    STARTUP["imported"] = time.perf_counter()
+
+    app = ui.QApplication(argv)
+    STARTUP["app"] = time.perf_counter()
+    # --startup-report: cetak durasi import/window/paint pertama (JSON) lalu keluar
+    # --swarm N: mode swarm dengan N musuh
+    window = ui.MainWindow(parse_maze_size(argv), int(option_value(argv, '--swarm') or 0),
+                           startup=STARTUP, report_startup='--startup-report' in argv)
+    STARTUP["window"] = time.perf_counter()
+    # --replay file.mhr [--speed 4]
+    replay_path = option_value(argv, '--replay')
+    if replay_path:
+        window.game.play_replay(Replay.load(replay_path), float(option_value(argv, '--speed') or 1.0))
+    window.show()
+    return app.exec()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
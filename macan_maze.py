@@ -0,0 +1,871 @@
+import heapq
+import random
+import threading
+
+# --- Constants ---
+MAZE_WIDTH = 19
+MAZE_HEIGHT = 21
+
+# Nilai sel maze
+WALL = 0
+FOOD = 1
+EMPTY = 2
+POWER = 3
+
+# Maze layout awal (Level 1 statis)
+MAZE_LAYOUT = [
+    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
+    [0,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,0],
+    [0,3,0,0,1,0,0,0,1,0,1,0,0,0,1,0,0,3,0],
+    [0,1,0,0,1,0,0,0,1,0,1,0,0,0,1,0,0,1,0],
+    [0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0],
+    [0,1,0,0,1,0,1,0,0,0,0,0,1,0,1,0,0,1,0],
+    [0,1,1,1,1,0,1,1,1,0,1,1,1,0,1,1,1,1,0],
+    [0,0,0,0,1,0,0,0,1,0,1,0,0,0,1,0,0,0,0],
+    [2,2,2,0,1,0,1,1,1,1,1,1,1,0,1,0,2,2,2],
+    [0,0,0,0,1,0,1,0,0,2,0,0,1,0,1,0,0,0,0],
+    [2,2,2,2,1,1,1,0,2,2,2,0,1,1,1,2,2,2,2],
+    [0,0,0,0,1,0,1,0,0,0,0,0,1,0,1,0,0,0,0],
+    [2,2,2,0,1,0,1,1,1,1,1,1,1,0,1,0,2,2,2],
+    [0,0,0,0,1,0,1,0,0,0,0,0,1,0,1,0,0,0,0],
+    [0,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,0],
+    [0,1,0,0,1,0,0,0,1,0,1,0,0,0,1,0,0,1,0],
+    [0,3,1,0,1,1,1,1,1,1,1,1,1,1,1,0,1,3,0],
+    [0,0,1,0,1,0,1,0,0,0,0,0,1,0,1,0,1,0,0],
+    [0,1,1,1,1,0,1,1,1,0,1,1,1,0,1,1,1,1,0],
+    [0,1,0,0,0,0,0,0,1,0,1,0,0,0,0,0,0,1,0],
+    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
+]
+
+
+def check_maze_size(width, height):
+    """Ukuran maze harus ganjil dan cukup besar untuk ghost house dan spawn."""
+    if width % 2 == 0 or height % 2 == 0:
+        raise ValueError(f"Maze size must be odd, got {width}x{height}")
+    if width < MAZE_WIDTH or height < MAZE_HEIGHT:
+        raise ValueError(f"Maze must be at least {MAZE_WIDTH}x{MAZE_HEIGHT}, got {width}x{height}")
+
+
+def ghost_home(width, height):
+    """Sel tengah ghost house; (9, 9) untuk maze standar 19x21."""
+    return width // 2, height // 2 - 1
+
+
+def tiger_spawn(width, height):
+    """Posisi awal tiger, di bawah ghost house; (9, 15) untuk 19x21."""
+    return width // 2, height // 2 + 5
+
+
+def generate_random_maze(rng=random, width=MAZE_WIDTH, height=MAZE_HEIGHT, repairs=None):
+    """Membuat maze acak yang simetris dan PASTI terhubung.
+
+    Satu kandidat dari carve_maze() diperiksa dengan maze_problems().
+    Kantong sel yang tak terjangkau dari spawn diperbaiki di tempat oleh
+    connect_maze() (dibuka ke area utama, atau ditembok jika tanpa
+    makanan), jadi biayanya tetap satu kali carve berapa pun ukurannya
+    dan seed yang sama selalu memberi maze yang sama. Jika repairs
+    diberikan (list), (masalah, terowongan, kantong ditembok) kandidat
+    yang diperbaiki ditambahkan ke sana.
+    """
+    rows = carve_maze(rng, width, height)
+    problems = maze_problems(Maze.from_rows(rows))
+    if not problems:
+        return rows
+    tunnels, walled = connect_maze(rows)
+    if repairs is not None:
+        repairs.append((problems, tunnels, walled))
+    if maze_problems(Maze.from_rows(rows)):
+        return repair_maze(rows) # Seharusnya tidak terjadi; jaga-jaga
+    return rows
+
+
+def carve_maze(rng=random, width=MAZE_WIDTH, height=MAZE_HEIGHT):
+    """Satu kandidat maze acak simetris, belum diverifikasi.
+
+    width dan height harus ganjil. Ghost house, spawn dan jumlah loop
+    ikut diskalakan. Dinding yang dijebol acak bisa membuat kantong
+    makanan yang tertutup, jadi pakai generate_random_maze() untuk level.
+    """
+    check_maze_size(width, height)
+    half = width // 2          # Kolom kiri 0..half-1, kolom tengah = half
+    home_x, home_y = ghost_home(width, height)
+    spawn_x, spawn_y = tiger_spawn(width, height)
+    house_top = home_y - 1
+
+    # 1. Inisialisasi grid penuh tembok (0)
+    new_maze = [[0 for _ in range(width)] for _ in range(height)]
+
+    # 2. Algoritma DFS (Recursive Backtracker) untuk separuh kiri
+    stack = []
+    start_pos = (1, 1)
+    new_maze[1][1] = 1
+    stack.append(start_pos)
+
+    while stack:
+        cx, cy = stack[-1]
+        neighbors = []
+
+        # Cek tetangga dengan jarak 2 sel
+        directions = [(2, 0), (0, 2), (-2, 0), (0, -2)]
+
+        for dx, dy in directions:
+            nx, ny = cx + dx, cy + dy
+            # Batas kanan adalah setengah lebar maze
+            if 1 <= nx < half and 1 <= ny < height - 1:
+                if new_maze[ny][nx] == 0:
+                    neighbors.append((nx, ny, dx, dy))
+
+        if neighbors:
+            nx, ny, dx, dy = rng.choice(neighbors)
+            new_maze[cy + dy//2][cx + dx//2] = 1
+            new_maze[ny][nx] = 1
+            stack.append((nx, ny))
+        else:
+            stack.pop()
+
+    # 3. Mirroring (Cerminkan bagian kiri ke kanan)
+    for y in range(height):
+        for x in range(half): # 0 sampai half-1
+            val = new_maze[y][x]
+            new_maze[y][x] = val
+            new_maze[y][width - 1 - x] = val
+
+        # Hubungkan tengah secara horizontal jika kiri-kanan terbuka
+        if new_maze[y][half - 1] == 1:
+            new_maze[y][half] = 1
+            new_maze[y][half + 1] = 1
+
+    # 4. Buat Ghost House (Area Musuh), 5x5 berpusat di home
+    for y in range(house_top, house_top + 5):
+        for x in range(home_x - 2, home_x + 3):
+            if y in (house_top, house_top + 4) or x in (home_x - 2, home_x + 2):
+                 if not (y == house_top and x == home_x):
+                    new_maze[y][x] = 0
+            else:
+                new_maze[y][x] = 2
+
+    new_maze[house_top][home_x] = 2 # Pintu hantu
+
+    # 5. Buat Loop (Jebol tembok acak), sebanding dengan luas maze
+    for _ in range(20 * width * height // (MAZE_WIDTH * MAZE_HEIGHT)):
+        rx = rng.randint(2, width - 3)
+        ry = rng.randint(2, height - 3)
+        if new_maze[ry][rx] == 0:
+            # Pastikan tidak merusak dinding luar
+            if 0 < rx < width-1 and 0 < ry < height-1:
+                 new_maze[ry][rx] = 1
+
+    for y in range(house_top + 4, spawn_y + 2):
+        if y < height - 1:
+            new_maze[y][spawn_x] = 1
+
+    # Buka sedikit area samping spawn agar tidak sempit
+    new_maze[spawn_y][spawn_x - 1] = 1
+    new_maze[spawn_y][spawn_x + 1] = 1
+    # -----------------------------
+
+    # 7. Isi Makanan dan Power Pellet
+    for y in range(height):
+        for x in range(width):
+            # Jangan taruh makanan di dalam rumah hantu (nilai 2) atau tembok (0)
+            if new_maze[y][x] == 1:
+                if (x < 2 or x > width-3) and (y < 3 or y > height-4):
+                    new_maze[y][x] = 3 # Power Pellet
+                else:
+                    new_maze[y][x] = 1 # Makanan
+
+    return new_maze
+
+
+def popcount(mask):
+    return bin(mask).count('1')
+
+
+_edge_masks = {}
+
+
+def edge_masks(width, height):
+    """(semua sel, tanpa kolom kiri, tanpa kolom kanan) sebagai bitmask."""
+    key = (width, height)
+    masks = _edge_masks.get(key)
+    if masks is None:
+        full = (1 << (width * height)) - 1
+        left = int(('0' * (width - 1) + '1') * height, 2) # Bit x == 0 tiap baris
+        right = left << (width - 1)
+        masks = _edge_masks[key] = (full, full & ~left, full & ~right)
+    return masks
+
+
+def flood_fill(open_mask, start, width, height):
+    """Bitmask sel terbuka yang terhubung ke bit start (flood fill bitboard).
+
+    Satu iterasi menumbuhkan seluruh frontier satu langkah lewat geser
+    bit, jadi biayanya sebanding panjang jalur terpanjang, bukan jumlah sel.
+    start boleh berupa sel tembok (spawn tiger di layout level 1).
+    """
+    _, not_left, not_right = edge_masks(width, height)
+    reach = start
+    while True:
+        grown = (((reach & not_right) << 1) | ((reach & not_left) >> 1) |
+                 (reach << width) | (reach >> width)) & open_mask | reach
+        if grown == reach:
+            return reach
+        reach = grown
+
+
+def maze_problems(maze):
+    """Alasan maze tidak bisa diselesaikan; list kosong jika valid.
+
+    Semua makanan dan power food harus terjangkau dari spawn tiger, dan
+    ghost house harus terhubung ke spawn agar musuh bisa keluar.
+    """
+    width, height = maze.width, maze.height
+    full, _, _ = edge_masks(width, height)
+    spawn_x, spawn_y = tiger_spawn(width, height)
+    home_x, home_y = ghost_home(width, height)
+    reach = flood_fill(full & ~maze.walls, 1 << (spawn_y * width + spawn_x), width, height)
+    problems = []
+    lost = (maze.food | maze.power) & ~reach
+    if lost:
+        problems.append(f"unreachable_food:{popcount(lost)}")
+    if not reach >> (home_y * width + home_x) & 1:
+        problems.append("ghost_house_closed")
+    return problems
+
+
+def repair_maze(rows):
+    """Tembok semua sel terbuka yang tak terjangkau dari spawn (fallback generator)."""
+    maze = Maze.from_rows(rows)
+    width, height = maze.width, maze.height
+    full, _, _ = edge_masks(width, height)
+    spawn_x, spawn_y = tiger_spawn(width, height)
+    reach = flood_fill(full & ~maze.walls, 1 << (spawn_y * width + spawn_x), width, height)
+    home_x, home_y = ghost_home(width, height)
+    return [[WALL if cell != WALL and not reach >> (y * width + x) & 1 and (x, y) != (home_x, home_y)
+             else cell for x, cell in enumerate(row)] for y, row in enumerate(rows)]
+
+
+def bit_string(mask, n):
+    """Bitmask sebagai string '0'/'1' dengan index sel (O(n), untuk BFS datar)."""
+    return format(mask, 'b').zfill(n)[::-1]
+
+
+def connect_maze(rows):
+    """Perbaiki kantong yang tak terjangkau dari spawn, langsung di rows.
+
+    Kantong berisi makanan (atau ghost house) dihubungkan lewat terowongan
+    tembok terpendek ke area yang terjangkau; kantong tanpa makanan
+    ditembok. Tembok luar dan tembok ghost house tidak pernah dijebol.
+    Kembalikan (jumlah terowongan, jumlah kantong ditembok).
+    """
+    maze = Maze.from_rows(rows)
+    width, height = maze.width, maze.height
+    full, _, _ = edge_masks(width, height)
+    spawn_x, spawn_y = tiger_spawn(width, height)
+    home_x, home_y = ghost_home(width, height)
+    home = 1 << (home_y * width + home_x)
+    house = 0
+    for y in range(home_y - 1, home_y + 4):
+        for x in range(home_x - 2, home_x + 3):
+            house |= 1 << (y * width + x)
+    open_mask = full & ~maze.walls
+    reach = flood_fill(open_mask, 1 << (spawn_y * width + spawn_x), width, height)
+    tunnels = walled = 0
+    rest = open_mask & ~reach
+    while rest:
+        pocket = flood_fill(open_mask, rest & -rest, width, height)
+        rest &= ~pocket
+        if not pocket & (maze.food | maze.power | home):
+            for x, y in maze.cells(pocket):
+                rows[y][x] = WALL
+            open_mask &= ~pocket
+            walled += 1
+            continue
+        for i in dig_tunnel(pocket, reach, open_mask, house & ~pocket, width, height):
+            rows[i // width][i % width] = FOOD
+            open_mask |= 1 << i
+        tunnels += 1
+        reach = flood_fill(open_mask, reach, width, height)
+        rest &= ~reach
+    return tunnels, walled
+
+
+def dig_tunnel(pocket, reach, open_mask, blocked, width, height):
+    """Sel tembok (index) di jalur terpendek dari pocket ke reach.
+
+    BFS biasa dari semua sel pocket; sel terbuka dan tembok dalam sama-sama
+    boleh dilewati, kecuali sel blocked dan tembok luar. Untuk kantong yang
+    hanya dipisah satu tembok, BFS berhenti setelah beberapa sel saja.
+    """
+    n = width * height
+    in_pocket, in_reach = bit_string(pocket, n), bit_string(reach, n)
+    is_open, is_blocked = bit_string(open_mask, n), bit_string(blocked, n)
+    parent = {i: -1 for i, bit in enumerate(in_pocket) if bit == '1'}
+    queue = list(parent)
+    for cell in queue:
+        if in_reach[cell] == '1':
+            break
+        x, y = cell % width, cell // width
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if 0 < nx < width - 1 and 0 < ny < height - 1:
+                nxt = ny * width + nx
+                if nxt not in parent and is_blocked[nxt] == '0':
+                    parent[nxt] = cell
+                    queue.append(nxt)
+    else:
+        return [] # Tidak ada jalur (tidak terjadi untuk maze dari carve_maze)
+    path = []
+    while cell != -1:
+        if is_open[cell] == '0':
+            path.append(cell)
+        cell = parent[cell]
+    return path
+
+
+def maze_stats(maze):
+    """Ukuran struktur maze: sel terbuka, jalan buntu, loop dan komponen."""
+    width, height = maze.width, maze.height
+    full, not_left, not_right = edge_masks(width, height)
+    open_mask = full & ~maze.walls
+    # Tetangga terbuka per arah, sebagai bitmask sel yang punya tetangga itu
+    right = open_mask & not_right & (open_mask >> 1)
+    left = open_mask & not_left & (open_mask << 1)
+    down = open_mask & (open_mask >> width)
+    up = open_mask & (open_mask << width)
+    any_dir = right | left | down | up
+    two = (right & left) | (right & down) | (right & up) | (left & down) | (left & up) | (down & up)
+    cells = popcount(open_mask)
+    edges = popcount(right) + popcount(down)
+    components = 0
+    rest = open_mask
+    while rest:
+        components += 1
+        rest &= ~flood_fill(open_mask, rest & -rest, width, height)
+    loops = edges - cells + components # Jumlah siklus independen graf sel terbuka
+    return {"open_cells": cells, "dead_ends": popcount(any_dir & ~two),
+            "loops": loops, "loop_density": loops / cells if cells else 0.0,
+            "components": components}
+
+
+class Maze:
+    """Maze bitboard: tembok, makanan dan power food sebagai bitmask int.
+
+    Bit ke-i mewakili sel y * width + x. Karena int immutable, clone()
+    cukup menyalin referensi (O(1)), dan jumlah makanan tersisa dijaga
+    secara inkremental di food_left.
+    """
+    __slots__ = ('width', 'height', 'walls', 'food', 'power', 'food_left')
+
+    def __init__(self, width, height, walls=0, food=0, power=0, food_left=None):
+        self.width = width
+        self.height = height
+        self.walls = walls
+        self.food = food
+        self.power = power
+        if food_left is None:
+            food_left = popcount(food) + popcount(power)
+        self.food_left = food_left
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Buat Maze dari format list of lists (MAZE_LAYOUT, save file)."""
+        width = len(rows[0])
+        # String bit dibalik (sel 0 di kanan), lalu di-parse sekali per
+        # jenis sel, agar linear juga untuk maze besar
+        cells = [cell for row in reversed(rows) for cell in reversed(row)]
+
+        def mask(kind):
+            return int(''.join('1' if cell == kind else '0' for cell in cells), 2)
+        return cls(width, len(rows), mask(WALL), mask(FOOD), mask(POWER))
+
+    def to_rows(self):
+        """Konversi balik ke list of lists untuk save_game."""
+        n = self.width * self.height
+        bits = [format(mask, 'b').zfill(n)[::-1]
+                for mask in (self.walls, self.food, self.power)]
+        flat = [WALL if w == '1' else FOOD if f == '1' else POWER if p == '1' else EMPTY
+                for w, f, p in zip(*bits)]
+        return [flat[y * self.width:(y + 1) * self.width] for y in range(self.height)]
+
+    def clone(self):
+        return Maze(self.width, self.height, self.walls, self.food,
+                    self.power, self.food_left)
+
+    def get(self, x, y):
+        i = y * self.width + x
+        if (self.walls >> i) & 1:
+            return WALL
+        if (self.food >> i) & 1:
+            return FOOD
+        if (self.power >> i) & 1:
+            return POWER
+        return EMPTY
+
+    def is_wall(self, x, y):
+        return (self.walls >> (y * self.width + x)) & 1 == 1
+
+    def eat(self, x, y):
+        """Kosongkan sel (x, y) dan kembalikan isinya sebelum dimakan."""
+        bit = 1 << (y * self.width + x)
+        if self.food & bit:
+            self.food ^= bit
+            self.food_left -= 1
+            return FOOD
+        if self.power & bit:
+            self.power ^= bit
+            self.food_left -= 1
+            return POWER
+        return EMPTY
+
+    def cells(self, mask):
+        """Iterasi (x, y) untuk setiap bit yang menyala di mask."""
+        width = self.width
+        while mask:
+            low = mask & -mask
+            i = low.bit_length() - 1
+            yield i % width, i // width
+            mask ^= low
+
+    def cells_in(self, mask, x0, y0, x1, y1):
+        """Seperti cells(), tetapi hanya di kotak [x0, x1) x [y0, y1).
+
+        Biayanya sebanding dengan luas kotak, bukan luas maze.
+        """
+        width = self.width
+        span = (1 << (x1 - x0)) - 1
+        for y in range(y0, y1):
+            row = (mask >> (y * width + x0)) & span
+            while row:
+                low = row & -row
+                yield x0 + low.bit_length() - 1, y
+                row ^= low
+
+
+class LocalDistances(dict):
+    """Field jarak sebagian (dict sel -> jarak); sel di luar bernilai -1."""
+
+    def __missing__(self, cell):
+        return -1
+
+
+class NavTable:
+    """Tabel navigasi satu maze: tetangga terbuka dan jarak BFS per sel.
+
+    Sel ditulis sebagai index datar y * width + x. Jarak BFS dihitung
+    sekali per sel tujuan lalu disimpan, sehingga keputusan musuh
+    berikutnya cukup berupa lookup tabel. Jumlah field yang disimpan
+    dibatasi (DIST_CACHE_CELLS) agar maze besar tidak menghabiskan memori.
+    """
+    DIST_CACHE_CELLS = 1_000_000 # Total sel semua field jarak yang disimpan
+    LOCAL_CACHE_SIZE = 64
+    FLOW_CACHE_SIZE = 16 # Flow field (mode swarm): posisi tiger terakhir + home + pojok
+
+    def __init__(self, maze):
+        self.width = maze.width
+        self.height = maze.height
+        w, h = self.width, self.height
+        self.corners = [(1, 1), (w-2, 1), (1, h-2), (w-2, h-2)]
+        self.home = ghost_home(w, h)
+        self.spawn = tiger_spawn(w, h)
+        bits = format(maze.walls, 'b').zfill(w * h)[::-1]
+        self.is_open = [b == '0' for b in bits]
+
+        # moves[cell][d] = sel tujuan untuk arah d, atau -1 jika tembok
+        is_open = self.is_open
+        self.moves = []
+        for y in range(h):
+            for x in range(w):
+                row = []
+                for nx, ny in ((x+1, y), (x, y+1), (x-1, y), (x, y-1)):
+                    if 0 <= nx < w and 0 <= ny < h and is_open[ny * w + nx]:
+                        row.append(ny * w + nx)
+                    else:
+                        row.append(-1)
+                self.moves.append(row)
+        self.neighbors = [tuple((d, j) for d, j in enumerate(row) if j >= 0)
+                          for row in self.moves]
+        self._dist = {}
+        self._dist_limit = max(16, self.DIST_CACHE_CELLS // (w * h))
+        self._local = {}
+        self._flow = {}
+        self._graph = None
+
+    def index(self, x, y):
+        return y * self.width + x
+
+    def position(self, cell):
+        return cell % self.width, cell // self.width
+
+    def distances(self, target, radius=None):
+        """Jarak BFS dari setiap sel ke target (-1 jika tidak terjangkau).
+
+        Dengan radius, BFS hanya menjelajah sel yang berjarak Chebyshev
+        <= radius dari target, sehingga biayanya tidak bergantung pada
+        ukuran maze.
+        """
+        if radius is not None:
+            return self.local_distances(target, radius)
+        dist = self._dist.get(target)
+        if dist is None:
+            dist = [-1] * (self.width * self.height)
+            dist[target] = 0
+            frontier = [target]
+            neighbors = self.neighbors
+            for cell in frontier:
+                nd = dist[cell] + 1
+                for _, j in neighbors[cell]:
+                    if dist[j] < 0:
+                        dist[j] = nd
+                        frontier.append(j)
+            if len(self._dist) >= self._dist_limit:
+                del self._dist[next(iter(self._dist))]
+            self._dist[target] = dist
+        return dist
+
+    def local_distances(self, target, radius):
+        key = (target, radius)
+        dist = self._local.get(key)
+        if dist is None:
+            w = self.width
+            tx, ty = target % w, target // w
+            dist = LocalDistances()
+            dist[target] = 0
+            frontier = [target]
+            neighbors = self.neighbors
+            for cell in frontier:
+                nd = dist[cell] + 1
+                for _, j in neighbors[cell]:
+                    if j not in dist and abs(j % w - tx) <= radius and abs(j // w - ty) <= radius:
+                        dist[j] = nd
+                        frontier.append(j)
+            if len(self._local) >= self.LOCAL_CACHE_SIZE:
+                del self._local[next(iter(self._local))]
+            self._local[key] = dist
+        return dist
+
+    def step_toward(self, cell, target, radius=None):
+        """(arah, sel) tetangga di jalur terpendek ke target, atau None."""
+        dist = self.distances(target, radius)
+        best = None
+        best_dist = -1
+        for d, j in self.neighbors[cell]:
+            dj = dist[j]
+            if dj >= 0 and (best is None or dj < best_dist):
+                best = (d, j)
+                best_dist = dj
+        return best
+
+    def step_away(self, cell, threat, radius=None):
+        """(arah, sel) tetangga yang paling jauh dari threat, atau None."""
+        dist = self.distances(threat, radius)
+        best = None
+        best_dist = -1
+        for d, j in self.neighbors[cell]:
+            dj = dist[j]
+            if dj > best_dist:
+                best = (d, j)
+                best_dist = dj
+        return best
+
+    def flow_fields(self, target):
+        """(toward, away): langkah (arah, sel) per sel ke arah / menjauhi target.
+
+        Dihitung dari satu BFS dengan aturan yang sama seperti step_toward()
+        dan step_away(), sehingga semua musuh cukup membaca satu entri list
+        per langkah (None jika tidak ada langkah).
+        """
+        fields = self._flow.pop(target, None)
+        if fields is None:
+            dist = self.distances(target)
+            toward = []
+            away = []
+            for nbrs in self.neighbors:
+                best = far = None
+                best_dist = far_dist = -1
+                for d, j in nbrs:
+                    dj = dist[j]
+                    if dj >= 0 and (best is None or dj < best_dist):
+                        best = (d, j)
+                        best_dist = dj
+                    if dj > far_dist:
+                        far = (d, j)
+                        far_dist = dj
+                toward.append(best)
+                away.append(far)
+            fields = (toward, away)
+            if len(self._flow) >= self.FLOW_CACHE_SIZE:
+                del self._flow[next(iter(self._flow))]
+        self._flow[target] = fields # Paling baru dipakai di akhir (LRU)
+        return fields
+
+    def junctions(self):
+        """JunctionGraph maze ini, dibangun sekali lalu disimpan."""
+        if self._graph is None:
+            self._graph = JunctionGraph(self)
+        return self._graph
+
+    def first_open(self, cell, directions):
+        """(arah, sel) pertama yang terbuka menurut urutan directions."""
+        moves = self.moves[cell]
+        for d in directions:
+            j = moves[d]
+            if j >= 0:
+                return d, j
+        return None
+
+
+class JunctionGraph:
+    """Maze sebagai graph junction dan koridor.
+
+    Node adalah sel terbuka yang tidak punya tepat dua tetangga (junction
+    dan jalan buntu); edge adalah koridor di antaranya beserta panjangnya.
+    Maze 19x21 hanya punya puluhan node, sehingga prediksi dan pencarian
+    rute untuk AI musuh cukup murah untuk dijalankan tiap langkah. Jarak
+    di graph sama dengan jarak BFS NavTable.
+    """
+    DIST_CACHE_SIZE = 64
+
+    def __init__(self, nav):
+        self.nav = nav
+        neighbors = nav.neighbors
+        size = len(neighbors)
+        self.nodes = [] # node id -> sel
+        self.node_id = [-1] * size
+        self.edges = [] # node id -> [(arah, node tujuan, panjang, arah masuk di tujuan)]
+        # Sel koridor -> (node a, jarak ke a, arah ke a, arah masuk di a, lalu sama untuk b)
+        self.link = {}
+        for cell in range(size):
+            if nav.is_open[cell] and len(neighbors[cell]) != 2:
+                self._add_node(cell)
+        for node in range(len(self.nodes)):
+            self._walk_edges(node)
+        # Koridor melingkar tanpa junction: jadikan satu selnya node
+        for cell in range(size):
+            if nav.is_open[cell] and self.node_id[cell] < 0 and cell not in self.link:
+                self._walk_edges(self._add_node(cell))
+        self._dist = {}
+
+    def _add_node(self, cell):
+        self.node_id[cell] = len(self.nodes)
+        self.nodes.append(cell)
+        self.edges.append([])
+        return self.node_id[cell]
+
+    def _walk_edges(self, node):
+        """Telusuri tiap koridor yang keluar dari node sampai node berikutnya."""
+        neighbors = self.nav.neighbors
+        start = self.nodes[node]
+        for d, cell in neighbors[start]:
+            path = [] # (sel, arah kembali ke sel sebelumnya)
+            prev, back = start, (d + 2) % 4
+            while self.node_id[cell] < 0:
+                path.append((cell, back))
+                for nd, nxt in neighbors[cell]:
+                    if nxt != prev:
+                        break
+                prev, cell, back = cell, nxt, (nd + 2) % 4
+            end = self.node_id[cell]
+            length = len(path) + 1
+            self.edges[node].append((d, end, length, back))
+            for i, (c, to_start) in enumerate(path):
+                if c not in self.link:
+                    to_end = path[i + 1][1] if i + 1 < len(path) else None
+                    if to_end is None:
+                        to_end = (back + 2) % 4
+                    else:
+                        to_end = (to_end + 2) % 4
+                    self.link[c] = (node, i + 1, to_start, d, end, length - i - 1, to_end, back)
+
+    def node_distances(self, target):
+        """Jarak graph dari setiap node ke node target (-1 jika tidak terjangkau)."""
+        dist = self._dist.get(target)
+        if dist is None:
+            dist = [-1] * len(self.nodes)
+            dist[target] = 0
+            heap = [(0, target)]
+            edges = self.edges
+            while heap:
+                du, u = heapq.heappop(heap)
+                if du > dist[u]:
+                    continue
+                for _, v, length, _ in edges[u]:
+                    dv = du + length
+                    if dist[v] < 0 or dv < dist[v]:
+                        dist[v] = dv
+                        heapq.heappush(heap, (dv, v))
+            if len(self._dist) >= self.DIST_CACHE_SIZE:
+                del self._dist[next(iter(self._dist))]
+            self._dist[target] = dist
+        return dist
+
+    def routes(self, cell, target):
+        """[(arah, jarak total)] dari cell ke junction target, urut arah."""
+        dist = self.node_distances(self.node_id[target])
+        node = self.node_id[cell]
+        if node >= 0:
+            options = [(d, length + dist[to]) for d, to, length, _ in self.edges[node] if dist[to] >= 0]
+        elif cell not in self.link:
+            # Sel di luar graph (mis. spawn tiger di tembok layout): lewat tetangganya
+            options = [(d, 1 + dj) for d, j in self.nav.neighbors[cell]
+                       for dj in (self.distance(j, target),) if dj >= 0]
+        else:
+            a, da, dir_a, _, b, db, dir_b, _ = self.link[cell]
+            options = sorted(opt for opt in ((dir_a, da + dist[a] if dist[a] >= 0 else -1),
+                                             (dir_b, db + dist[b] if dist[b] >= 0 else -1))
+                             if opt[1] >= 0)
+        return options
+
+    def distance(self, cell, target):
+        """Jarak terpendek cell ke junction target (-1 jika tidak terjangkau)."""
+        if cell == target:
+            return 0
+        if self.node_id[cell] < 0 and cell not in self.link:
+            return -1 # Seperti BFS: sel di luar graph tidak terjangkau
+        options = self.routes(cell, target)
+        return min(total for _, total in options) if options else -1
+
+    def step_toward(self, cell, target):
+        """(arah, sel) pertama di rute terpendek ke junction target, atau None.
+
+        Arah dengan jarak sama dipilih sesuai urutan arah, sama seperti
+        NavTable.step_toward().
+        """
+        best = None
+        for d, total in self.routes(cell, target):
+            if best is None or total < best[1]:
+                best = (d, total)
+        if best is None:
+            return None
+        return best[0], self.nav.moves[cell][best[0]]
+
+    def predict(self, cell, direction):
+        """(junction, arah masuk) berikutnya bagi sesuatu di cell yang bergerak ke direction.
+
+        Di koridor, junction di depan adalah ujung yang tidak di belakang.
+        Di junction, jika direction terbuka tujuannya junction di ujung
+        koridor itu; jika tidak, junction ini sendiri. Arah masuk adalah
+        arah di junction tersebut yang menunjuk kembali ke cell. Untuk sel
+        di luar graph hasilnya cell itu sendiri.
+        """
+        node = self.node_id[cell]
+        back = (direction + 2) % 4
+        if node < 0 and cell not in self.link:
+            return cell, back
+        if node >= 0:
+            for d, to, _, arrive in self.edges[node]:
+                if d == direction:
+                    return self.nodes[to], arrive
+            return cell, back
+        a, _, dir_a, enter_a, b, _, _, enter_b = self.link[cell]
+        if dir_a == back:
+            return self.nodes[b], enter_b
+        return self.nodes[a], enter_a
+
+    def exits(self, junction, arrive):
+        """Junction tetangga yang bisa dituju dari junction selain lewat arah arrive."""
+        if self.node_id[junction] < 0:
+            return []
+        return [self.nodes[to] for d, to, _, _ in self.edges[self.node_id[junction]] if d != arrive]
+
+
+_nav_cache = {}
+_nav_lock = threading.Lock() # nav_table juga dipanggil dari thread prefetch
+NAV_CACHE_SIZE = 32
+NAV_CACHE_CELLS = 200_000 # Batas total sel; maze besar menggeser maze lama
+
+
+def nav_table(maze):
+    """NavTable untuk maze, di-cache berdasarkan hash letak tembok.
+
+    maze boleh berupa Maze atau list of lists.
+    """
+    if not isinstance(maze, Maze):
+        maze = Maze.from_rows(maze)
+    key = (maze.width, maze.height, maze.walls)
+    table = _nav_cache.get(key)
+    if table is None:
+        table = NavTable(maze)
+        with _nav_lock:
+            if key not in _nav_cache:
+                cells = maze.width * maze.height
+                while _nav_cache and (len(_nav_cache) >= NAV_CACHE_SIZE or
+                                      cells + sum(w * h for w, h, _ in _nav_cache) > NAV_CACHE_CELLS):
+                    del _nav_cache[next(iter(_nav_cache))]
+                _nav_cache[key] = table
+            table = _nav_cache[key]
+    return table
+
+
+def build_level_maze(rng, warm_cells=(), width=MAZE_WIDTH, height=MAZE_HEIGHT):
+    """Generate Maze acak plus NavTable-nya, siap dipakai level berikutnya.
+
+    Jarak BFS ke pojok scatter, ghost house dan warm_cells, serta
+    JunctionGraph-nya, ikut dihitung di muka.
+    """
+    maze = Maze.from_rows(generate_random_maze(rng, width, height))
+    nav = nav_table(maze)
+    for x, y in list(nav.corners) + [nav.home] + list(warm_cells):
+        nav.distances(nav.index(x, y))
+    nav.junctions()
+    return maze
+
+
+class MazePrefetcher:
+    """Generate maze level berikutnya di worker thread selama level berjalan.
+
+    request(seed) memulai generate di background, take(seed) mengambil
+    hasilnya. Jika hasil belum siap (atau untuk seed lain) saat take(),
+    maze dibuat langsung di thread pemanggil dan dihitung sebagai miss.
+    Maze hanya bergantung pada seed, jadi hasilnya sama dengan atau tanpa
+    prefetch.
+    """
+
+    def __init__(self, warm_cells=(), width=MAZE_WIDTH, height=MAZE_HEIGHT):
+        self.warm_cells = tuple(warm_cells)
+        self.width = width
+        self.height = height
+        # concurrent.futures baru di-import di sini agar import modul maze tetap ringan
+        from concurrent.futures import ThreadPoolExecutor
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="maze-prefetch")
+        self.future = None
+        self.seed = None
+        self.hits = 0
+        self.misses = 0
+
+    def request(self, seed):
+        """Mulai generate maze untuk seed di background."""
+        if self.future is not None and self.seed == seed:
+            return
+        if self.future is not None:
+            self.future.cancel()
+        self.seed = seed
+        self.future = self.executor.submit(build_level_maze, random.Random(seed),
+                                           self.warm_cells, self.width, self.height)
+
+    def take(self, seed):
+        """Maze untuk seed; hasil prefetch jika sudah siap."""
+        future = self.future
+        if (future is not None and self.seed == seed and future.done()
+                and future.exception() is None):
+            self.hits += 1
+            maze = future.result()
+        else:
+            # Belum siap (atau gagal): generate di tempat dengan seed yang sama
+            self.misses += 1
+            if future is not None:
+                future.cancel()
+            maze = build_level_maze(random.Random(seed), self.warm_cells,
+                                    self.width, self.height)
+        self.future = None
+        self.seed = None
+        return maze
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses}
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.future = None
+
+
+LAYOUT_MAZE = Maze.from_rows(MAZE_LAYOUT)
@@ -0,0 +1,120 @@
+"""Statistik generator maze Macan Hungry dalam jumlah besar.
+
+Setiap maze dibuat dengan generate_random_maze() dari seed tetap (seed
+awal + index), sama seperti maze level di game. Dilaporkan: seberapa
+sering kandidat carve_maze() perlu diperbaiki connect_maze() (dan
+alasannya), jumlah terowongan dan kantong yang ditembok, waktu generate,
+jalan buntu dan kepadatan loop. Maze akhir diverifikasi ulang; exit code
+1 jika ada yang tidak valid atau (dengan --max-ms) generate terlalu lama.
+
+Contoh:
+    python macan_mazecheck.py --count 10000
+    python macan_mazecheck.py --count 500000 --size 41x41 --jobs 16 --output mazes.json
+    python macan_mazecheck.py --count 20 --size 301x301 --max-ms 1000
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from macan_maze import Maze, generate_random_maze, maze_problems, maze_stats
+from macan_perf import distribution
+
+
+def check_one(spec):
+    """Generate dan periksa satu maze; kembalikan ringkasan kecil (tuple)."""
+    seed, width, height = spec
+    repairs = []
+    start = time.perf_counter()
+    rows = generate_random_maze(random.Random(seed), width, height, repairs)
+    elapsed = time.perf_counter() - start
+    maze = Maze.from_rows(rows)
+    stats = maze_stats(maze)
+    problems, tunnels, walled = repairs[0] if repairs else ([], 0, 0)
+    reasons = sorted({p.split(':')[0] for p in problems})
+    return (seed, bool(repairs), reasons, tunnels, walled, maze_problems(maze),
+            elapsed, stats["dead_ends"], stats["loop_density"], stats["components"])
+
+
+def summarize(results, width, height, max_ms=None):
+    count = len(results)
+    reasons = {}
+    for r in results:
+        for reason in r[2]:
+            reasons[reason] = reasons.get(reason, 0) + 1
+    invalid = [{"seed": r[0], "problems": r[5]} for r in results if r[5]]
+    slow = [{"seed": r[0], "ms": r[6] * 1000} for r in results
+            if max_ms is not None and r[6] * 1000 > max_ms]
+    return {
+        "size": f"{width}x{height}",
+        "mazes": count,
+        # Kandidat carve_maze yang perlu diperbaiki connect_maze
+        "repair_rate": sum(r[1] for r in results) / count,
+        # Maze yang diperbaiki karena alasan ini
+        "repair_reasons": reasons,
+        "tunnels": distribution([r[3] for r in results]),
+        "walled_pockets": distribution([r[4] for r in results]),
+        "invalid": len(invalid),
+        "invalid_seeds": invalid[:20],
+        "max_ms": max_ms,
+        "slow": len(slow),
+        "slow_seeds": slow[:20],
+        "generate_ms": distribution([r[6] * 1000 for r in results]),
+        "dead_ends": distribution([r[7] for r in results]),
+        "loop_density": distribution([r[8] for r in results]),
+        "components": distribution([r[9] for r in results]),
+    }
+
+
+def run_checks(specs, jobs):
+    if jobs <= 1:
+        return [check_one(spec) for spec in specs]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(check_one, specs, chunksize=max(1, len(specs) // (jobs * 16))))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Verifikasi dan statistik generator maze Macan Hungry")
+    parser.add_argument('--count', type=int, default=10000, help="jumlah maze (default 10000)")
+    parser.add_argument('--size', default='19x21', help="ukuran maze WxH")
+    parser.add_argument('--seed', type=int, default=0, help="seed maze pertama")
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help="jumlah proses (default semua core)")
+    parser.add_argument('--output', help="tulis hasil JSON ke file ini")
+    parser.add_argument('--max-ms', type=float,
+                        help="batas waktu generate per maze; maze yang lebih lambat dihitung gagal")
+    args = parser.parse_args(argv)
+    width, height = (int(v) for v in args.size.lower().split('x'))
+
+    specs = [(args.seed + i, width, height) for i in range(args.count)]
+    start = time.perf_counter()
+    results = run_checks(specs, args.jobs)
+    elapsed = time.perf_counter() - start
+
+    data = summarize(results, width, height, args.max_ms)
+    data["elapsed_sec"] = elapsed
+    data["jobs"] = args.jobs
+    log = lambda line: print(line, file=sys.stderr)
+    log(f"{data['mazes']} mazes {data['size']} in {elapsed:.1f}s ({args.jobs} jobs)")
+    log(f"candidates repaired {data['repair_rate']:.1%}, "
+        f"tunnels p50/max {data['tunnels']['p50']}/{data['tunnels']['max']}, "
+        f"walled pockets max {data['walled_pockets']['max']}, "
+        f"invalid {data['invalid']}, slow {data['slow']}")
+    log(f"generate ms p50 {data['generate_ms']['p50']:.2f} p75 {data['generate_ms']['p75']:.2f} "
+        f"max {data['generate_ms']['max']:.2f}; dead ends p50 {data['dead_ends']['p50']}, "
+        f"loop density p50 {data['loop_density']['p50']:.3f}")
+
+    text = json.dumps(data, indent=1)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text)
+    else:
+        print(text)
+    return 1 if data["invalid"] or data["slow"] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""Pencatat waktu per fase untuk HUD performa dan export JSON."""
+import json
+import math
+import os
+from collections import deque
+
+
+class PerfRecorder:
+    """Ring buffer sampel waktu (detik) per nama metrik."""
+
+    def __init__(self, capacity=600):
+        self.capacity = capacity
+        self.samples = {}
+
+    def record(self, name, seconds):
+        buf = self.samples.get(name)
+        if buf is None:
+            buf = self.samples[name] = deque(maxlen=self.capacity)
+        buf.append(seconds)
+
+    def clear(self):
+        self.samples = {}
+
+    def summary(self, name):
+        """count, mean dan persentil p50/p95/p99/max dalam milidetik."""
+        buf = self.samples.get(name)
+        if not buf:
+            return None
+        ordered = sorted(buf)
+        n = len(ordered)
+
+        def pct(p):
+            return ordered[min(n - 1, max(0, math.ceil(p / 100 * n) - 1))] * 1000
+
+        return {
+            "count": n,
+            "mean_ms": sum(ordered) / n * 1000,
+            "p50_ms": pct(50),
+            "p95_ms": pct(95),
+            "p99_ms": pct(99),
+            "max_ms": ordered[-1] * 1000,
+        }
+
+    def summaries(self):
+        return {name: self.summary(name) for name in sorted(self.samples)}
+
+    def to_dict(self, extra=None):
+        data = dict(extra or {})
+        data.update({
+            "capacity": self.capacity,
+            "summary": self.summaries(),
+            "samples_ms": {name: [s * 1000 for s in buf]
+                           for name, buf in sorted(self.samples.items())},
+        })
+        return data
+
+    def export_json(self, path, extra=None):
+        """Tulis ringkasan dan semua sampel di ring buffer ke file JSON.
+
+        extra (dict) ikut ditulis di level atas, mis. statistik GameLoop.
+        """
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(extra), f, indent=1)
+
+
+def distribution(values):
+    """min, persentil 25/50/75, max dan mean dari list angka."""
+    ordered = sorted(values)
+    n = len(ordered)
+
+    def pct(p):
+        return ordered[min(n - 1, int(p / 100 * n))]
+
+    return {"min": ordered[0], "p25": pct(25), "p50": pct(50), "p75": pct(75),
+            "max": ordered[-1], "mean": sum(ordered) / n}
+
+
+def startup_report(marks):
+    """Durasi tiap fase startup (ms) dari titik waktu di marks (lihat macan_main.STARTUP)."""
+    phases = [("import", "start", "imported"), ("qt_app", "imported", "app"),
+              ("window", "app", "window"), ("first_paint", "window", "first_paint"),
+              ("total", "start", "first_paint")]
+    return {name: (marks[end] - marks[begin]) * 1000
+            for name, begin, end in phases if begin in marks and end in marks}
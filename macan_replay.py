@@ -0,0 +1,154 @@
+"""Rekaman dan pemutaran ulang game Macan Hungry.
+
+Replay berisi seed game, ukuran maze, jumlah musuh swarm dan input per tick (hanya tick saat
+arah tiger berubah). Karena semua keacakan GameEngine berasal dari seed,
+memutar input yang sama menghasilkan game yang sama persis.
+
+Contoh:
+    python macan_replay.py macan_last_replay.mhr            # fast-forward headless
+    python macan_replay.py macan_last_replay.mhr --verify   # cek hasil akhir sama
+"""
+import argparse
+import json
+import sys
+import time
+import zlib
+
+from macan_engine import GameEngine
+from macan_save import CRC, encode_game, write_atomic
+
+REPLAY_VERSION = 3 # v3: maze acak diperbaiki lokal (connect_maze), maze level > 1 berubah
+
+
+def final_state(engine):
+    """Ringkasan state akhir untuk verifikasi replay."""
+    return {
+        "tick": engine.tick,
+        "score": engine.score,
+        "lives": engine.lives,
+        "level": engine.level,
+        "game_over": engine.game_over,
+        # Tanpa CRC penutup: crc32 dari data + crc32-nya selalu konstan
+        "state_crc": zlib.crc32(encode_game(engine)[:-CRC.size]),
+    }
+
+
+class ReplayRecorder:
+    """Mencatat input per tick sejak awal game baru di engine."""
+
+    def __init__(self, engine):
+        self.seed = engine.seed
+        self.width = engine.width
+        self.height = engine.height
+        self.swarm = engine.swarm
+        self.inputs = [] # [tick, arah atau None]
+
+    def record(self, tick, action):
+        self.inputs.append([tick, action])
+
+    def to_dict(self, engine):
+        return {
+            "version": REPLAY_VERSION,
+            "seed": self.seed,
+            "width": self.width,
+            "height": self.height,
+            "swarm": self.swarm,
+            "ticks": engine.tick,
+            "inputs": list(self.inputs),
+            "final": final_state(engine),
+        }
+
+    def save(self, path, engine):
+        return write_replay(path, self.to_dict(engine))
+
+
+def write_replay(path, data):
+    """Tulis dict replay (hasil to_dict) ke file JSON secara atomik."""
+    return write_atomic(path, json.dumps(data, separators=(',', ':')).encode())
+
+
+class Replay:
+    def __init__(self, seed, width, height, ticks, inputs, final=None, swarm=0):
+        self.seed = seed
+        self.width = width
+        self.height = height
+        self.swarm = swarm
+        self.ticks = ticks
+        self.inputs = inputs
+        self.final = final
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get("version") != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version {data.get('version')}")
+        return cls(data["seed"], data["width"], data["height"], data["ticks"],
+                   data["inputs"], data.get("final"), data.get("swarm", 0))
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls.from_dict(json.loads(f.read()))
+
+
+class ReplayPlayer:
+    """Menyuapkan input replay ke engine, satu tick per apply()."""
+
+    def __init__(self, replay):
+        self.replay = replay
+        self.actions = {tick: action for tick, action in replay.inputs}
+
+    def start(self, engine):
+        """Siapkan engine di awal game replay (ukuran, swarm dan seed sama)."""
+        engine.width = self.replay.width
+        engine.height = self.replay.height
+        engine.swarm = self.replay.swarm
+        engine.new_game(self.replay.seed)
+
+    def apply(self, engine):
+        """Pasang input untuk tick berikutnya; dipanggil tepat sebelum step()."""
+        tick = engine.tick + 1
+        if tick in self.actions:
+            engine.next_move = self.actions[tick]
+
+    def finished(self, engine):
+        return engine.game_over or engine.tick >= self.replay.ticks
+
+
+def play_headless(replay, ticks=None):
+    """Putar replay secepat mungkin tanpa Qt; kembalikan engine akhir."""
+    # Engine baru dengan seed yang sama = state awal game yang direkam
+    engine = GameEngine(replay.width, replay.height, seed=replay.seed, swarm=replay.swarm)
+    player = ReplayPlayer(replay)
+    limit = replay.ticks if ticks is None else min(ticks, replay.ticks)
+    while engine.tick < limit and not engine.game_over:
+        player.apply(engine)
+        engine.step()
+    return engine
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Putar ulang replay Macan Hungry tanpa window")
+    parser.add_argument('replay', help="file replay (.mhr)")
+    parser.add_argument('--ticks', type=int, help="berhenti setelah tick ini")
+    parser.add_argument('--verify', action='store_true',
+                        help="bandingkan state akhir dengan yang tercatat di replay")
+    args = parser.parse_args(argv)
+
+    replay = Replay.load(args.replay)
+    start = time.perf_counter()
+    engine = play_headless(replay, args.ticks)
+    elapsed = time.perf_counter() - start
+    result = final_state(engine)
+    result["ticks_per_sec"] = engine.tick / elapsed if elapsed > 0 else 0.0
+
+    status = 0
+    if args.verify:
+        result["match"] = replay.final is not None and all(
+            result[key] == value for key, value in replay.final.items())
+        status = 0 if result["match"] else 1
+    print(json.dumps(result, indent=1))
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,215 @@
+"""Format save biner Macan Hungry.
+
+Layout (little-endian):
+    header   MAGIC, versi, ukuran maze, state game, tiger, jumlah musuh,
+             mode swarm (0 = klasik), tick engine
+    musuh    posisi, target, arah dan flag per musuh
+    maze     bitboard tembok, makanan dan power, masing-masing
+             ceil(width * height / 8) byte
+    crc32    checksum semua byte sebelumnya
+
+File ditulis atomik: isi ditulis ke file sementara di folder yang sama,
+di-fsync, lalu os.replace() ke nama aslinya, sehingga crash saat menulis
+tidak pernah merusak save lama.
+"""
+import json
+import os
+import struct
+import tempfile
+import zlib
+
+from macan_maze import Maze, nav_table
+from macan_engine import ENEMY_SPECS
+
+MAGIC = b'MCNH'
+SAVE_VERSION = 4
+
+# width, height, score, lives, level, power_mode, power_timer, scatter_timer,
+# move_cooldown, enemy_move_cooldown, next_move, game_over,
+# tiger x, y, direction, jumlah musuh, swarm, tick
+HEADER = struct.Struct('<4sHHHqiI?iIhhb?HHBHHI')
+# Versi lama masih bisa dibaca; mode swarm ditebak dari jumlah musuh.
+# Versi 1: jumlah musuh 1 byte (sebelum mode swarm). Versi 2: tanpa field swarm.
+# Versi 3: tanpa tick (tick mulai lagi dari 0 saat load).
+HEADERS = {1: struct.Struct('<4sHHHqiI?iIhhb?HHBB'),
+           2: struct.Struct('<4sHHHqiI?iIhhb?HHBH'),
+           3: struct.Struct('<4sHHHqiI?iIhhb?HHBHH'), SAVE_VERSION: HEADER}
+VERSION = struct.Struct('<4sH')
+# x, y, target_x, target_y, direction, flags
+ENEMY = struct.Struct('<HHHHBB')
+CRC = struct.Struct('<I')
+
+FLAG_SCARED = 1
+FLAG_SCATTER = 2
+FLAG_RETURNING = 4
+
+# Folder save per user (LOCALAPPDATA di Windows, home di OS lain). Folder
+# tidak dibuat saat import; write_atomic() membuatnya saat file pertama ditulis.
+SAVE_DIR = os.path.join(os.getenv('LOCALAPPDATA') or os.path.expanduser("~"), "MacanHungry")
+
+
+def encode_game(engine):
+    """Snapshot lengkap GameEngine sebagai bytes (cepat, aman di GUI thread)."""
+    maze = engine.maze
+    tiger = engine.tiger
+    next_move = -1 if engine.next_move is None else engine.next_move
+    parts = [HEADER.pack(MAGIC, SAVE_VERSION, maze.width, maze.height,
+                         engine.score, engine.lives, engine.level,
+                         engine.power_mode, engine.power_timer, engine.scatter_timer,
+                         engine.move_cooldown, engine.enemy_move_cooldown, next_move,
+                         engine.game_over, tiger.x, tiger.y, tiger.direction,
+                         len(engine.enemies), engine.swarm, engine.tick)]
+    for e in engine.enemies:
+        flags = ((FLAG_SCARED if e.scared else 0) | (FLAG_SCATTER if e.scatter_mode else 0) |
+                 (FLAG_RETURNING if e.returning else 0))
+        parts.append(ENEMY.pack(e.x, e.y, e.target_x, e.target_y, e.direction, flags))
+    size = (maze.width * maze.height + 7) // 8
+    for mask in (maze.walls, maze.food, maze.power):
+        parts.append(mask.to_bytes(size, 'little'))
+    data = b''.join(parts)
+    return data + CRC.pack(zlib.crc32(data))
+
+
+def decode_game(data):
+    """Parse bytes save menjadi dict state; ValueError jika rusak atau versi lain."""
+    if len(data) < VERSION.size + CRC.size:
+        raise ValueError("Save file is truncated")
+    body, (crc,) = data[:-CRC.size], CRC.unpack(data[-CRC.size:])
+    if zlib.crc32(body) != crc:
+        raise ValueError("Save file is corrupted (checksum mismatch)")
+    magic, version = VERSION.unpack_from(body)
+    if magic != MAGIC:
+        raise ValueError("Not a Macan Hungry save file")
+    header = HEADERS.get(version)
+    if header is None:
+        raise ValueError(f"Unsupported save version {version}")
+    if len(body) < header.size:
+        raise ValueError("Save file is truncated")
+    fields = header.unpack_from(body)
+    (magic, version, width, height, score, lives, level, power_mode, power_timer,
+     scatter_timer, move_cooldown, enemy_move_cooldown, next_move, game_over,
+     tiger_x, tiger_y, tiger_dir, enemy_count) = fields[:18]
+    swarm = fields[18] if len(fields) > 18 else None
+    tick = fields[19] if len(fields) > 19 else 0
+
+    offset = header.size
+    enemies = []
+    for _ in range(enemy_count):
+        x, y, tx, ty, direction, flags = ENEMY.unpack_from(body, offset)
+        offset += ENEMY.size
+        enemies.append({"x": x, "y": y, "target_x": tx, "target_y": ty,
+                        "direction": direction,
+                        "scared": bool(flags & FLAG_SCARED),
+                        "scatter_mode": bool(flags & FLAG_SCATTER),
+                        "returning": bool(flags & FLAG_RETURNING)})
+    size = (width * height + 7) // 8
+    if len(body) != offset + 3 * size:
+        raise ValueError("Save file has an unexpected length")
+    walls, food, power = (int.from_bytes(body[offset + i * size:offset + (i + 1) * size], 'little')
+                          for i in range(3))
+    return {
+        "version": version,
+        "score": score,
+        "lives": lives,
+        "level": level,
+        "power_mode": power_mode,
+        "power_timer": power_timer,
+        "scatter_timer": scatter_timer,
+        "move_cooldown": move_cooldown,
+        "enemy_move_cooldown": enemy_move_cooldown,
+        "next_move": None if next_move < 0 else next_move,
+        "game_over": game_over,
+        "maze": Maze(width, height, walls, food, power),
+        "tiger": {"x": tiger_x, "y": tiger_y, "direction": tiger_dir},
+        "enemies": enemies,
+        "swarm": swarm,
+        "tick": tick,
+    }
+
+
+def decode_legacy_json(data):
+    """State dari save JSON lama (macan_save.json), tanpa state power/scatter."""
+    state = json.loads(data)
+    state["maze"] = Maze.from_rows(state["maze"])
+    return state
+
+
+def restore_game(engine, state):
+    """Terapkan dict state hasil decode ke GameEngine."""
+    engine.score = state["score"]
+    engine.lives = state["lives"]
+    engine.level = state["level"]
+    engine.set_maze(state["maze"], state.get("nav"))
+    engine.maze_seed = None # Seed maze tidak ikut disimpan
+    engine.game_over = state.get("game_over", False)
+    engine.power_mode = state.get("power_mode", False)
+    engine.power_timer = state.get("power_timer", 0)
+    engine.scatter_timer = state.get("scatter_timer", 0)
+    engine.move_cooldown = state.get("move_cooldown", 0)
+    engine.enemy_move_cooldown = state.get("enemy_move_cooldown", 0)
+    engine.next_move = state.get("next_move")
+    engine.tick = state.get("tick", 0) # Save versi lama: tick mulai dari 0
+
+    # Mode swarm dari header; save versi lama (dan JSON) hanya punya jumlah
+    # musuh: len(ENEMY_SPECS) = klasik, lainnya swarm
+    count = len(state["enemies"])
+    swarm = state.get("swarm")
+    if swarm is None and count:
+        swarm = 0 if count == len(ENEMY_SPECS) else count
+    if swarm is not None:
+        engine.swarm = swarm
+        if count != len(engine.enemies):
+            engine.enemies = engine.make_enemies()
+    engine.buckets = None
+
+    engine.tiger.x = state["tiger"]["x"]
+    engine.tiger.y = state["tiger"]["y"]
+    engine.tiger.direction = state["tiger"].get("direction", engine.tiger.direction)
+
+    # Load enemy positions if count matches
+    if len(state["enemies"]) == len(engine.enemies):
+        for enemy, e_data in zip(engine.enemies, state["enemies"]):
+            enemy.x = e_data["x"]
+            enemy.y = e_data["y"]
+            enemy.target_x = e_data.get("target_x", e_data["x"])
+            enemy.target_y = e_data.get("target_y", e_data["y"])
+            enemy.direction = e_data.get("direction", enemy.direction)
+            enemy.scared = e_data.get("scared", False)
+            enemy.scatter_mode = e_data.get("scatter_mode", False)
+            enemy.returning = e_data.get("returning", False)
+
+
+def write_atomic(path, data):
+    """Tulis bytes ke path lewat file sementara + os.replace()."""
+    folder = os.path.dirname(path) or '.'
+    os.makedirs(folder, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix='.' + os.path.basename(path), suffix='.tmp', dir=folder)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    return path
+
+
+def read_save(path):
+    """Baca dan decode file save; format JSON lama dikenali dari isinya.
+
+    NavTable maze ikut dibangun di sini (state["nav"]), sehingga untuk
+    maze besar kerja itu terjadi di thread IO, bukan saat restore_game.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if data[:len(MAGIC)] == MAGIC:
+        state = decode_game(data)
+    else:
+        state = decode_legacy_json(data)
+    state["nav"] = nav_table(state["maze"])
+    return state
@@ -0,0 +1,366 @@
+"""Log telemetry biner Macan Hungry dan tool query-nya.
+
+Log hanya ditambah di akhir (append-only). Setiap flush menulis satu
+chunk (little-endian):
+
+    MAGIC, versi u16, panjang u32, crc32 u32   header chunk
+    record ...                                 sebanyak panjang byte
+
+Setiap record diawali panjangnya:
+
+    size u16   jumlah byte sesudah field ini (kind + tick + payload)
+    kind u8    REC_*
+    tick u32   engine.tick saat event terjadi (game hasil load melanjutkan
+               tick dari save, bukan mulai dari 0)
+    payload    struct per kind (PAYLOADS)
+
+Jika game crash di tengah penulisan, chunk terakhir terpotong dan CRC-nya
+tidak cocok; pembaca melompat ke MAGIC berikutnya dan menghitung byte
+yang dilewati. Record dengan kind yang tidak dikenal dilewati berdasarkan
+size-nya.
+
+Contoh:
+    python macan_telemetry.py ~/MacanHungry/macan_telemetry.mhl
+    python macan_telemetry.py logs/*.mhl --jobs 8 --top 20
+"""
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+from macan_engine import (EVT_FOOD, EVT_POWER, EVT_ENEMY_EATEN, EVT_LIFE_LOST,
+                          EVT_GAME_OVER, EVT_LEVEL_UP)
+from macan_perf import distribution
+
+MAGIC = b'MCNT'
+TELEMETRY_VERSION = 1
+CHUNK_HEADER = struct.Struct('<4sHII') # magic, versi, panjang, crc32 isi
+RECORD = struct.Struct('<HBI') # size, kind, tick
+
+REC_GAME = 1
+REC_LEVEL = 2
+REC_FOOD = 3
+REC_POWER = 4
+REC_ENEMY_EATEN = 5
+REC_LIFE_LOST = 6
+REC_LEVEL_UP = 7
+REC_GAME_OVER = 8
+
+PAYLOADS = {
+    REC_GAME: struct.Struct('<QHHHHBd'),  # seed, width, height, swarm, tick_ms, flags, unix time
+    REC_LEVEL: struct.Struct('<HBQ'),     # level, flags maze, seed maze
+    REC_FOOD: struct.Struct('<HH'),       # x, y
+    REC_POWER: struct.Struct('<HH'),      # x, y
+    REC_ENEMY_EATEN: struct.Struct('<HHHB'),  # x, y, index musuh, personality
+    REC_LIFE_LOST: struct.Struct('<HHHBB'),   # x, y, index musuh, personality, sisa nyawa
+    REC_LEVEL_UP: struct.Struct('<H'),    # level baru
+    REC_GAME_OVER: struct.Struct('<q'),   # skor akhir
+}
+
+GAME_LOADED = 1 # Game dilanjutkan dari save
+MAZE_LAYOUT = 1 # Maze layout bawaan (level 1), seed tidak dipakai
+MAZE_UNKNOWN = 2 # Seed maze tidak diketahui (game dari save)
+
+# Kode personality di file; urutan tetap agar log lama tetap terbaca
+PERSONALITIES = ('chase', 'ambush', 'patrol', 'random')
+PERSONALITY_CODES = {name: code for code, name in enumerate(PERSONALITIES)}
+UNKNOWN_PERSONALITY = 255
+
+
+class TelemetryLog:
+    """Buffer record di memori; take() menyerahkan bytes untuk ditulis di thread lain."""
+
+    def __init__(self, tick_ms):
+        self.tick_ms = tick_ms
+        self.buffer = bytearray()
+        self.records = 0
+
+    def add(self, kind, tick, *values):
+        payload = PAYLOADS[kind]
+        self.buffer += RECORD.pack(RECORD.size - 2 + payload.size, kind, tick)
+        self.buffer += payload.pack(*values)
+        self.records += 1
+
+    def start_game(self, engine, loaded=False):
+        """Record awal game (atau game hasil load) dan level yang sedang dimainkan."""
+        self.add(REC_GAME, engine.tick, engine.seed, engine.width, engine.height, engine.swarm,
+                 self.tick_ms, GAME_LOADED if loaded else 0, time.time())
+        self.add_level(engine, MAZE_UNKNOWN if loaded else 0)
+
+    def add_level(self, engine, flags=0):
+        seed = engine.maze_seed
+        if seed is None:
+            # Tanpa seed: layout bawaan, kecuali memang tidak diketahui (save)
+            if not flags & MAZE_UNKNOWN:
+                flags |= MAZE_LAYOUT
+            seed = 0
+        self.add(REC_LEVEL, engine.tick, engine.level, flags, seed)
+
+    def log_events(self, engine, events):
+        """Catat event dari satu GameEngine.step()."""
+        tick = engine.tick
+        for event in events:
+            kind = event[0]
+            if kind == EVT_FOOD:
+                self.add(REC_FOOD, tick, event[1], event[2])
+            elif kind == EVT_POWER:
+                self.add(REC_POWER, tick, event[1], event[2])
+            elif kind == EVT_ENEMY_EATEN:
+                self.add(REC_ENEMY_EATEN, tick, event[1], event[2], event[3],
+                         self.personality(engine, event[3]))
+            elif kind == EVT_LIFE_LOST:
+                self.add(REC_LIFE_LOST, tick, event[1], event[2], event[3],
+                         self.personality(engine, event[3]), max(0, engine.lives))
+            elif kind == EVT_GAME_OVER:
+                self.add(REC_GAME_OVER, tick, event[1])
+            elif kind == EVT_LEVEL_UP:
+                self.add(REC_LEVEL_UP, tick, event[1])
+                self.add_level(engine)
+
+    @staticmethod
+    def personality(engine, index):
+        return PERSONALITY_CODES.get(engine.enemies[index].personality, UNKNOWN_PERSONALITY)
+
+    def take(self):
+        """Bytes satu chunk (header + record sejak take() terakhir), atau b'' jika kosong."""
+        if not self.buffer:
+            return b''
+        data = bytes(self.buffer)
+        self.buffer.clear()
+        return CHUNK_HEADER.pack(MAGIC, TELEMETRY_VERSION, len(data), zlib.crc32(data)) + data
+
+
+def append_log(path, data):
+    """Tambahkan chunk ke akhir file log (dipanggil di thread IO)."""
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    with open(path, 'ab') as f:
+        f.write(data)
+    return path
+
+
+def scan_log(path):
+    """Baca satu log (mmap) dan kembalikan counter yang bisa digabung dengan merge()."""
+    stats = {
+        "files": 1, "bytes": 0, "records": 0, "skipped_bytes": 0, "unknown_records": 0,
+        "games": 0, "game_overs": 0, "scores": [], "ticks": 0,
+        "levels": {}, # level -> [dimulai, selesai, mati, makanan, power, musuh dimakan]
+        "clear_ticks": {}, # level -> [tick sampai selesai]
+        "killers": {}, # personality -> jumlah
+        "eaten": {}, # personality -> jumlah
+        "mazes": {}, # seed maze -> [dimainkan, selesai, mati]
+        "tick_ms": None,
+    }
+    size = os.path.getsize(path)
+    stats["bytes"] = size
+    if size == 0:
+        return stats
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        scan_buffer(buf, size, stats)
+    return stats
+
+
+def scan_buffer(buf, size, stats):
+    levels = stats["levels"]
+    clear_ticks = stats["clear_ticks"]
+    killers = stats["killers"]
+    eaten = stats["eaten"]
+    mazes = stats["mazes"]
+    unpack_chunk = CHUNK_HEADER.unpack_from
+    unpack_record = RECORD.unpack_from
+    unpack_level = PAYLOADS[REC_LEVEL].unpack_from
+    unpack_life = PAYLOADS[REC_LIFE_LOST].unpack_from
+    unpack_eaten = PAYLOADS[REC_ENEMY_EATEN].unpack_from
+    unpack_game = PAYLOADS[REC_GAME].unpack_from
+    unpack_over = PAYLOADS[REC_GAME_OVER].unpack_from
+    header = CHUNK_HEADER.size
+    head = RECORD.size
+
+    level = None # Counter level yang sedang dimainkan
+    level_no = 0
+    level_start = 0
+    maze = None
+    game_start = last_tick = 0 # Waktu main per game = tick terakhir - tick record GAME
+    records = 0
+    off = 0
+    while off < size:
+        if off + header <= size:
+            magic, version, length, crc = unpack_chunk(buf, off)
+            start = off + header
+            end = start + length
+        if (off + header > size or magic != MAGIC or version != TELEMETRY_VERSION
+                or end > size or zlib.crc32(buf[start:end]) != crc):
+            # Chunk rusak/terpotong: lanjut dari MAGIC berikutnya
+            found = buf.find(MAGIC, off + 1)
+            found = size if found < 0 else found
+            stats["skipped_bytes"] += found - off
+            off = found
+            continue
+        off = end
+        pos = start
+        while pos < end:
+            length, kind, tick = unpack_record(buf, pos)
+            body = pos + head
+            pos += 2 + length
+            records += 1
+            prev_tick, last_tick = last_tick, tick
+            if kind == REC_FOOD:
+                if level is not None:
+                    level[3] += 1
+            elif kind == REC_LIFE_LOST:
+                _, _, _, personality, _ = unpack_life(buf, body)
+                name = PERSONALITIES[personality] if personality < len(PERSONALITIES) else 'unknown'
+                killers[name] = killers.get(name, 0) + 1
+                if level is not None:
+                    level[2] += 1
+                if maze is not None:
+                    maze[2] += 1
+            elif kind == REC_POWER:
+                if level is not None:
+                    level[4] += 1
+            elif kind == REC_ENEMY_EATEN:
+                _, _, _, personality = unpack_eaten(buf, body)
+                name = PERSONALITIES[personality] if personality < len(PERSONALITIES) else 'unknown'
+                eaten[name] = eaten.get(name, 0) + 1
+                if level is not None:
+                    level[5] += 1
+            elif kind == REC_LEVEL:
+                level_no, flags, seed = unpack_level(buf, body)
+                level = levels.setdefault(level_no, [0, 0, 0, 0, 0, 0])
+                level[0] += 1
+                level_start = tick
+                if flags & MAZE_UNKNOWN:
+                    maze = None
+                else:
+                    maze = mazes.setdefault('layout' if flags & MAZE_LAYOUT else seed, [0, 0, 0])
+                    maze[0] += 1
+            elif kind == REC_LEVEL_UP:
+                if level is not None:
+                    level[1] += 1
+                    clear_ticks.setdefault(level_no, []).append(tick - level_start)
+                if maze is not None:
+                    maze[1] += 1
+            elif kind == REC_GAME:
+                if stats["games"]:
+                    stats["ticks"] += prev_tick - game_start
+                game_start = tick
+                stats["games"] += 1
+                stats["tick_ms"] = unpack_game(buf, body)[4]
+                level = maze = None
+            elif kind == REC_GAME_OVER:
+                stats["game_overs"] += 1
+                stats["scores"].append(unpack_over(buf, body)[0])
+            else:
+                stats["unknown_records"] += 1
+    if stats["games"]:
+        stats["ticks"] += last_tick - game_start
+    stats["records"] = records
+
+
+def merge(total, part):
+    """Gabungkan hasil scan_log() part ke total."""
+    for key in ("files", "bytes", "records", "skipped_bytes", "unknown_records",
+                "games", "game_overs", "ticks"):
+        total[key] += part[key]
+    total["scores"] += part["scores"]
+    total["tick_ms"] = total["tick_ms"] or part["tick_ms"]
+    for key in ("killers", "eaten"):
+        for name, count in part[key].items():
+            total[key][name] = total[key].get(name, 0) + count
+    for key, size in (("levels", 6), ("mazes", 3)):
+        for k, counts in part[key].items():
+            row = total[key].setdefault(k, [0] * size)
+            for i, v in enumerate(counts):
+                row[i] += v
+    for k, ticks in part["clear_ticks"].items():
+        total["clear_ticks"].setdefault(k, []).extend(ticks)
+    return total
+
+
+def summarize(stats, top):
+    """Laporan: kematian per level, waktu clear, personality paling mematikan, maze tersulit."""
+    tick_sec = (stats["tick_ms"] or 50) / 1000
+    levels = {}
+    for level in sorted(stats["levels"]):
+        started, cleared, deaths, food, power, eaten = stats["levels"][level]
+        row = {"started": started, "cleared": cleared, "deaths": deaths,
+               "deaths_per_attempt": deaths / started if started else 0.0,
+               "clear_rate": cleared / started if started else 0.0,
+               "food": food, "power": power, "enemies_eaten": eaten}
+        ticks = stats["clear_ticks"].get(level)
+        if ticks:
+            row["clear_sec"] = {k: v * tick_sec for k, v in distribution(ticks).items()}
+        levels[level] = row
+    deaths = sum(stats["killers"].values())
+    killers = {name: {"kills": count, "share": count / deaths}
+               for name, count in sorted(stats["killers"].items(), key=lambda kv: -kv[1])}
+    hardest = sorted(stats["mazes"].items(), key=lambda kv: (-kv[1][2] / kv[1][0], -kv[1][0]))
+    return {
+        "files": stats["files"],
+        "bytes": stats["bytes"],
+        "records": stats["records"],
+        "skipped_bytes": stats["skipped_bytes"],
+        "unknown_records": stats["unknown_records"],
+        "games": stats["games"],
+        "game_overs": stats["game_overs"],
+        "play_hours": stats["ticks"] * tick_sec / 3600,
+        "score": distribution(stats["scores"]) if stats["scores"] else None,
+        "levels": levels,
+        "killers": killers,
+        "eaten": dict(sorted(stats["eaten"].items(), key=lambda kv: -kv[1])),
+        "hardest_mazes": [{"maze": seed, "played": played, "cleared": cleared, "deaths": d,
+                           "deaths_per_attempt": d / played}
+                          for seed, (played, cleared, d) in hardest[:top] if played],
+    }
+
+
+def scan_logs(paths, jobs):
+    if jobs <= 1 or len(paths) <= 1:
+        parts = [scan_log(path) for path in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            parts = list(pool.map(scan_log, paths))
+    total = parts[0]
+    for part in parts[1:]:
+        merge(total, part)
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query log telemetry Macan Hungry")
+    parser.add_argument('logs', nargs='+', help="file log telemetry (.mhl)")
+    parser.add_argument('--top', type=int, default=10, help="jumlah maze tersulit yang ditampilkan")
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help="jumlah proses untuk banyak file (default semua core)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    stats = scan_logs(args.logs, args.jobs)
+    elapsed = time.perf_counter() - start
+    data = summarize(stats, args.top)
+    data["elapsed_sec"] = elapsed
+
+    log = lambda line: print(line, file=sys.stderr)
+    log(f"{data['records']} records, {data['games']} games from {data['files']} file(s) "
+        f"({data['bytes'] / 1e6:.1f} MB) in {elapsed:.2f}s"
+        + (f", skipped {data['skipped_bytes']} corrupt bytes" if data['skipped_bytes'] else ""))
+    for level, row in data["levels"].items():
+        clear = row.get("clear_sec")
+        log(f"level {level}: {row['started']} played, {row['deaths']} deaths "
+            f"({row['deaths_per_attempt']:.2f}/attempt), cleared {row['clear_rate']:.0%}"
+            + (f", clear p50 {clear['p50']:.1f}s" if clear else ""))
+    if data["killers"]:
+        log("killers: " + ", ".join(f"{name} {k['kills']} ({k['share']:.0%})"
+                                    for name, k in data["killers"].items()))
+    print(json.dumps(data, indent=1))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,266 @@
+"""Turnamen headless Macan Hungry: banyak game paralel di beberapa proses.
+
+Setiap game mempertemukan satu policy tiger dengan satu lineup musuh
+(keempat musuh ber-personality sama, atau 'mixed' seperti game asli),
+mulai dari level tertentu, dengan seed tetap. Hasilnya diringkas per
+(policy, lineup, level awal): survival tick, kematian per level, rasio
+level yang berhasil dibersihkan dan distribusi skor.
+
+Contoh:
+    python macan_tournament.py --games 20 --levels 1-6
+    python macan_tournament.py --policies greedy --lineups chase ambush --jobs 8 --output t.json
+    python macan_tournament.py --policies autopilot greedy --autopilot-nodes 200
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from macan_engine import (GameEngine, EVT_LIFE_LOST, EVT_LEVEL_UP, enemy_cooldown,
+                          power_duration)
+from macan_autopilot import Autopilot
+from macan_perf import distribution
+
+PERSONALITIES = ['chase', 'ambush', 'patrol', 'random']
+LINEUPS = ['mixed'] + PERSONALITIES
+DANGER_DISTANCE = 3 # Policy greedy menjauh dari musuh sedekat ini (langkah BFS)
+AUTOPILOT_NODES = 100 # Segmen search per keputusan policy autopilot
+
+
+def random_policy(engine, rng):
+    """Ganti arah secara acak sesekali, seperti pemain yang asal tekan."""
+    return rng.randrange(4) if rng.random() < 0.1 else None
+
+
+def greedy_policy(engine, rng):
+    """Makanan terdekat lewat BFS, menghindari dan menjauhi musuh berbahaya."""
+    if engine.move_cooldown > 0:
+        return None
+    nav = engine.nav
+    tiger = nav.index(engine.tiger.x, engine.tiger.y)
+    dist = nav.distances(tiger)
+    danger = set()
+    threat = None
+    for enemy in engine.enemies:
+        if enemy.scared or enemy.returning:
+            continue
+        cell = nav.index(enemy.x, enemy.y)
+        danger.add(cell)
+        if 0 <= dist[cell] <= DANGER_DISTANCE and (threat is None or dist[cell] < dist[threat]):
+            threat = cell
+    if threat is not None:
+        step = nav.step_away(tiger, threat)
+        if step is not None:
+            return step[0]
+
+    # BFS ke pellet terdekat; arah pertama diwariskan ke sel yang dijangkau
+    pellets = engine.maze.food | engine.maze.power
+    first = {tiger: None}
+    frontier = [tiger]
+    for cell in frontier:
+        for d, j in nav.neighbors[cell]:
+            if j in first or j in danger:
+                continue
+            first[j] = d if cell == tiger else first[cell]
+            if pellets >> j & 1:
+                return first[j]
+            frontier.append(j)
+    return rng.randrange(4)
+
+
+POLICIES = {'random': random_policy, 'greedy': greedy_policy}
+# Autopilot dibuat per game (punya statistik search), bukan fungsi di POLICIES
+POLICY_NAMES = sorted(list(POLICIES) + ['autopilot'])
+
+
+def set_lineup(engine, lineup):
+    """Samakan personality semua musuh (berlaku sampai init_level berikutnya)."""
+    if lineup != 'mixed':
+        for enemy in engine.enemies:
+            enemy.personality = lineup
+
+
+def play_game(spec):
+    """Mainkan satu game dari spec (dict) sampai game over atau max_ticks."""
+    engine = GameEngine(spec["width"], spec["height"], seed=spec["seed"], swarm=spec["swarm"])
+    if spec["level"] > 1:
+        engine.level = spec["level"]
+        engine.init_level()
+    set_lineup(engine, spec["lineup"])
+    pilot = None
+    if spec["policy"] == 'autopilot':
+        # Batas node, bukan waktu, agar hasil sama di mesin mana pun
+        pilot = Autopilot(budget=None, max_nodes=spec["autopilot_nodes"])
+        policy = lambda engine, rng: pilot.choose(engine)
+    else:
+        policy = POLICIES[spec["policy"]]
+    rng = random.Random(f"tournament:{spec['seed']}")
+
+    deaths = {}
+    played = {engine.level}
+    cleared = 0
+    while not engine.game_over and engine.tick < spec["max_ticks"]:
+        for event in engine.step(policy(engine, rng)):
+            if event[0] == EVT_LIFE_LOST:
+                deaths[engine.level] = deaths.get(engine.level, 0) + 1
+            elif event[0] == EVT_LEVEL_UP:
+                cleared += 1
+                played.add(engine.level)
+    result = {
+        "policy": spec["policy"],
+        "lineup": spec["lineup"],
+        "start_level": spec["level"],
+        "seed": spec["seed"],
+        "ticks": engine.tick,
+        "game_over": engine.game_over,
+        "score": engine.score,
+        "final_level": engine.level,
+        "levels_played": sorted(played),
+        "levels_cleared": cleared,
+        "deaths": deaths,
+    }
+    if pilot is not None:
+        search = pilot.stats()
+        del search["last"]
+        result["search"] = search
+    return result
+
+
+def aggregate(results):
+    """Ringkasan per (policy, lineup, level awal)."""
+    groups = {}
+    for r in results:
+        groups.setdefault((r["policy"], r["lineup"], r["start_level"]), []).append(r)
+    summary = []
+    for (policy, lineup, level), games in sorted(groups.items()):
+        deaths = {}
+        played = {}
+        for g in games:
+            for lvl in g["levels_played"]:
+                played[lvl] = played.get(lvl, 0) + 1
+            for lvl, count in g["deaths"].items():
+                deaths[lvl] = deaths.get(lvl, 0) + count
+        levels_played = sum(len(g["levels_played"]) for g in games)
+        row = {
+            "policy": policy,
+            "lineup": lineup,
+            "start_level": level,
+            "games": len(games),
+            "game_over_rate": sum(g["game_over"] for g in games) / len(games),
+            "survival_ticks": distribution([g["ticks"] for g in games]),
+            "score": distribution([g["score"] for g in games]),
+            # Level yang dibersihkan / level yang dimainkan
+            "food_clear_rate": sum(g["levels_cleared"] for g in games) / levels_played,
+            "deaths_per_level": {lvl: deaths.get(lvl, 0) / played[lvl] for lvl in sorted(played)},
+        }
+        searches = [g["search"] for g in games if "search" in g]
+        if searches:
+            row["search"] = {
+                "nodes_per_sec": distribution([s["nodes_per_sec"] for s in searches]),
+                "mean_depth": sum(s["mean_depth"] for s in searches) / len(searches),
+                "max_depth": max(s["max_depth"] for s in searches),
+            }
+        summary.append(row)
+    return summary
+
+
+def scaling_table(levels):
+    """Nilai formula leveling (power_duration, enemy_cooldown) per level."""
+    return [{"level": level,
+             "power_ticks": power_duration(level),
+             "enemy_cooldown": enemy_cooldown(level, False),
+             "enemy_cooldown_power": enemy_cooldown(level, True)}
+            for level in levels]
+
+
+def parse_levels(text):
+    """'3' atau '1-10' menjadi list level."""
+    first, _, last = text.partition('-')
+    first = int(first)
+    last = int(last) if last else first
+    if first < 1 or last < first:
+        raise argparse.ArgumentTypeError(f"invalid level range: {text}")
+    return list(range(first, last + 1))
+
+
+def game_specs(args):
+    specs = []
+    for policy in args.policies:
+        for lineup in args.lineups:
+            for level in args.levels:
+                for i in range(args.games):
+                    # Seed sama untuk tiap kombinasi, sehingga hasil bisa dibandingkan berpasangan
+                    specs.append({"policy": policy, "lineup": lineup, "level": level,
+                                  "seed": args.seed + i, "max_ticks": args.max_ticks,
+                                  "width": args.width, "height": args.height, "swarm": args.swarm,
+                                  "autopilot_nodes": args.autopilot_nodes})
+    return specs
+
+
+def run_tournament(specs, jobs):
+    if jobs <= 1:
+        return [play_game(spec) for spec in specs]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(play_game, specs, chunksize=max(1, len(specs) // (jobs * 8))))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Turnamen AI Macan Hungry (headless, multi-proses)")
+    parser.add_argument('--games', type=int, default=10, help="game per kombinasi (default 10)")
+    parser.add_argument('--policies', nargs='+', choices=POLICY_NAMES, default=sorted(POLICIES))
+    parser.add_argument('--autopilot-nodes', type=int, default=AUTOPILOT_NODES,
+                        help=f"segmen search per keputusan policy autopilot (default {AUTOPILOT_NODES})")
+    parser.add_argument('--lineups', nargs='+', choices=LINEUPS, default=LINEUPS)
+    parser.add_argument('--levels', type=parse_levels, default=[1],
+                        help="level awal, mis. 1 atau 1-10 (default 1)")
+    parser.add_argument('--seed', type=int, default=0, help="seed game pertama")
+    parser.add_argument('--max-ticks', type=int, default=20000,
+                        help="batas tick per game (default 20000)")
+    parser.add_argument('--size', default='19x21', help="ukuran maze WxH")
+    parser.add_argument('--swarm', type=int, default=0, help="jumlah musuh mode swarm")
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help="jumlah proses (default semua core)")
+    parser.add_argument('--output', help="tulis hasil JSON ke file ini")
+    parser.add_argument('--raw', action='store_true', help="sertakan hasil per game di JSON")
+    args = parser.parse_args(argv)
+    args.width, args.height = (int(v) for v in args.size.lower().split('x'))
+
+    specs = game_specs(args)
+    start = time.perf_counter()
+    results = run_tournament(specs, args.jobs)
+    elapsed = time.perf_counter() - start
+
+    summary = aggregate(results)
+    log = lambda line: print(line, file=sys.stderr)
+    log(f"{len(results)} games, {sum(r['ticks'] for r in results)} ticks in {elapsed:.1f}s "
+        f"({args.jobs} jobs)")
+    log(f"{'policy':<10}{'lineup':<8}{'lvl':>4}{'ticks p50':>11}{'score p50':>11}"
+        f"{'clear':>7}{'over':>6}")
+    for row in summary:
+        log(f"{row['policy']:<10}{row['lineup']:<8}{row['start_level']:>4}"
+            f"{row['survival_ticks']['p50']:>11}{row['score']['p50']:>11}"
+            f"{row['food_clear_rate']:>7.2f}{row['game_over_rate']:>6.2f}")
+
+    data = {
+        "games": len(results),
+        "elapsed_sec": elapsed,
+        "jobs": args.jobs,
+        "scaling": scaling_table(range(1, max(args.levels) + 11)),
+        "summary": summary,
+    }
+    if args.raw:
+        data["results"] = results
+    text = json.dumps(data, indent=1)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text)
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
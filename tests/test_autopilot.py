@@ -0,0 +1,80 @@
+"""Autopilot: waktu keputusan dibatasi budget, juga di maze besar."""
+import gc
+import time
+
+from macan_autopilot import AUTOPILOT_BUDGET, Autopilot, drop_food_distances, fill_food_distances
+from macan_engine import GameEngine
+
+
+def full_field(nav, pellets):
+    dist = []
+    for _ in fill_food_distances(nav, pellets, dist):
+        pass
+    return dist
+
+
+def test_incremental_food_field_matches_full_bfs():
+    engine = GameEngine(41, 41, seed=4)
+    nav, maze = engine.nav, engine.maze
+    pellets = maze.food | maze.power
+    dist = full_field(nav, pellets)
+    cells = [i for i in range(41 * 41) if pellets >> i & 1]
+    for k in range(0, len(cells), 7):
+        eaten = cells[k:k + 3]
+        for cell in eaten:
+            pellets &= ~(1 << cell)
+        for _ in drop_food_distances(nav, dist, eaten):
+            pass
+        assert dist == full_field(nav, pellets), k
+
+
+def test_decision_time_within_budget_plus_one_tick():
+    engine = GameEngine(101, 101, seed=2)
+    pilot = Autopilot()
+    simulate = engine.simulate
+    slowest = [0.0]
+
+    def timed_simulate(action=None):
+        start = time.perf_counter()
+        events = simulate(action)
+        slowest[0] = max(slowest[0], time.perf_counter() - start)
+        return events
+    engine.simulate = timed_simulate
+
+    # Jeda garbage collector bukan kerja autopilot; dihitung terpisah
+    gc_pause = [0.0, 0.0]
+
+    def on_gc(phase, info):
+        if phase == 'start':
+            gc_pause[1] = time.perf_counter()
+        else:
+            gc_pause[0] += time.perf_counter() - gc_pause[1]
+    gc.callbacks.append(on_gc)
+    try:
+        decisions = run_decisions(engine, pilot, slowest, gc_pause)
+    finally:
+        gc.callbacks.remove(on_gc)
+    assert decisions > 100
+
+
+def run_decisions(engine, pilot, slowest, gc_pause):
+    decisions = 0
+    for _ in range(600):
+        if engine.game_over:
+            break
+        slowest[0] = gc_pause[0] = 0.0
+        searches = pilot.searches
+        cpu = time.process_time()
+        move = pilot.choose(engine)
+        cpu_ms = (time.process_time() - cpu) * 1000
+        if move is not None:
+            engine.next_move = move
+        if pilot.searches > searches:
+            decisions += 1
+            # Lewat deadline paling banyak satu simulate() (+ sedikit overhead).
+            # Waktu dinding bisa lebih panjang jika proses sedang tidak
+            # dijadwalkan OS (mesin sibuk), jadi waktu CPU juga diterima.
+            limit_ms = (AUTOPILOT_BUDGET + slowest[0] + gc_pause[0]) * 1000 + 2.0
+            assert min(pilot.last["elapsed_ms"], cpu_ms) <= limit_ms, (engine.tick, cpu_ms, pilot.last)
+        engine.step()
+    return decisions
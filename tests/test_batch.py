@@ -0,0 +1,18 @@
+"""BatchEngine: game di level yang sama berbagi maze dan slot jarak."""
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from macan_batch import BatchEngine
+
+
+def test_level_up_shares_maze_slot():
+    batch = BatchEngine(64, seed=1)
+    capacity = batch.nav_dist.shape[0]
+    batch.food_left[:32] = 0
+    batch.step()
+    assert (batch.level[:32] == 2).all() and (batch.level[32:] == 1).all()
+    assert len(set(batch.maze_slot[:32].tolist())) == 1
+    assert (batch.maze[:32] == batch.maze[0]).all()
+    assert batch.nav_dist.shape[0] == capacity
+    assert batch.slot_refs.sum() == 64
@@ -0,0 +1,47 @@
+"""Export replay: kamera mengikuti tiger di maze yang bergulir."""
+import os
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+EXPORT_CAMERA = """
+import random
+import sys
+from macan_engine import GameEngine
+from macan_replay import ReplayRecorder
+import macan_export
+import macan_hungry
+
+engine = GameEngine(101, 101, seed=5)
+recorder = ReplayRecorder(engine)
+rng = random.Random(5)
+for _ in range(120):
+    action = rng.randrange(4)
+    recorder.record(engine.tick + 1, action)
+    engine.next_move = action
+    engine.step()
+
+cameras = []
+update_camera = macan_hungry.GameWidget.update_camera
+def record_camera(widget):
+    changed = update_camera(widget)
+    cameras.append(widget.camera)
+    return changed
+macan_hungry.GameWidget.update_camera = record_camera
+
+spec = (recorder.to_dict(engine), 1, 120, sys.argv[1], 640, 360, 1, 80)
+assert macan_export.render_range(spec)[2] == 119
+assert len(set(cameras)) > 1, cameras[:3]
+"""
+
+
+def test_export_camera_follows_tiger(tmp_path):
+    env = dict(os.environ, QT_QPA_PLATFORM='offscreen', HOME=str(tmp_path),
+               LOCALAPPDATA=str(tmp_path), PYTHONPATH=ROOT)
+    subprocess.run([sys.executable, '-c', EXPORT_CAMERA, str(tmp_path)], cwd=ROOT, env=env,
+                   check=True, timeout=300)
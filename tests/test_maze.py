@@ -0,0 +1,25 @@
+"""Generator maze: selalu valid dan biayanya satu kali carve di ukuran besar."""
+import random
+import time
+
+from macan_maze import Maze, generate_random_maze, maze_problems, maze_stats
+
+
+def test_random_mazes_are_connected():
+    for seed in range(300):
+        maze = Maze.from_rows(generate_random_maze(random.Random(seed)))
+        assert maze_problems(maze) == [], seed
+        assert maze_stats(maze)["components"] == 1, seed
+
+
+def test_same_seed_same_maze():
+    assert generate_random_maze(random.Random(7), 41, 41) == generate_random_maze(random.Random(7), 41, 41)
+
+
+def test_large_maze_generation_time():
+    for seed in range(3):
+        start = time.perf_counter()
+        rows = generate_random_maze(random.Random(seed), 301, 301)
+        # Dulu 6-10 detik (rejection sampling); sekarang satu carve + perbaikan lokal
+        assert time.perf_counter() - start < 2.0, seed
+        assert maze_problems(Maze.from_rows(rows)) == [], seed
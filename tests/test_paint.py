@@ -0,0 +1,43 @@
+"""Repaint sebagian (event.rect()) harus sama persis dengan paint penuh di area itu."""
+import os
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PARTIAL_PAINT = """
+import sys
+from PySide6.QtWidgets import QApplication
+from PySide6.QtGui import QImage, QRegion
+from PySide6.QtCore import QPoint, QRect
+app = QApplication([])
+import macan_hungry
+size = tuple(int(v) for v in sys.argv[1].split('x'))
+widget = macan_hungry.GameWidget(maze_size=size, persist=False)
+widget.resize(1280, 900)
+widget.start_game()
+for _ in range(40):
+    widget.engine.next_move = 0
+    widget.update_game()
+    widget.update_animation()
+full = QImage(widget.size(), QImage.Format_ARGB32_Premultiplied)
+widget.render(full)
+for rect in [QRect(100, 100, 200, 150), QRect(0, 0, 64, 64),
+             QRect(500, 300, 333, 97), QRect(700, 450, 300, 300)]:
+    part = QImage(rect.size(), QImage.Format_ARGB32_Premultiplied)
+    part.fill(0)
+    widget.render(part, QPoint(0, 0), QRegion(rect))
+    assert part == full.copy(rect), rect
+"""
+
+
+@pytest.mark.parametrize("size", ["19x21", "101x101"])
+def test_partial_repaint_matches_full_paint(tmp_path, size):
+    env = dict(os.environ, QT_QPA_PLATFORM='offscreen', HOME=str(tmp_path),
+               LOCALAPPDATA=str(tmp_path), PYTHONPATH=ROOT)
+    subprocess.run([sys.executable, '-c', PARTIAL_PAINT, size], cwd=ROOT, env=env,
+                   check=True, timeout=300)
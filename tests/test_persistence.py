@@ -0,0 +1,58 @@
+"""Widget benchmark/headless tidak boleh menulis apa pun ke SAVE_DIR."""
+import os
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEADLESS_GAMES = """
+import random
+from PySide6.QtWidgets import QApplication
+app = QApplication([])
+import macan_hungry
+widget = macan_hungry.GameWidget(persist=False)
+rng = random.Random(1)
+game_overs = 0
+for _ in range(30000):
+    if not widget.game_active:
+        if widget.engine.game_over:
+            game_overs += 1
+            if game_overs == 2:
+                break
+        widget.reset_full_game()
+        widget.start_game()
+    widget.game_paused = False
+    widget.engine.next_move = rng.randrange(4)
+    widget.update_game()
+    widget.update_animation()
+widget.flush_telemetry()
+if widget.io is not None:
+    widget.io.shutdown(wait=True)
+assert game_overs == 2, game_overs
+"""
+
+
+def run(args, home):
+    env = dict(os.environ, QT_QPA_PLATFORM='offscreen', HOME=str(home),
+               LOCALAPPDATA=str(home), PYTHONPATH=ROOT)
+    subprocess.run([sys.executable] + args, cwd=ROOT, env=env, check=True,
+                   stdout=subprocess.DEVNULL, timeout=300)
+
+
+def save_files(home):
+    folder = home / "MacanHungry"
+    return sorted(os.listdir(folder)) if folder.exists() else []
+
+
+def test_headless_widget_leaves_save_dir_untouched(tmp_path):
+    run(['-c', HEADLESS_GAMES], tmp_path)
+    assert save_files(tmp_path) == []
+
+
+def test_bench_update_game_leaves_save_dir_untouched(tmp_path):
+    run(['macan_bench.py', 'update_game', '--scale', '0.3', '--repeat', '1'], tmp_path)
+    assert save_files(tmp_path) == []
@@ -0,0 +1,66 @@
+"""Save biner: mode swarm tersimpan eksplisit, versi lama tetap terbaca."""
+import zlib
+
+from macan_engine import ENEMY_SPECS, GameEngine
+from macan_save import CRC, HEADER, HEADERS, encode_game, read_save, restore_game, decode_game
+
+
+def reload(engine, data):
+    loaded = GameEngine()
+    restore_game(loaded, decode_game(data))
+    return loaded
+
+
+def test_swarm_with_classic_enemy_count_round_trips():
+    engine = GameEngine(seed=3, swarm=len(ENEMY_SPECS))
+    loaded = reload(engine, encode_game(engine))
+    assert loaded.swarm == len(ENEMY_SPECS)
+    assert len(loaded.enemies) == len(ENEMY_SPECS)
+
+
+def test_classic_game_loaded_into_swarm_engine():
+    data = encode_game(GameEngine(seed=3))
+    loaded = GameEngine(swarm=50)
+    restore_game(loaded, decode_game(data))
+    assert loaded.swarm == 0 and len(loaded.enemies) == len(ENEMY_SPECS)
+
+
+def test_version_2_infers_mode_from_enemy_count():
+    engine = GameEngine(seed=3, swarm=7)
+    data = encode_game(engine)[:-CRC.size]
+    fields = list(HEADER.unpack_from(data))
+    fields[1] = 2
+    body = HEADERS[2].pack(*fields[:-2]) + data[HEADER.size:]
+    loaded = reload(engine, body + CRC.pack(zlib.crc32(body)))
+    assert loaded.swarm == 7
+
+
+def test_tick_round_trips():
+    engine = GameEngine(seed=3)
+    for _ in range(40):
+        engine.step()
+    loaded = reload(engine, encode_game(engine))
+    assert loaded.tick == engine.tick == 40
+
+
+def test_version_3_restarts_tick():
+    engine = GameEngine(seed=3)
+    for _ in range(40):
+        engine.step()
+    data = encode_game(engine)[:-CRC.size]
+    fields = list(HEADER.unpack_from(data))
+    fields[1] = 3
+    body = HEADERS[3].pack(*fields[:-1]) + data[HEADER.size:]
+    loaded = reload(engine, body + CRC.pack(zlib.crc32(body)))
+    assert loaded.tick == 0 and loaded.score == engine.score
+
+
+def test_read_save_builds_nav_table(tmp_path):
+    engine = GameEngine(41, 41, seed=3)
+    path = tmp_path / "game.mhs"
+    path.write_bytes(encode_game(engine))
+    state = read_save(str(path))
+    assert state["nav"].width == 41
+    loaded = GameEngine()
+    restore_game(loaded, state)
+    assert loaded.nav is state["nav"]